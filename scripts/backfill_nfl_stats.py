@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Backfill NFL Stats Script
+
+This script loads weekly NFL stats for a range of past seasons into the database.
+Seasons are downloaded and prepared in parallel worker processes and upserted
+one season at a time, with a checkpoint so an interrupted backfill can resume.
+
+With --postgres-dsn each season is bulk loaded straight into Postgres with
+COPY instead of going through the Supabase REST API; --drop-indexes drops
+the secondary indexes once before the first season and recreates them once
+after the last.
+"""
+
+import json
+import logging
+import argparse
+from contextlib import nullcontext
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from update_nfl_stats import (
+    CONFLICT_KEY,
+    DEFAULT_DEAD_LETTER_FILE,
+    get_current_season,
+    get_supabase_client,
+    download_weekly_data,
+    download_schedule_data,
+    prepare_frame,
+    iter_records,
+)
+from record_sinks import run_pipeline, postgres_sink, secondary_indexes_dropped
+from nfl_cache import settings as cache_settings, configure as configure_cache
+from nfl_cache import add_cache_arguments, configure_from_args
+from upsert_engine import upsert_records, iter_batches
+from instrumentation import count, add_instrumentation_arguments, start_run, finish_run
+
+logger = logging.getLogger(__name__)
+
+# Seasons that have been fully upserted, so a rerun can skip them
+DEFAULT_CHECKPOINT_FILE = Path(__file__).parent / ".nfl_backfill_checkpoint.json"
+
+def load_checkpoint(checkpoint_file):
+    """Load the set of seasons already backfilled."""
+    if not checkpoint_file.exists():
+        return set()
+
+    with open(checkpoint_file) as f:
+        return set(json.load(f)['completed_seasons'])
+
+def save_checkpoint(completed_seasons, checkpoint_file):
+    """Record the seasons already backfilled, replacing the previous checkpoint atomically."""
+    temp_file = checkpoint_file.with_suffix('.tmp')
+    with open(temp_file, 'w') as f:
+        json.dump({'completed_seasons': sorted(completed_seasons)}, f)
+    temp_file.replace(checkpoint_file)
+
+def prepare_season(season):
+    """Download and prepare one season of weekly data. Runs in a worker process."""
+    weekly_data = download_weekly_data(season)
+    if weekly_data is None:
+        return season, None
+
+    schedule_data = download_schedule_data(season)
+    try:
+        # The typed frame is much smaller to send back than a list of record dicts
+        return season, prepare_frame(weekly_data, season, schedule_data)
+    except Exception as e:
+        logger.error(f"Error preparing data for {season}: {e}")
+        return season, None
+
+def copy_season(postgres_dsn, prepared_data, batch_size=500):
+    """Bulk load one prepared season into the nfl table and return an upsert_records-style summary."""
+    try:
+        batches = iter_batches(iter_records(prepared_data), batch_size)
+        summaries = run_pipeline(batches, {
+            'postgres': postgres_sink(postgres_dsn, 'nfl', CONFLICT_KEY.split(','))
+        })
+        return {'rows_upserted': summaries['postgres']['rows_merged'], 'failed_batches': 0}
+    except Exception as e:
+        logger.error(f"Error copying records into Postgres: {e}")
+        return {'rows_upserted': 0, 'failed_batches': 1}
+
+def backfill(seasons, processes=2, checkpoint_file=DEFAULT_CHECKPOINT_FILE, postgres_dsn=None, drop_indexes=False,
+             **upsert_options):
+    """Download seasons in parallel and upsert each one as soon as it is prepared.
+
+    Extra keyword arguments (batch_size, workers, max_retries, dead_letter_file)
+    are passed through to upsert_records. With postgres_dsn, seasons are bulk
+    loaded with COPY instead, and drop_indexes keeps the secondary indexes
+    dropped from before the first season until after the last.
+    """
+    completed_seasons = load_checkpoint(checkpoint_file)
+    pending = [season for season in seasons if season not in completed_seasons]
+    if len(pending) < len(seasons):
+        logger.info(f"Resuming backfill: skipping completed seasons {sorted(set(seasons) - set(pending))}")
+    if not pending:
+        logger.info("Nothing to backfill")
+        return
+
+    supabase = get_supabase_client() if postgres_dsn is None else None
+    failed_seasons = []
+
+    # Worker processes may not inherit module state, so pass the cache settings along
+    cache_args = (cache_settings['cache_dir'], None, None, cache_settings['offline'], cache_settings['enabled'])
+    indexes_dropped = (
+        secondary_indexes_dropped(postgres_dsn, 'nfl') if postgres_dsn is not None and drop_indexes else nullcontext()
+    )
+    with indexes_dropped, ProcessPoolExecutor(max_workers=processes, initializer=configure_cache,
+                                              initargs=cache_args) as executor:
+        # Only keep `processes` seasons in flight so at most that many prepared seasons wait in memory
+        remaining = iter(pending)
+        in_flight = set()
+        for season in remaining:
+            in_flight.add(executor.submit(prepare_season, season))
+            if len(in_flight) >= processes:
+                break
+
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                season, prepared_data = future.result()
+
+                next_season = next(remaining, None)
+                if next_season is not None:
+                    in_flight.add(executor.submit(prepare_season, next_season))
+
+                if prepared_data is None or prepared_data.empty:
+                    logger.error(f"No records prepared for {season}, will retry on the next run")
+                    failed_seasons.append(season)
+                    continue
+
+                logger.info(f"Upserting {len(prepared_data)} records for {season}...")
+                if postgres_dsn is not None:
+                    summary = copy_season(postgres_dsn, prepared_data, upsert_options.get('batch_size', 500))
+                else:
+                    summary = upsert_records(supabase, 'nfl', iter_records(prepared_data), on_conflict=CONFLICT_KEY,
+                                             **upsert_options)
+                del prepared_data
+
+                if summary['failed_batches']:
+                    logger.error(f"{summary['failed_batches']} batches failed for {season}, will retry on the next run")
+                    failed_seasons.append(season)
+                    continue
+
+                completed_seasons.add(season)
+                save_checkpoint(completed_seasons, checkpoint_file)
+                logger.info(f"Backfilled {season} ({len(completed_seasons & set(seasons))}/{len(seasons)} seasons)")
+
+    count('failed_seasons', len(failed_seasons))
+    if failed_seasons:
+        logger.error(f"Backfill finished with failed seasons: {sorted(failed_seasons)}")
+    else:
+        logger.info("Backfill completed successfully!")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Backfill weekly NFL stats for a range of seasons.")
+    parser.add_argument('--start', type=int, required=True, help="First season to load")
+    parser.add_argument('--end', type=int, default=get_current_season(),
+                        help="Last season to load (default: current season)")
+    parser.add_argument('--processes', type=int, default=2,
+                        help="Seasons downloaded and prepared in parallel (default: 2)")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Number of concurrent upsert workers (default: 4)")
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help="Records per upsert batch (default: 500)")
+    parser.add_argument('--dead-letter-file', type=Path, default=DEFAULT_DEAD_LETTER_FILE,
+                        help=f"File that receives batches which still fail (default: {DEFAULT_DEAD_LETTER_FILE.name})")
+    parser.add_argument('--checkpoint-file', type=Path, default=DEFAULT_CHECKPOINT_FILE,
+                        help=f"Backfill checkpoint file (default: {DEFAULT_CHECKPOINT_FILE.name})")
+    parser.add_argument('--restart', action='store_true',
+                        help="Ignore the checkpoint and load every season again")
+    parser.add_argument('--postgres-dsn',
+                        help="Bulk load into this Postgres database with COPY instead of the Supabase REST API")
+    parser.add_argument('--drop-indexes', action='store_true',
+                        help="With --postgres-dsn, drop the secondary indexes before the first season and "
+                             "recreate them after the last")
+    add_cache_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    """Main function to backfill weekly stats."""
+    args = parse_args()
+    configure_from_args(args)
+    # Downloads and preparation run in worker processes, so their stages are not in the report
+    start_run('backfill_nfl_stats', args)
+    seasons = list(range(args.start, args.end + 1))
+    logger.info(f"Starting backfill for seasons {args.start}-{args.end}...")
+
+    if args.restart and args.checkpoint_file.exists():
+        args.checkpoint_file.unlink()
+
+    backfill(
+        seasons,
+        processes=args.processes,
+        checkpoint_file=args.checkpoint_file,
+        postgres_dsn=args.postgres_dsn,
+        drop_indexes=args.drop_indexes,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        dead_letter_file=args.dead_letter_file
+    )
+    finish_run()
+
+if __name__ == "__main__":
+    main()
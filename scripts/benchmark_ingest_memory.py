@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Weekly Stats Ingestion Memory Benchmark
+
+Measures the peak RSS of preparing a multi-season weekly stats load for
+upsert, the way update_nfl_stats.py did before the typed ingestion schema
+(every column, float64/object dtypes, one list of record dicts) against the
+current path (INGEST_SCHEMA columns and dtypes, records built lazily in
+batches).
+
+Each path runs in a fresh process so their peaks do not mix. Both download
+directly from nfl_data_py, bypassing the download cache.
+"""
+
+import sys
+import logging
+import argparse
+import resource
+import multiprocessing
+
+import pandas as pd
+import nfl_data_py as nfl
+
+from update_nfl_stats import (
+    COLUMNS_MAPPING,
+    INGEST_SCHEMA,
+    INTEGER_COLUMNS,
+    apply_ingest_schema,
+    get_current_season,
+    iter_records,
+    prepare_frame,
+)
+from upsert_engine import iter_batches
+
+logger = logging.getLogger(__name__)
+
+def peak_rss_mb():
+    """Return this process's peak resident set size in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def legacy_prepare(data):
+    """Prepare records the way prepare_data did before the ingestion schema."""
+    available_columns = [col for col in COLUMNS_MAPPING.keys() if col in data.columns]
+    prepared_data = data[available_columns].copy()
+    prepared_data = prepared_data.rename(columns=COLUMNS_MAPPING)
+    for col in prepared_data.columns:
+        if col in INTEGER_COLUMNS:
+            prepared_data[col] = pd.to_numeric(prepared_data[col], errors='coerce').fillna(0).astype(int)
+        else:
+            prepared_data[col] = prepared_data[col].fillna(0)
+    return prepared_data.to_dict('records')
+
+def run_legacy(seasons, batch_size):
+    """Load every column for all seasons and build one list of records."""
+    data = nfl.import_weekly_data(seasons)
+    records = legacy_prepare(data)
+    batches = sum(1 for _ in iter_batches(records, batch_size))
+    return {'rows': len(records), 'batches': batches, 'frame_mb': data.memory_usage(deep=True).sum() / 1e6,
+            'peak_rss_mb': peak_rss_mb()}
+
+def run_typed(seasons, batch_size):
+    """Load the schema columns for all seasons and build records one batch at a time."""
+    data = pd.concat([
+        apply_ingest_schema(nfl.import_weekly_data([season], columns=list(INGEST_SCHEMA), downcast=True,
+                                                   thread_requests=True))
+        for season in seasons
+    ], ignore_index=True)
+    # concat only keeps a categorical dtype when every season has the same categories
+    for col, dtype in INGEST_SCHEMA.items():
+        if dtype == 'category' and col in data.columns:
+            data[col] = data[col].astype('category')
+    prepared_data = prepare_frame(data, seasons[-1])
+    batches = sum(1 for _ in iter_batches(iter_records(prepared_data), batch_size))
+    return {'rows': len(prepared_data), 'batches': batches, 'frame_mb': data.memory_usage(deep=True).sum() / 1e6,
+            'peak_rss_mb': peak_rss_mb()}
+
+def run_in_child(func, seasons, batch_size):
+    """Run one path in a fresh process and return its result."""
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(func, (seasons, batch_size))
+
+def main():
+    """Run both ingestion paths and print their peak RSS."""
+    parser = argparse.ArgumentParser(description="Compare the peak RSS of weekly stats ingestion paths.")
+    parser.add_argument('--start', type=int, default=get_current_season() - 5, help="First season to load")
+    parser.add_argument('--end', type=int, default=get_current_season() - 1, help="Last season to load")
+    parser.add_argument('--batch-size', type=int, default=500, help="Records per batch")
+    args = parser.parse_args()
+    seasons = list(range(args.start, args.end + 1))
+
+    print(f"Seasons {args.start}-{args.end}")
+    print(f"{'path':<8}{'rows':>10}{'batches':>10}{'frame MB':>12}{'peak RSS MB':>14}")
+    for name, func in (('legacy', run_legacy), ('typed', run_typed)):
+        r = run_in_child(func, seasons, args.batch_size)
+        print(f"{name:<8}{r['rows']:>10}{r['batches']:>10}{r['frame_mb']:>12.1f}{r['peak_rss_mb']:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Data Pipeline Benchmark
+
+Times the main pipeline steps on synthetic data at several scales, with no
+network access and a stub in place of the Supabase client:
+
+- prepare_data: weekly stats -> nfl table records, including the game-result join
+- convert_nan_to_null: the legacy record cleanup used before js_export
+- save: the full static data export into a temporary directory
+- filter_active_offensive_players: cold (no snap totals yet) and warm (totals up to date)
+- update_database: the streaming pipeline and upsert batching into the stub client
+
+Synthetic weekly stats, schedule, roster and snap-count frames are generated
+from a fixed seed and served through the download cache in offline mode, so
+every run measures the same inputs. Results are written as JSON; pass
+--compare with a previous results file to see the change per step.
+
+    python benchmark_pipeline.py --scales 1 5 20 --output baseline.json
+    python benchmark_pipeline.py --scales 1 5 20 --compare baseline.json
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import nfl_cache
+from update_nfl_stats import INGEST_SCHEMA, download_weekly_data, download_schedule_data, prepare_data, update_database
+from update_nfl_data import EXPORT_COLUMNS, convert_nan_to_null, filter_active_offensive_players, save
+
+logger = logging.getLogger(__name__)
+
+TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+    'LA', 'LAC', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
+]
+
+# Roster spots per team by position; the offensive ones get snaps and weekly stats
+ROSTER_SPOTS = {'QB': 3, 'RB': 4, 'WR': 6, 'TE': 3, 'OL': 9, 'DL': 9, 'LB': 7, 'DB': 10, 'K': 1, 'P': 1}
+OFFENSIVE_POSITIONS = ['QB', 'RB', 'WR', 'TE']
+
+WEEKS = 18
+
+# Extra float columns so the synthetic weekly frame is as wide as nfl_data_py's
+EXTRA_WEEKLY_COLUMNS = [
+    'sack_yards', 'sack_fumbles', 'sack_fumbles_lost', 'passing_air_yards', 'passing_yards_after_catch',
+    'passing_first_downs', 'passing_epa', 'passing_2pt_conversions', 'pacr', 'dakota', 'rushing_fumbles',
+    'rushing_fumbles_lost', 'rushing_first_downs', 'rushing_epa', 'rushing_2pt_conversions', 'receiving_fumbles',
+    'receiving_fumbles_lost', 'receiving_air_yards', 'receiving_yards_after_catch', 'receiving_first_downs',
+    'receiving_epa', 'receiving_2pt_conversions', 'racr', 'target_share', 'air_yards_share', 'wopr',
+    'special_teams_tds'
+]
+
+# Stub for the Supabase client: accepts upserts and echoes the rows back
+class StubClient:
+    def __init__(self):
+        self.rows = 0
+
+    def table(self, table_name):
+        return self
+
+    def upsert(self, records, on_conflict=None):
+        self.records = records
+        return self
+
+    def execute(self):
+        self.rows += len(self.records)
+        return argparse.Namespace(data=self.records)
+
+def synthetic_teams():
+    """Build a teams frame shaped like nfl.import_team_desc()."""
+    return pd.DataFrame({
+        col: TEAMS if col == 'team_abbr' else [f"{col} {team}" for team in TEAMS]
+        for col in EXPORT_COLUMNS['teams']
+    })
+
+def synthetic_schedule(season, rng):
+    """Build a season schedule where every team plays one game per week."""
+    games = []
+    for week in range(1, WEEKS + 1):
+        teams = rng.permutation(TEAMS)
+        for away_team, home_team in zip(teams[::2], teams[1::2]):
+            games.append({'week': week, 'away_team': away_team, 'home_team': home_team})
+
+    schedule = pd.DataFrame(games)
+    schedule['season'] = season
+    schedule['game_id'] = (
+        f"{season}_" + schedule['week'].map('{:02d}'.format) + '_' + schedule['away_team'] + '_' + schedule['home_team']
+    )
+    schedule['game_type'] = 'REG'
+    schedule['gameday'] = (pd.Timestamp(f"{season}-09-07") + pd.to_timedelta((schedule['week'] - 1) * 7, unit='D')).dt.strftime('%Y-%m-%d')
+    schedule['away_score'] = rng.poisson(22, len(schedule)).astype(float)
+    schedule['home_score'] = rng.poisson(23, len(schedule)).astype(float)
+    schedule['result'] = schedule['home_score'] - schedule['away_score']
+    schedule['total'] = schedule['home_score'] + schedule['away_score']
+    for col in EXPORT_COLUMNS['schedule']:
+        if col not in schedule.columns:
+            schedule[col] = rng.normal(0, 100, len(schedule)).round(1)
+    return schedule
+
+def synthetic_rosters(season, rng):
+    """Build a seasonal roster with a few players sharing a name across teams."""
+    rows = []
+    for team in TEAMS:
+        for position, spots in ROSTER_SPOTS.items():
+            for spot in range(spots):
+                rows.append({'team': team, 'position': position, 'depth': spot})
+
+    rosters = pd.DataFrame(rows)
+    rosters['season'] = season
+    rosters['player_id'] = [f"00-{season % 100:02d}{i:05d}" for i in range(len(rosters))]
+    rosters['pfr_id'] = [f"Play{i:04d}00" for i in range(len(rosters))]
+    # Every 40th player reuses another player's name
+    names = np.array([f"Player {i}" for i in range(len(rosters))])
+    names[::40] = names[1::40][:len(names[::40])]
+    rosters['player_name'] = names
+    rosters['first_name'] = 'Player'
+    rosters['last_name'] = rosters.index.astype(str)
+    rosters['jersey_number'] = rng.integers(1, 99, len(rosters)).astype(float)
+    rosters['status'] = 'ACT'
+    rosters['height'] = rng.integers(68, 80, len(rosters)).astype(float)
+    rosters['weight'] = rng.integers(180, 330, len(rosters)).astype(float)
+    rosters['years_exp'] = rng.integers(0, 15, len(rosters))
+    rosters['age'] = rng.normal(26, 3, len(rosters)).round(1)
+    rosters['headshot_url'] = 'https://static.www.nfl.com/image/private/' + rosters['player_id']
+    rosters['birth_date'] = pd.Timestamp('1995-01-01') + pd.to_timedelta(rng.integers(0, 5000, len(rosters)), unit='D')
+    # Some missing values for the NaN -> null conversion
+    rosters.loc[rosters.index[::17], 'jersey_number'] = np.nan
+    return rosters
+
+def offensive_games(rosters, schedule):
+    """Return one row per (game, offensive player on either team) with the opponent attached."""
+    players = rosters[rosters['position'].isin(OFFENSIVE_POSITIONS)]
+    sides = pd.concat([
+        schedule[['game_id', 'week', 'away_team', 'home_team']].rename(columns={'away_team': 'team', 'home_team': 'opponent'}),
+        schedule[['game_id', 'week', 'home_team', 'away_team']].rename(columns={'home_team': 'team', 'away_team': 'opponent'})
+    ])
+    return sides.merge(players, on='team')
+
+def synthetic_snaps(season, rng, rosters, schedule):
+    """Build snap counts shaped like nfl.import_snap_counts(); backups often get few snaps."""
+    games = offensive_games(rosters, schedule)
+    starter = games['depth'] == 0
+    snaps = np.where(starter, rng.integers(40, 70, len(games)), rng.integers(0, 12, len(games)))
+    return pd.DataFrame({
+        'game_id': games['game_id'],
+        'season': season,
+        'week': games['week'],
+        'player': games['player_name'],
+        'pfr_player_id': games['pfr_id'],
+        'position': games['position'],
+        'team': games['team'],
+        'opponent': games['opponent'],
+        'offense_snaps': snaps.astype(float),
+        'offense_pct': (snaps / 70).round(2)
+    })
+
+def synthetic_weekly(season, rng, rosters, schedule):
+    """Build weekly player stats shaped like nfl.import_weekly_data()."""
+    games = offensive_games(rosters, schedule)
+    # Players without a catch or carry have no weekly row
+    games = games[rng.random(len(games)) < 0.75].reset_index(drop=True)
+    weekly = pd.DataFrame({
+        'player_id': games['player_id'],
+        'player_name': games['player_name'],
+        'player_display_name': games['player_name'],
+        'position': games['position'],
+        'position_group': games['position'],
+        'recent_team': games['team'],
+        'week': games['week'],
+        'season': season,
+        'season_type': 'REG',
+        'opponent_team': games['opponent']
+    })
+    for col, dtype in INGEST_SCHEMA.items():
+        if col not in weekly.columns:
+            weekly[col] = rng.poisson(20 if 'yards' in col else 2, len(weekly)).astype('float32')
+    for col in EXTRA_WEEKLY_COLUMNS:
+        weekly[col] = rng.normal(0, 1, len(weekly)).astype('float32')
+    return weekly
+
+def build_dataset(seasons, cache_dir, seed=0):
+    """Generate the synthetic frames for each season and store them in an offline download cache."""
+    nfl_cache.configure(cache_dir=cache_dir, offline=True, enabled=True)
+    rng = np.random.default_rng(seed)
+    dataset = {'teams': synthetic_teams(), 'seasons': {}}
+    for season in seasons:
+        schedule = synthetic_schedule(season, rng)
+        rosters = synthetic_rosters(season, rng)
+        frames = {
+            'schedules': schedule,
+            'rosters': rosters,
+            'snap_counts': synthetic_snaps(season, rng, rosters, schedule),
+            'weekly': synthetic_weekly(season, rng, rosters, schedule)
+        }
+        for name, frame in frames.items():
+            nfl_cache.write_entry(nfl_cache.cache_key(name, season), frame, immutable=True)
+        dataset['seasons'][season] = frames
+    return dataset
+
+def best_time(func, repeat, setup=None):
+    """Return the fastest of `repeat` runs of func in seconds; setup() runs untimed before each."""
+    timings = []
+    for run in range(repeat):
+        if setup is not None:
+            setup(run)
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def run_scale(n_seasons, repeat, work_dir):
+    """Run every benchmark on n_seasons of synthetic data and return {step: {'seconds', 'rows'}}."""
+    seasons = list(range(2024 - n_seasons + 1, 2025))
+    dataset = build_dataset(seasons, work_dir / 'cache')
+    frames = dataset['seasons']
+    weekly = {season: download_weekly_data(season) for season in seasons}
+    schedules = {season: download_schedule_data(season) for season in seasons}
+    totals_file = work_dir / 'snap_totals.json'
+
+    def clear_totals(run):
+        totals_file.unlink(missing_ok=True)
+
+    def filter_all():
+        for season in seasons:
+            filter_active_offensive_players(frames[season]['rosters'], season, totals_file=totals_file)
+
+    def save_all():
+        for season in seasons:
+            save(dataset['teams'], frames[season]['rosters'], frames[season]['schedules'], season,
+                 lib_data_dir=work_dir / 'data', totals_file=totals_file)
+
+    def update_all():
+        client = StubClient()
+        for season in seasons:
+            update_database(season, client=client, batch_size=500, workers=4)
+
+    weekly_rows = sum(len(frame) for frame in weekly.values())
+    records = {
+        season: frames[season]['rosters'].to_dict('records') + frames[season]['schedules'].to_dict('records')
+        for season in seasons
+    }
+    results = {
+        'prepare_data': {
+            'seconds': best_time(lambda: [prepare_data(weekly[s], s, schedules[s]) for s in seasons], repeat),
+            'rows': weekly_rows
+        },
+        'convert_nan_to_null': {
+            'seconds': best_time(lambda: [convert_nan_to_null(records[s]) for s in seasons], repeat),
+            'rows': sum(len(r) for r in records.values())
+        },
+        'save': {
+            'seconds': best_time(save_all, repeat, setup=clear_totals),
+            'rows': sum(len(frames[s]['rosters']) + len(frames[s]['schedules']) for s in seasons)
+        },
+        'filter_active_cold': {
+            'seconds': best_time(filter_all, repeat, setup=clear_totals),
+            'rows': sum(len(frames[s]['snap_counts']) for s in seasons)
+        },
+        'filter_active_warm': {
+            'seconds': best_time(filter_all, repeat),
+            'rows': sum(len(frames[s]['snap_counts']) for s in seasons)
+        },
+        'update_database': {
+            'seconds': best_time(update_all, repeat),
+            'rows': weekly_rows
+        }
+    }
+    for result in results.values():
+        result['seconds'] = round(result['seconds'], 4)
+    return results
+
+def compare(results, baseline, tolerance):
+    """Print each step's change against a baseline results file and return the regressed steps."""
+    regressions = []
+    print(f"{'scale':<7}{'step':<22}{'baseline':>10}{'current':>10}{'change':>9}")
+    for scale, steps in results['results'].items():
+        for step, result in steps.items():
+            before = baseline['results'].get(scale, {}).get(step)
+            if before is None:
+                print(f"{scale:<7}{step:<22}{'-':>10}{result['seconds']:>9.3f}s{'new':>9}")
+                continue
+            change = result['seconds'] / before['seconds'] - 1 if before['seconds'] else 0.0
+            flag = ''
+            if change > tolerance:
+                flag = '  REGRESSION'
+                regressions.append((scale, step))
+            print(f"{scale:<7}{step:<22}{before['seconds']:>9.3f}s{result['seconds']:>9.3f}s{change:>+9.0%}{flag}")
+    return regressions
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the data pipeline on synthetic data.")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 5, 20],
+                        help="Numbers of seasons to generate (default: 1 5 20)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Runs per measurement; the fastest is reported (default: 3)")
+    parser.add_argument('--output', type=Path,
+                        help="Write the results as JSON to this file")
+    parser.add_argument('--compare', type=Path,
+                        help="Compare against a previous results file")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="Slowdown that counts as a regression with --compare (default: 0.10)")
+    return parser.parse_args()
+
+def main():
+    """Run the benchmarks, then write and/or compare the results."""
+    args = parse_args()
+    # Keep the pipeline's own log lines out of the timings and the output
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'repeat': args.repeat,
+        'results': {}
+    }
+    for n_seasons in args.scales:
+        with tempfile.TemporaryDirectory() as work_dir:
+            results['results'][str(n_seasons)] = run_scale(n_seasons, args.repeat, Path(work_dir))
+        for step, result in results['results'][str(n_seasons)].items():
+            print(f"{n_seasons:>3} seasons  {step:<22}{result['seconds']:>9.3f}s  {result['rows']:>9} rows")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Static Data Serializer Benchmark
+
+Times the legacy `to_dict` + `convert_nan_to_null` + `json.dumps(indent=2)`
+export path against js_export on the real roster and schedule frames, and
+checks that the indented output is byte-for-byte identical.
+
+Frames come from the nfl_data_py download cache, so `--offline` works after
+one normal run of update_nfl_data.py.
+"""
+
+import json
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from update_nfl_data import (
+    convert_nan_to_null,
+    download_rosters_data,
+    download_schedule_data,
+    filter_active_offensive_players,
+    get_current_season,
+)
+from js_export import write_js_export
+from nfl_cache import add_cache_arguments, configure_from_args
+
+logger = logging.getLogger(__name__)
+
+def legacy_export(path, name, frame):
+    """Write a frame the way save() did before js_export."""
+    records = convert_nan_to_null(frame.to_dict('records'))
+    with open(path, 'w') as f:
+        f.write(f"export const {name} = {json.dumps(records, indent=2)};")
+
+def best_time(func, repeat):
+    """Return the fastest of `repeat` runs of func in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def benchmark_frame(name, frame, repeat):
+    """Benchmark the export paths for one frame and return the results."""
+    output_dir = Path(tempfile.mkdtemp())
+    legacy_file = output_dir / f"{name}.legacy.js"
+    indented_file = output_dir / f"{name}.js"
+    compact_file = output_dir / f"{name}.compact.js"
+
+    results = {
+        'rows': len(frame),
+        'legacy_seconds': best_time(lambda: legacy_export(legacy_file, name, frame), repeat),
+        'columnar_seconds': best_time(lambda: write_js_export(indented_file, name, frame), repeat),
+        'compact_seconds': best_time(lambda: write_js_export(compact_file, name, frame, compact=True), repeat),
+        'indented_bytes': indented_file.stat().st_size,
+        'compact_bytes': compact_file.stat().st_size,
+        'identical_output': legacy_file.read_bytes() == indented_file.read_bytes()
+    }
+    return results
+
+def main():
+    """Run the serializer benchmark on the current season's rosters and schedule."""
+    parser = argparse.ArgumentParser(description="Benchmark the static data serializer.")
+    parser.add_argument('--season', type=int, default=get_current_season(), help="Season to benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement; the fastest is reported")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+
+    rosters_data = download_rosters_data(args.season)
+    schedule_data = download_schedule_data(args.season)
+    frames = {
+        'rosters': filter_active_offensive_players(rosters_data, args.season),
+        'schedule': schedule_data
+    }
+
+    # Keep the js_export log lines out of the results
+    logging.getLogger('js_export').setLevel(logging.WARNING)
+
+    print(f"{'dataset':<10}{'rows':>8}{'legacy':>10}{'columnar':>10}{'compact':>10}{'speedup':>9}{'indented':>12}{'compact':>12}  identical")
+    for name, frame in frames.items():
+        if frame is None:
+            logger.error(f"No {name} data available to benchmark")
+            continue
+
+        r = benchmark_frame(name, frame, args.repeat)
+        speedup = r['legacy_seconds'] / r['columnar_seconds']
+        print(
+            f"{name:<10}{r['rows']:>8}{r['legacy_seconds']:>9.3f}s{r['columnar_seconds']:>9.3f}s"
+            f"{r['compact_seconds']:>9.3f}s{speedup:>8.1f}x{r['indented_bytes']:>12,}{r['compact_bytes']:>12,}  "
+            f"{r['identical_output']}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Best Parlay Search
+
+Ranks the highest-probability 2-6 leg parlays for a week's slate and writes
+them to src/lib/data/best_parlays.js for the UI to load statically.
+
+Candidate legs come from the active offensive players on each team in the
+week's games (the same filtered roster update_nfl_data.py exports), with the
+prop types the player page offers for their position. Each game is searched
+in its own worker process: legs are pruned by their individual hit rate, then
+a beam search grows same-game parlays one leg at a time, scoring every
+candidate with parlay_engine so same-game correlation is accounted for.
+Games are independent of each other, so the per-game results are finally
+combined into cross-game parlays by multiplying probabilities.
+
+Parlays are ranked by a lower confidence bound of their probability rather
+than the estimate itself, and bigger parlays need more shared games before
+their empirical joint hit rate is trusted (min_samples per extra leg), so the
+search does not favor slips that happened to hit in a handful of weeks.
+
+Book lines are not in the database, so by default each leg's line is the
+player's recent median rounded down to the half point; pass --lines with a
+CSV of player_id,prop_type,line to search real lines instead.
+"""
+
+import time
+import logging
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from update_nfl_data import (
+    download_rosters_data,
+    download_schedule_data,
+    filter_active_offensive_players,
+    get_current_season,
+)
+from update_nfl_stats import get_supabase_client
+from nfl_cache import settings as cache_settings, configure as configure_cache
+from nfl_cache import add_cache_arguments, configure_from_args
+from prop_summaries import PROP_STATS, POSITION_PROPS
+from parlay_engine import (
+    DEFAULT_MIN_SAMPLES,
+    build_leg_matrix,
+    leg_hit_rates,
+    load_game_logs,
+    lower_bound,
+    score_slips,
+)
+from js_export import write_js_export
+from game_context import load_game_context, team_context
+
+logger = logging.getLogger(__name__)
+
+# Games used to set the default line for each leg
+LINE_GAMES = 10
+
+# Parlay sizes searched
+MIN_LEGS = 2
+MAX_LEGS = 6
+
+# Standard deviations below the estimate that parlays are ranked by
+RANK_Z = 1.0
+
+DEFAULT_OUTPUT_FILE = Path(__file__).parent.parent / "src" / "lib" / "data" / "best_parlays.js"
+
+def upcoming_week(schedule_data):
+    """Return the first week of the schedule with unplayed games, or the last week if all are played."""
+    unplayed = schedule_data[schedule_data['home_score'].isna()]
+    if unplayed.empty:
+        return int(schedule_data['week'].max())
+    return int(unplayed['week'].min())
+
+def default_lines(logs, players):
+    """Set one line per (player, prop type): the median of the last LINE_GAMES games, rounded down to x.5."""
+    logs = logs[logs['player_id'].isin(players['player_id'])].sort_values(['season', 'week'], kind='stable')
+    recent = logs.groupby('player_id', sort=False).tail(LINE_GAMES)
+    positions = players.set_index('player_id')['position']
+
+    lines = []
+    for prop_type, columns in PROP_STATS.items():
+        values = recent[columns].fillna(0).sum(axis=1).groupby(recent['player_id']).median()
+        lines.append(pd.DataFrame({
+            'player_id': values.index,
+            'prop_type': prop_type,
+            'line': np.floor(values.to_numpy()) + 0.5
+        }))
+    lines = pd.concat(lines, ignore_index=True)
+
+    # Only keep the prop types the player page offers for the player's position
+    offered = [prop_type in POSITION_PROPS.get(position, [])
+               for prop_type, position in zip(lines['prop_type'], lines['player_id'].map(positions))]
+    return lines[offered]
+
+def candidate_legs(lines):
+    """Expand (player_id, prop_type, line) rows into over and under legs."""
+    return [
+        (player_id, prop_type, float(line), side)
+        for player_id, prop_type, line in lines[['player_id', 'prop_type', 'line']].itertuples(index=False)
+        for side in ('over', 'under')
+    ]
+
+def expand_beam(beam, candidates, legs):
+    """Return every distinct slip made by adding one candidate leg to a slip in the beam.
+
+    A slip never holds two legs on the same player and prop type.
+    """
+    children = set()
+    for slip in beam:
+        taken = {(legs[i][0], legs[i][1]) for i in slip}
+        for j in candidates:
+            if j not in slip and (legs[j][0], legs[j][1]) not in taken:
+                children.add(tuple(sorted(slip + (j,))))
+    return list(children)
+
+def search_game(game_id, logs, legs, beam_width=200, max_candidates=40, min_hit_rate=0.55, min_games=6,
+                max_legs=MAX_LEGS, top=25, min_samples=DEFAULT_MIN_SAMPLES, n_sims=2000, rank_z=RANK_Z):
+    """Beam search one game's legs for the best same-game parlays of each size. Runs in a worker process.
+
+    Returns (game_id, {size: [(probability, lower bound, legs), ...]}, {leg: hit rate}),
+    with sizes from 1 (single legs) to max_legs and at most `top` parlays per
+    size, ranked by the lower bound. A parlay of n legs needs min_samples * (n - 1)
+    shared games before its empirical joint hit rate is used.
+    """
+    if not legs:
+        return game_id, {}, {}
+
+    # Every leg is bet on this game, so all of them are scored jointly
+    matrix = build_leg_matrix(logs, legs, dict.fromkeys({leg[0] for leg in legs}, game_id))
+    rates = leg_hit_rates(matrix)
+    games = matrix['valid'].sum(axis=0)
+    rate_bounds = lower_bound(rates, games, rank_z)
+
+    # Prune to the best individual legs; a parlay can never beat its weakest leg
+    eligible = np.flatnonzero((games >= min_games) & (rates >= min_hit_rate))
+    candidates = eligible[np.argsort(-rate_bounds[eligible], kind='stable')][:max_candidates].tolist()
+    hit_rates = {legs[i]: float(rates[i]) for i in candidates}
+
+    results = {1: [(float(rates[i]), float(rate_bounds[i]), (legs[i],)) for i in candidates[:top]]}
+    beam = [(i,) for i in candidates[:beam_width]]
+    for size in range(2, max_legs + 1):
+        slips = expand_beam(beam, candidates, legs)
+        if not slips:
+            break
+
+        probabilities, bounds = score_slips(matrix, slips, min_samples=min_samples * (size - 1), n_sims=n_sims,
+                                            z=rank_z)
+        order = np.argsort(-np.nan_to_num(bounds), kind='stable')
+        beam = [slips[i] for i in order[:beam_width]]
+        results[size] = [
+            (float(probabilities[i]), float(bounds[i]), tuple(legs[j] for j in slips[i]))
+            for i in order[:top] if probabilities[i] > 0
+        ]
+
+    return game_id, results, hit_rates
+
+def combine_games(game_results, max_legs=MAX_LEGS, top=25):
+    """Combine per-game parlays into the best parlays of each size across the slate.
+
+    Games are independent, so a combined parlay's probability and lower bound are
+    the products of its per-game parts. Each size keeps only its `top` best
+    combinations by lower bound while games are folded in one at a time.
+    """
+    best = {0: [(1.0, 1.0, ())]}
+    for results in game_results:
+        combined = {size: list(parlays) for size, parlays in best.items()}
+        for size, parlays in best.items():
+            for game_size, game_parlays in results.items():
+                if size + game_size > max_legs:
+                    continue
+                combined.setdefault(size + game_size, []).extend(
+                    (probability * game_probability, bound * game_bound, legs + game_legs)
+                    for probability, bound, legs in parlays
+                    for game_probability, game_bound, game_legs in game_parlays
+                )
+        best = {size: sorted(parlays, key=lambda parlay: -parlay[1])[:top] for size, parlays in combined.items()}
+
+    return {size: parlays for size, parlays in best.items() if size >= MIN_LEGS}
+
+def parlay_records(parlays, hit_rates, players, leg_games, season, week, game_context=None):
+    """Flatten ranked parlays into output records with player details for each leg.
+
+    game_context ({game_id: context}, see game_context.py) adds each leg's
+    implied team total and win probability.
+    """
+    game_context = game_context or {}
+    players = players.drop_duplicates('player_id').set_index('player_id')
+    records = []
+    for size in sorted(parlays):
+        for rank, (probability, bound, legs) in enumerate(parlays[size], start=1):
+            picks = []
+            for player_id, prop_type, line, side in legs:
+                player = players.loc[player_id]
+                picks.append({
+                    'player_id': player_id,
+                    'player_name': player['player_name'],
+                    'team': player['team'],
+                    'position': player['position'],
+                    'game_id': leg_games[player_id],
+                    'prop_type': prop_type,
+                    'line': line,
+                    'side': side,
+                    'hit_rate': round(hit_rates[(player_id, prop_type, line, side)], 4)
+                })
+                game = game_context.get(leg_games[player_id])
+                if game is not None:
+                    picks[-1].update(team_context(game, player['team']))
+            records.append({
+                'season': season,
+                'week': week,
+                'legs': size,
+                'rank': rank,
+                'probability': round(probability, 4),
+                'probability_lower_bound': round(bound, 4),
+                'independent_probability': round(float(np.prod([pick['hit_rate'] for pick in picks])), 4),
+                'games': sorted({pick['game_id'] for pick in picks}),
+                'picks': picks
+            })
+    return records
+
+def find_best_parlays(schedule_data, players, logs, week, lines=None, processes=4, max_legs=MAX_LEGS,
+                      top=25, **search_options):
+    """Search the week's games in parallel and return the best parlays of each size plus leg hit rates.
+
+    Returns ({size: [(probability, lower bound, legs), ...]}, {leg: hit rate}, {player_id: game_id}).
+    """
+    games = schedule_data[schedule_data['week'] == week]
+    if lines is None:
+        lines = default_lines(logs, players)
+
+    tasks = []
+    leg_games = {}
+    for game in games.itertuples(index=False):
+        game_players = players[players['team'].isin([game.away_team, game.home_team])]
+        leg_games.update(dict.fromkeys(game_players['player_id'], game.game_id))
+        game_lines = lines[lines['player_id'].isin(game_players['player_id'])]
+        game_logs = logs[logs['player_id'].isin(game_players['player_id'])]
+        tasks.append((game.game_id, game_logs, candidate_legs(game_lines)))
+
+    logger.info(f"Searching {len(tasks)} games in week {week} with {sum(len(t[2]) for t in tasks)} candidate legs...")
+
+    game_results = []
+    hit_rates = {}
+    # Worker processes may not inherit module state, so pass the cache settings along
+    cache_args = (cache_settings['cache_dir'], None, None, cache_settings['offline'], cache_settings['enabled'])
+    with ProcessPoolExecutor(max_workers=processes, initializer=configure_cache, initargs=cache_args) as executor:
+        futures = [
+            executor.submit(search_game, game_id, game_logs, legs, max_legs=max_legs, top=top, **search_options)
+            for game_id, game_logs, legs in tasks
+        ]
+        for future in futures:
+            game_id, results, game_hit_rates = future.result()
+            logger.info(f"{game_id}: {len(game_hit_rates)} legs after pruning")
+            game_results.append(results)
+            hit_rates.update(game_hit_rates)
+
+    return combine_games(game_results, max_legs=max_legs, top=top), hit_rates, leg_games
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Rank the highest-probability parlays for a week's slate.")
+    parser.add_argument('--season', type=int, default=get_current_season(), help="Season to search")
+    parser.add_argument('--week', type=int, help="Week to search (default: the next week with unplayed games)")
+    parser.add_argument('--lines', type=Path,
+                        help="CSV of player_id,prop_type,line to use instead of median-based lines")
+    parser.add_argument('--processes', type=int, default=4,
+                        help="Games searched in parallel (default: 4)")
+    parser.add_argument('--beam-width', type=int, default=200,
+                        help="Partial parlays kept per game at each size (default: 200)")
+    parser.add_argument('--max-candidates', type=int, default=40,
+                        help="Legs per game kept after pruning by hit rate (default: 40)")
+    parser.add_argument('--min-hit-rate', type=float, default=0.55,
+                        help="Minimum individual hit rate for a leg to be considered (default: 0.55)")
+    parser.add_argument('--rank-z', type=float, default=RANK_Z,
+                        help=f"Rank parlays this many standard deviations below their estimate (default: {RANK_Z})")
+    parser.add_argument('--max-legs', type=int, default=MAX_LEGS,
+                        help=f"Largest parlay size to search (default: {MAX_LEGS})")
+    parser.add_argument('--top', type=int, default=25,
+                        help="Parlays kept per size (default: 25)")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT_FILE,
+                        help="Output JavaScript file (default: src/lib/data/best_parlays.js)")
+    parser.add_argument('--compact', action='store_true',
+                        help="Write compact (non-indented) JSON")
+    add_cache_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    """Main function to rank the week's best parlays."""
+    args = parse_args()
+    configure_from_args(args)
+    started = time.perf_counter()
+
+    schedule_data = download_schedule_data(args.season)
+    rosters_data = download_rosters_data(args.season)
+    if schedule_data is None or rosters_data is None:
+        logger.error("Schedule and rosters are required to search parlays")
+        return
+
+    week = args.week if args.week is not None else upcoming_week(schedule_data)
+    players = filter_active_offensive_players(rosters_data, args.season)
+    logs = load_game_logs(get_supabase_client(), [args.season - 1, args.season])
+    if logs.empty:
+        logger.error(f"No game logs found for {args.season - 1}-{args.season}")
+        return
+
+    lines = pd.read_csv(args.lines) if args.lines else None
+    parlays, hit_rates, leg_games = find_best_parlays(
+        schedule_data, players, logs, week, lines=lines, processes=args.processes, max_legs=args.max_legs,
+        top=args.top, beam_width=args.beam_width, max_candidates=args.max_candidates,
+        min_hit_rate=args.min_hit_rate, rank_z=args.rank_z
+    )
+
+    records = parlay_records(parlays, hit_rates, players, leg_games, args.season, week,
+                             load_game_context(args.season, week))
+    write_js_export(args.output, 'best_parlays', pd.DataFrame(records), compact=args.compact)
+    logger.info(f"Ranked {len(records)} parlays for week {week} in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
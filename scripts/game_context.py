@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Game Context Index
+
+Turns the betting lines in the schedule (moneylines, spread, total and
+over/under odds) into market-implied probabilities and team totals, with
+the bookmaker's margin removed, and stores them per week keyed by game_id:
+
+    src/lib/data/game_context/2024_07.json
+    {"2024_07_BUF_NYJ": {"home_win_prob": 0.46, "home_implied_total": 20.5, ...}, ...}
+
+The parlay tooling loads one week with load_game_context and joins legs to
+their game with a dict lookup.
+
+nflverse lines are from the home team's side: spread_line is the expected
+home margin (positive when the home team is favored) and total_line the
+expected combined score, so the implied totals are (total +/- spread) / 2.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from js_export import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_DIR = Path(__file__).parent.parent / "src" / "lib" / "data" / "game_context"
+
+CONTEXT_COLUMNS = [
+    'away_team', 'home_team', 'spread_line', 'total_line', 'home_win_prob', 'away_win_prob',
+    'over_prob', 'under_prob', 'home_implied_total', 'away_implied_total', 'moneyline_margin', 'total_margin'
+]
+
+def implied_probability(american_odds):
+    """Convert American odds to the implied probability, vig included. NaN odds stay NaN."""
+    odds = np.asarray(american_odds, dtype=float)
+    with np.errstate(invalid='ignore'):
+        return np.where(odds < 0, -odds / (100 - odds), 100 / (odds + 100))
+
+def remove_vig(first_odds, second_odds):
+    """Return both sides' probabilities normalized to sum to 1, and the bookmaker margin (overround - 1)."""
+    first = implied_probability(first_odds)
+    second = implied_probability(second_odds)
+    overround = first + second
+    return first / overround, second / overround, overround - 1
+
+def build_game_context(schedule_data):
+    """Build the context of every game with lines, indexed by game_id, plus its season and week."""
+    games = schedule_data.dropna(subset=['spread_line', 'total_line']).set_index('game_id')
+    home_win, away_win, moneyline_margin = remove_vig(games['home_moneyline'], games['away_moneyline'])
+    over, under, total_margin = remove_vig(games['over_odds'], games['under_odds'])
+    spread = games['spread_line'].to_numpy(dtype=float)
+    total = games['total_line'].to_numpy(dtype=float)
+
+    context = pd.DataFrame({
+        'season': games['season'].astype(int),
+        'week': games['week'].astype(int),
+        'away_team': games['away_team'],
+        'home_team': games['home_team'],
+        'spread_line': spread,
+        'total_line': total,
+        'home_win_prob': home_win,
+        'away_win_prob': away_win,
+        'over_prob': over,
+        'under_prob': under,
+        'home_implied_total': (total + spread) / 2,
+        'away_implied_total': (total - spread) / 2,
+        'moneyline_margin': moneyline_margin,
+        'total_margin': total_margin
+    }, index=games.index)
+    return context.round(4)
+
+def context_file(context_dir, season, week):
+    """Return the index file of one week."""
+    return Path(context_dir) / f"{season}_{week:02d}.json"
+
+def write_game_context(context, context_dir=DEFAULT_CONTEXT_DIR):
+    """Write one {game_id: context} index per week of build_game_context output and return the files written.
+
+    Files of the same seasons for weeks that no longer have lines are removed.
+    """
+    context_dir = Path(context_dir)
+    context_dir.mkdir(parents=True, exist_ok=True)
+
+    values = context[CONTEXT_COLUMNS].astype(object).where(context[CONTEXT_COLUMNS].notna(), None)
+    weeks = {}
+    for game_id, season, week, game in zip(context.index, context['season'], context['week'],
+                                           values.to_dict('records')):
+        weeks.setdefault((season, week), {})[game_id] = game
+
+    written = set()
+    for (season, week), games in sorted(weeks.items()):
+        path = context_file(context_dir, season, week)
+        with atomic_write(path) as f:
+            json.dump(games, f, separators=(',', ':'))
+        written.add(path)
+
+    seasons = {str(season) for season in context['season'].unique()}
+    for stale_file in context_dir.glob("*.json"):
+        if stale_file.name.split('_')[0] in seasons and stale_file not in written:
+            stale_file.unlink()
+            logger.info(f"Removed stale game context: {stale_file}")
+
+    logger.info(f"Saved game context for {len(context)} games in {len(written)} weeks: {context_dir}")
+    return sorted(written)
+
+def load_game_context(season, week, context_dir=DEFAULT_CONTEXT_DIR):
+    """Return {game_id: context} for one week, or an empty dict if it has not been written."""
+    path = context_file(context_dir, season, week)
+    if not path.exists():
+        logger.warning(f"No game context for {season} week {week}: {path}")
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def team_context(game, team):
+    """Return a team's side of a game context: implied total, win probability and opponent."""
+    side, other = ('home', 'away') if game['home_team'] == team else ('away', 'home')
+    return {
+        'implied_total': game[f"{side}_implied_total"],
+        'win_prob': game[f"{side}_win_prob"],
+        'opponent': game[f"{other}_team"]
+    }
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Game Log Query Service
+
+Serves player game logs and filtered aggregates from memory so the
+/api/nfl/game-logs route does not need a Supabase round trip per click.
+
+- The nfl table is loaded once (from Supabase, or the local SQLite copy
+  written by update_nfl_stats.py --sqlite-file) into NumPy columns sorted by
+  player, season and week, with each player's rows as one contiguous slice
+- Home/away comes from the cached schedules, since the nfl table only has the opponent
+- Every season is loaded by default, like the route queries; with --seasons
+  only the given number of recent seasons is loaded, and queries for any
+  other season (or without a season) get a 404 so the route falls back to Supabase
+- Responses are cached in an LRU cache keyed on the store generation, which
+  is bumped (and the cache cleared) whenever the store is reloaded;
+  update_nfl_stats.py asks for a reload (POST /reload) when ingestion
+  finishes and GAME_LOG_SERVICE_URL is set
+
+    GET  /game-logs?playerId=00-0033873&season=2024&seasonType=REG&opponent=BUF&location=home&last=5
+    GET  /aggregates?playerId=00-0033873&last=10
+    POST /reload
+    GET  /health
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from nfl_cache import add_cache_arguments, configure_from_args
+from prop_summaries import fetch_game_logs
+from update_nfl_stats import get_supabase_client, get_current_season, download_schedule_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+# Responses kept in the LRU cache
+DEFAULT_CACHE_SIZE = 4096
+
+# Game log fields returned by /game-logs, as the API route names them -> nfl table column
+GAME_LOG_FIELDS = {
+    'week': 'week',
+    'opponent': 'opponent_team',
+    'season': 'season',
+    'seasonType': 'season_type',
+    'gameResult': 'game_result',
+    'completions': 'completions',
+    'attempts': 'attempts',
+    'passingYards': 'passing_yards',
+    'passingTds': 'passing_tds',
+    'interceptions': 'interceptions',
+    'sacks': 'sacks',
+    'carries': 'carries',
+    'rushingYards': 'rushing_yards',
+    'rushingTds': 'rushing_tds',
+    'receptions': 'receptions',
+    'targets': 'targets',
+    'receivingYards': 'receiving_yards',
+    'receivingTds': 'receiving_tds',
+    'fantasyPoints': 'fantasy_points',
+    'fantasyPointsPpr': 'fantasy_points_ppr'
+}
+
+TEXT_COLUMNS = ['player_id', 'team', 'opponent_team', 'season_type', 'game_result']
+STAT_COLUMNS = [col for col in GAME_LOG_FIELDS.values() if col not in TEXT_COLUMNS + ['week', 'season']]
+FLOAT_COLUMNS = ['fantasy_points', 'fantasy_points_ppr']
+
+# The loaded index is replaced as a whole on reload, so queries read one consistent snapshot.
+# seasons is None when every season is loaded.
+store = {
+    'index': {'columns': {}, 'players': {}, 'rows': 0, 'generation': 0},
+    'loaded_at': None,
+    'loader': None,
+    'seasons': None
+}
+
+_lock = threading.Lock()
+
+def add_locations(logs):
+    """Add a 'location' column ('home', 'away' or '') from each season's cached schedule."""
+    sides = []
+    for season in logs['season'].unique():
+        schedule_data = download_schedule_data(int(season))
+        if schedule_data is None:
+            continue
+        for side in ('home', 'away'):
+            sides.append(pd.DataFrame({
+                'season': schedule_data['season'].astype(int),
+                'week': schedule_data['week'].astype(int),
+                'team': schedule_data[f"{side}_team"],
+                'location': side
+            }))
+
+    if not sides:
+        logs['location'] = ''
+        return logs
+    locations = pd.concat(sides).drop_duplicates(['season', 'week', 'team'])
+    logs = logs.merge(locations, on=['season', 'week', 'team'], how='left')
+    logs['location'] = logs['location'].fillna('')
+    return logs
+
+def build_store(logs):
+    """Build the player-indexed columnar store from nfl table rows."""
+    logs = logs.sort_values(['player_id', 'season', 'week'], kind='stable').reset_index(drop=True)
+    columns = {}
+    for col in TEXT_COLUMNS + ['location']:
+        missing = 'N/A' if col == 'game_result' else ''
+        columns[col] = logs[col].fillna(missing).astype(str).to_numpy(dtype=object)
+    for col in ['season', 'week'] + STAT_COLUMNS:
+        values = pd.to_numeric(logs[col], errors='coerce').fillna(0)
+        if col in FLOAT_COLUMNS:
+            # float64 rounded like the table, so values serialize as 12.34 rather than 12.340000152587891
+            columns[col] = values.to_numpy(dtype=np.float64).round(2)
+        else:
+            columns[col] = values.to_numpy(dtype=np.int32)
+
+    player_ids = columns['player_id']
+    starts = np.flatnonzero(np.r_[True, player_ids[1:] != player_ids[:-1]]) if len(logs) else np.array([], dtype=int)
+    stops = np.r_[starts[1:], len(logs)]
+    players = {player_ids[start]: (int(start), int(stop)) for start, stop in zip(starts, stops)}
+    return {'columns': columns, 'players': players, 'rows': len(logs)}
+
+def load_from_supabase(seasons):
+    """Read the game log columns of the nfl table from Supabase."""
+    columns = sorted(set(GAME_LOG_FIELDS.values()) | {'player_id', 'team'})
+    return fetch_game_logs(get_supabase_client(), seasons, columns=columns)
+
+def load_from_sqlite(path):
+    """Read the nfl table from a local SQLite copy."""
+    with sqlite3.connect(path) as connection:
+        return pd.read_sql_query("SELECT * FROM nfl", connection)
+
+def reload_store():
+    """Reload the store with its loader and clear the response cache. Returns the number of rows loaded."""
+    started = time.perf_counter()
+    logs = store['loader']()
+    if logs.empty:
+        logger.warning("No game logs loaded")
+        built = build_store(pd.DataFrame(columns=TEXT_COLUMNS + ['location', 'season', 'week'] + STAT_COLUMNS))
+    else:
+        built = build_store(add_locations(logs))
+
+    with _lock:
+        # Queries key their cached response on the generation they read, so one still computing on the
+        # old index can only cache under the old generation, which no later request asks for
+        built['generation'] = store['index']['generation'] + 1
+        store.update(index=built, loaded_at=time.time())
+        cached_response.cache_clear()
+    logger.info(f"Loaded {built['rows']} game logs for {len(built['players'])} players "
+                f"in {time.perf_counter() - started:.2f}s")
+    return built['rows']
+
+def select_rows(index, player_id, season=None, season_type=None, opponent=None, location=None, last=None):
+    """Return the index row positions of a player's games matching the filters, in season/week order."""
+    span = index['players'].get(player_id)
+    if span is None:
+        return np.array([], dtype=int)
+
+    start, stop = span
+    columns = index['columns']
+    mask = np.ones(stop - start, dtype=bool)
+    if season is not None:
+        mask &= columns['season'][start:stop] == season
+    if season_type is not None:
+        mask &= columns['season_type'][start:stop] == season_type
+    if opponent is not None:
+        mask &= columns['opponent_team'][start:stop] == opponent
+    if location is not None:
+        mask &= columns['location'][start:stop] == location
+
+    rows = np.flatnonzero(mask) + start
+    if last is not None:
+        rows = rows[-last:] if last > 0 else rows[:0]
+    return rows
+
+def game_logs(player_id, **filters):
+    """Return a player's game logs in the API route's shape: latest season first, weeks ascending."""
+    index = store['index']
+    rows = select_rows(index, player_id, **filters)
+    columns = index['columns']
+    # Latest season first, keeping the week order within a season
+    rows = rows[np.argsort(-columns['season'][rows], kind='stable')]
+    values = [columns[col][rows].tolist() for col in GAME_LOG_FIELDS.values()]
+    logs = [dict(zip(GAME_LOG_FIELDS, game)) for game in zip(*values)]
+    return {'playerId': player_id, 'gameLogs': logs, 'total': len(logs)}
+
+def aggregates(player_id, **filters):
+    """Return games, total, mean, median, min and max of every stat over a player's matching games."""
+    index = store['index']
+    rows = select_rows(index, player_id, **filters)
+    columns = index['columns']
+    stats = {}
+    for col in STAT_COLUMNS:
+        values = columns[col][rows]
+        if len(values) == 0:
+            stats[col] = None
+            continue
+        stats[col] = {
+            'total': round(float(values.sum()), 2),
+            'mean': round(float(values.mean()), 2),
+            'median': round(float(np.median(values)), 2),
+            'min': round(float(values.min()), 2),
+            'max': round(float(values.max()), 2)
+        }
+    return {'playerId': player_id, 'filters': filters, 'games': len(rows), 'stats': stats}
+
+QUERIES = {
+    '/game-logs': game_logs,
+    '/aggregates': aggregates
+}
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def cached_response(path, player_id, filters, generation):
+    """Return the JSON body of a query; filters is a tuple of (name, value) pairs.
+
+    generation is the store generation the request started on and only keys the cache.
+    """
+    return json.dumps(QUERIES[path](player_id, **dict(filters))).encode()
+
+def season_loaded(filters):
+    """Return whether the store holds every game a query with these filters could match."""
+    if store['seasons'] is None:
+        return True
+    return dict(filters).get('season') in store['seasons']
+
+def parse_filters(params):
+    """Turn query string parameters into select_rows filters, raising ValueError on bad values."""
+    filters = {}
+    if 'season' in params:
+        filters['season'] = int(params['season'])
+    if 'seasonType' in params:
+        filters['season_type'] = params['seasonType']
+    if 'opponent' in params:
+        filters['opponent'] = params['opponent']
+    if 'location' in params:
+        if params['location'] not in ('home', 'away'):
+            raise ValueError("location must be home or away")
+        filters['location'] = params['location']
+    if 'last' in params:
+        filters['last'] = int(params['last'])
+    return tuple(sorted(filters.items()))
+
+class GameLogHandler(BaseHTTPRequestHandler):
+    def send_json(self, status, body):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            index = store['index']
+            self.send_json(200, {'rows': index['rows'], 'players': len(index['players']),
+                                 'seasons': store['seasons'], 'generation': index['generation'],
+                                 'loadedAt': store['loaded_at'], 'cache': cached_response.cache_info()._asdict()})
+            return
+        if url.path not in QUERIES:
+            self.send_json(404, {'error': 'Not found'})
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if not params.get('playerId'):
+            self.send_json(400, {'error': 'playerId parameter is required'})
+            return
+        try:
+            filters = parse_filters(params)
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        if not season_loaded(filters):
+            self.send_json(404, {'error': 'Season not loaded'})
+            return
+        self.send_json(200, cached_response(url.path, params['playerId'], filters, store['index']['generation']))
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/reload':
+            self.send_json(404, {'error': 'Not found'})
+            return
+        try:
+            rows = reload_store()
+            self.send_json(200, {'rows': rows})
+        except Exception as e:
+            logger.error(f"Error reloading game logs: {e}")
+            self.send_json(500, {'error': 'Failed to reload game logs'})
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Serve player game logs and aggregates from memory.")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument('--seasons', type=int,
+                        help="Only load this many seasons from Supabase, ending with the current one (default: all)")
+    parser.add_argument('--sqlite-file', type=Path,
+                        help="Load the nfl table from this SQLite copy instead of Supabase")
+    add_cache_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    """Load the game logs and serve queries until interrupted."""
+    args = parse_args()
+    configure_from_args(args)
+
+    if args.sqlite_file:
+        store['loader'] = lambda: load_from_sqlite(args.sqlite_file)
+    else:
+        if args.seasons is not None:
+            current_season = get_current_season()
+            store['seasons'] = list(range(current_season - args.seasons + 1, current_season + 1))
+        store['loader'] = lambda: load_from_supabase(store['seasons'])
+    reload_store()
+
+    server = ThreadingHTTPServer((args.host, args.port), GameLogHandler)
+    logger.info(f"Serving game logs on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Pipeline Instrumentation
+
+Lightweight timers and counters for the data scripts, collected into a JSON
+run report that is appended to run_reports.jsonl at the end of each run.
+
+    with stage('download', rows_in=0) as s:
+        data = download()
+        s['rows_out'] = len(data)
+
+    count('failed_batches')
+
+Stages accumulate calls, seconds, rows in/out and bytes per name, and are
+safe to record from worker threads. Optional hooks (behind flags) profile
+the run with cProfile or track Python allocations with tracemalloc.
+"""
+
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import resource
+import threading
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORT_FILE = Path(__file__).parent / "run_reports.jsonl"
+
+# Functions listed in the log when --profile is used
+PROFILE_TOP_FUNCTIONS = 25
+
+_lock = threading.Lock()
+
+run = {
+    'script': None,
+    'started_at': None,
+    'started': None,
+    'stages': {},
+    'counters': {},
+    'report_file': None,
+    'profiler': None,
+    'profile_file': None,
+    'trace_memory': False
+}
+
+def record_stage(name, seconds, rows_in=None, rows_out=None, bytes_written=None, failed=False):
+    """Add one timed call to a stage's totals."""
+    with _lock:
+        totals = run['stages'].setdefault(name, {
+            'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'rows_in': 0, 'rows_out': 0, 'bytes': 0, 'failures': 0
+        })
+        totals['calls'] += 1
+        totals['seconds'] += seconds
+        totals['max_seconds'] = max(totals['max_seconds'], seconds)
+        totals['rows_in'] += rows_in or 0
+        totals['rows_out'] += rows_out or 0
+        totals['bytes'] += bytes_written or 0
+        totals['failures'] += int(failed)
+
+@contextmanager
+def stage(name, rows_in=None):
+    """Time a block as one call of a stage. Set 'rows_out' and 'bytes' on the yielded dict to record them."""
+    result = {'rows_in': rows_in, 'rows_out': None, 'bytes': None}
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield result
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        record_stage(name, time.perf_counter() - started, result['rows_in'], result['rows_out'], result['bytes'],
+                     failed)
+
+def count(name, value=1):
+    """Add to a named counter."""
+    with _lock:
+        run['counters'][name] = run['counters'].get(name, 0) + value
+
+def add_instrumentation_arguments(parser):
+    """Add the shared instrumentation flags to an argparse parser."""
+    parser.add_argument('--report-file', type=Path, default=DEFAULT_REPORT_FILE,
+                        help=f"Append a JSON run report to this file (default: {DEFAULT_REPORT_FILE.name})")
+    parser.add_argument('--no-report', action='store_true',
+                        help="Do not write a run report")
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                        help="Profile the run with cProfile and save the stats to FILE")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Track Python allocations with tracemalloc and report the peak")
+
+def start_run(script, args=None):
+    """Reset the run state and start the profiling hooks requested on the command line."""
+    run.update({
+        'script': script,
+        'started_at': datetime.now().isoformat(),
+        'started': time.perf_counter(),
+        'stages': {},
+        'counters': {},
+        'report_file': None,
+        'profiler': None,
+        'profile_file': None,
+        'trace_memory': False
+    })
+    if args is None:
+        return
+
+    if not args.no_report:
+        run['report_file'] = args.report_file
+    if args.trace_memory:
+        tracemalloc.start()
+        run['trace_memory'] = True
+    if args.profile:
+        run['profile_file'] = args.profile
+        run['profiler'] = cProfile.Profile()
+        run['profiler'].enable()
+
+def peak_rss_bytes():
+    """Return this process's peak resident set size in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def build_report(status):
+    """Return the run report for the current run."""
+    report = {
+        'script': run['script'],
+        'started_at': run['started_at'],
+        'status': status,
+        'duration_seconds': round(time.perf_counter() - run['started'], 3),
+        'peak_rss_bytes': peak_rss_bytes(),
+        'stages': {
+            name: {**totals, 'seconds': round(totals['seconds'], 3), 'max_seconds': round(totals['max_seconds'], 3)}
+            for name, totals in run['stages'].items()
+        },
+        'counters': dict(run['counters'])
+    }
+    if run['trace_memory']:
+        report['tracemalloc_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+    return report
+
+def finish_run(status='ok'):
+    """Stop the profiling hooks, log a stage summary and append the run report. Returns the report."""
+    if run['started'] is None:
+        return None
+
+    profiler = run['profiler']
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(run['profile_file'])
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+        logger.info(f"Saved cProfile stats to {run['profile_file']}\n{output.getvalue()}")
+
+    report = build_report(status)
+    if run['trace_memory']:
+        tracemalloc.stop()
+
+    for name, totals in report['stages'].items():
+        logger.info(
+            f"Stage {name}: {totals['calls']} calls, {totals['seconds']:.2f}s, "
+            f"{totals['rows_in']} rows in, {totals['rows_out']} rows out"
+            + (f", {totals['bytes']:,} bytes" if totals['bytes'] else "")
+            + (f", {totals['failures']} failed" if totals['failures'] else "")
+        )
+
+    if run['report_file'] is not None:
+        with open(run['report_file'], 'a') as f:
+            f.write(json.dumps(report) + "\n")
+        logger.info(f"Appended run report to {run['report_file']}")
+
+    run['started'] = None
+    return report
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+JavaScript Data Export
+
+Serializes DataFrames into the `export const name = ...;` modules under
+src/lib/data. NaN -> null and Timestamp -> ISO string conversion is done one
+column at a time, and the JSON is streamed to the output file in chunks.
+
+Two layouts are supported:
+- records: an array of row objects (the original format)
+- columnar: `{length, columns, dictionaries}` with one array per field, where
+  repeated strings are stored once in a dictionary and referenced by index.
+  src/lib/columnar.ts turns it back into row objects.
+
+Files are written through a temporary file and renamed into place, and a file
+whose content did not change is left untouched. update_manifest records each
+dataset's file hashes and row count in manifest.json and reports which
+datasets changed, so a deploy can skip the rebuild when nothing did.
+"""
+
+import gzip
+import json
+import hashlib
+import filecmp
+import logging
+from datetime import datetime
+from pathlib import Path
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+
+logger = logging.getLogger(__name__)
+
+@contextmanager
+def atomic_write(path):
+    """Open a temporary file next to path for writing and move it into place when the block succeeds.
+
+    If the new content is identical to the existing file, the existing file is
+    kept, so its modification time does not change.
+    """
+    path = Path(path)
+    temp_file = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(temp_file, 'w') as f:
+            yield f
+        if path.exists() and filecmp.cmp(temp_file, path, shallow=False):
+            logger.debug(f"Unchanged: {path}")
+        else:
+            temp_file.replace(path)
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def update_manifest(manifest_file, datasets):
+    """Record file hashes and row counts per dataset in the manifest and return the names of changed datasets.
+
+    datasets maps each name to {'rows': count, 'files': [paths]}. Datasets not
+    passed keep their previous entries. The manifest is only rewritten when a
+    dataset changed.
+    """
+    manifest_file = Path(manifest_file)
+    previous = {}
+    if manifest_file.exists():
+        with open(manifest_file) as f:
+            previous = json.load(f).get('datasets', {})
+
+    entries = {
+        name: {
+            'rows': int(dataset['rows']),
+            'files': {str(Path(path).relative_to(manifest_file.parent)): file_digest(path)
+                      for path in sorted(dataset['files'])}
+        }
+        for name, dataset in datasets.items()
+    }
+    changed = [name for name, entry in entries.items() if previous.get(name) != entry]
+    if changed:
+        with atomic_write(manifest_file) as f:
+            json.dump({'generated_at': datetime.now().isoformat(), 'datasets': {**previous, **entries}}, f,
+                      indent=2, sort_keys=True)
+    return changed
+
+def timestamps_to_iso(column):
+    """Convert a datetime column to ISO 8601 strings, matching Timestamp.isoformat()."""
+    if column.dt.tz is not None:
+        return column.map(lambda value: value.isoformat(), na_action='ignore')
+
+    values = column.to_numpy(dtype='datetime64[ns]')
+    # isoformat() picks the precision per value: whole seconds, microseconds, or nanoseconds when they are non-zero
+    nanoseconds = values.astype('int64')
+    strings = np.where(
+        nanoseconds % 1_000 != 0,
+        np.datetime_as_string(values, unit='ns'),
+        np.where(nanoseconds % 1_000_000_000 != 0,
+                 np.datetime_as_string(values, unit='us'),
+                 np.datetime_as_string(values, unit='s'))
+    )
+    return pd.Series(strings, index=column.index)
+
+def column_to_list(column):
+    """Convert a column to a JSON-ready list, with NaN as None and Timestamps as ISO strings."""
+    missing = column.isna()
+    if pd.api.types.is_datetime64_any_dtype(column):
+        column = timestamps_to_iso(column)
+
+    # astype(object) turns NumPy scalars into plain Python values for the encoder
+    values = column.astype(object)
+    if missing.any():
+        values = values.where(~missing, None)
+    return values.tolist()
+
+def frame_to_records(frame):
+    """Convert a frame to JSON-ready records, with NaN as None and Timestamps as ISO strings."""
+    columns = [column_to_list(column) for _, column in frame.items()]
+    names = list(frame.columns)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+def frame_to_columns(frame, dictionary_ratio=0.5):
+    """Convert a frame to the columnar layout.
+
+    String columns with fewer distinct values than dictionary_ratio * rows
+    (team, position, status, ...) are dictionary-encoded.
+    """
+    columns = {}
+    dictionaries = {}
+    for name, column in frame.items():
+        is_string = pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)
+        if is_string and len(column) and column.nunique() < dictionary_ratio * len(column):
+            codes, uniques = pd.factorize(column)
+            dictionaries[name] = column_to_list(pd.Series(uniques))
+            columns[name] = [None if code < 0 else code for code in codes.tolist()]
+        else:
+            columns[name] = column_to_list(column)
+
+    return {'length': len(frame), 'columns': columns, 'dictionaries': dictionaries}
+
+def project_columns(frame, columns, name):
+    """Keep only the declared columns of a frame, in declared order."""
+    missing = [col for col in columns if col not in frame.columns]
+    if missing:
+        logger.warning(f"{name} is missing declared export columns: {missing}")
+    return frame[[col for col in columns if col in frame.columns]]
+
+def iter_json_chunks(records, compact=False, chunk_size=1000):
+    """Yield the JSON array for records in pieces of chunk_size records.
+
+    Each piece is encoded with a single json.dumps call, which is much faster
+    than json.dump's per-token writes but never holds the whole document in memory.
+    """
+    if not records:
+        yield "[]"
+        return
+
+    json_options = {'separators': (',', ':')} if compact else {'indent': 2}
+    # Strip each chunk's own brackets ("[" / "]", plus the newlines when indented)
+    trim = 1 if compact else 2
+    yield "[" if compact else "[\n"
+    for start in range(0, len(records), chunk_size):
+        if start:
+            yield "," if compact else ",\n"
+        yield json.dumps(records[start:start + chunk_size], **json_options)[trim:-trim]
+    yield "]" if compact else "\n]"
+
+def write_js_export(path, name, frame, compact=False):
+    """Write a frame as `export const {name} = [...];` and return the number of bytes written.
+
+    The default output is indented like the existing data files. compact=True
+    writes JSON without whitespace, which is smaller and much faster to encode.
+    """
+    with stage('serialize', rows_in=len(frame)) as timer:
+        records = frame_to_records(frame)
+
+        with atomic_write(path) as f:
+            f.write(f"export const {name} = ")
+            for chunk in iter_json_chunks(records, compact):
+                f.write(chunk)
+            f.write(";")
+            size = f.tell()
+        timer.update(rows_out=len(records), bytes=size)
+
+    logger.info(f"Wrote {len(records)} {name} records ({size:,} bytes): {path}")
+    return size
+
+def write_js_columnar(path, name, frame):
+    """Write a frame as `export const {name} = {...};` in the compact columnar layout."""
+    with stage('serialize', rows_in=len(frame)) as timer:
+        dataset = frame_to_columns(frame)
+
+        with atomic_write(path) as f:
+            f.write(f"export const {name} = ")
+            json.dump(dataset, f, separators=(',', ':'))
+            f.write(";")
+            size = f.tell()
+        timer.update(rows_out=len(frame), bytes=size)
+
+    logger.info(f"Wrote {len(frame)} {name} rows in columnar layout ({size:,} bytes): {path}")
+    return size
+
+def write_shards(directory, name, frame, shard_column):
+    """Write one columnar module per value of shard_column, e.g. rosters/KC.js, so views can import lazily.
+
+    Shards for values that no longer appear in the frame are removed.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    written = set()
+    for value, shard in frame.groupby(shard_column, sort=True):
+        shard_file = directory / f"{value}.js"
+        write_js_columnar(shard_file, name, shard)
+        written.add(shard_file)
+
+    for stale_file in set(directory.glob("*.js")) - written:
+        stale_file.unlink()
+        logger.info(f"Removed stale shard: {stale_file}")
+
+    return sorted(written)
+
+def file_sizes(paths):
+    """Return the total raw and gzip-compressed size in bytes of a set of files."""
+    raw = 0
+    gzipped = 0
+    for path in paths:
+        content = path.read_bytes()
+        raw += len(content)
+        gzipped += len(gzip.compress(content, compresslevel=9))
+    return raw, gzipped
+
+def legacy_sizes(name, frame):
+    """Return the raw and gzip size of a frame exported with every column, as indented records."""
+    content = f"export const {name} = {''.join(iter_json_chunks(frame_to_records(frame)))};".encode()
+    return len(content), len(gzip.compress(content, compresslevel=9))
+
+def log_size_report(rows):
+    """Log a before/after size table; rows are (dataset, (raw, gzip) before, (raw, gzip) after)."""
+    logger.info(f"{'dataset':<18}{'before raw':>14}{'after raw':>14}{'before gzip':>14}{'after gzip':>14}")
+    for dataset, (before_raw, before_gzip), (after_raw, after_gzip) in rows:
+        logger.info(
+            f"{dataset:<18}{before_raw:>14,}{after_raw:>14,}{before_gzip:>14,}{after_gzip:>14,}"
+            f"  ({after_raw / before_raw:.0%} raw, {after_gzip / before_gzip:.0%} gzip)"
+        )
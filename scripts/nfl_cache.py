@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+NFL Data Download Cache
+
+Shared on-disk cache for nfl_data_py downloads. Each `nfl.import_*` result is
+stored as a Parquet file keyed by dataset and season, with a small JSON
+sidecar holding its metadata.
+
+- Entries expire after a TTL, except completed past seasons which never change
+- The cache is capped in size and evicts the least recently used entries
+- In offline mode cached entries are always used and misses raise CacheMiss
+- Concurrent requests for the same entry from several threads wait for one
+  download instead of each starting their own
+"""
+
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from instrumentation import stage, count
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".nfl_cache"
+
+# Current-season downloads are refreshed after this many seconds
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+# Least recently used entries are evicted once the cache grows past this size
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+settings = {
+    'cache_dir': DEFAULT_CACHE_DIR,
+    'ttl_seconds': DEFAULT_TTL_SECONDS,
+    'max_bytes': DEFAULT_MAX_BYTES,
+    'offline': False,
+    'enabled': True
+}
+
+# One lock per cache key, held while the entry is read or downloaded
+_key_locks = {}
+_key_locks_lock = threading.Lock()
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a dataset is not in the cache."""
+
+def configure(cache_dir=None, ttl_seconds=None, max_bytes=None, offline=None, enabled=None):
+    """Override cache settings, e.g. from command line flags."""
+    overrides = {
+        'cache_dir': Path(cache_dir) if cache_dir is not None else None,
+        'ttl_seconds': ttl_seconds,
+        'max_bytes': max_bytes,
+        'offline': offline,
+        'enabled': enabled
+    }
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+
+def add_cache_arguments(parser):
+    """Add the shared cache flags to an argparse parser."""
+    parser.add_argument('--offline', action='store_true',
+                        help="Only use cached downloads and fail on cache misses")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always download fresh data and do not write the cache")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                        help=f"Download cache directory (default: {DEFAULT_CACHE_DIR.name})")
+
+def configure_from_args(args):
+    """Apply the flags added by add_cache_arguments."""
+    configure(cache_dir=args.cache_dir, offline=args.offline, enabled=not args.no_cache)
+
+def cache_key(dataset, season=None):
+    """Return the cache key for a dataset and optional season."""
+    return dataset if season is None else f"{dataset}_{season}"
+
+def is_fresh(meta):
+    """Check whether a cache entry can be used without downloading again."""
+    if settings['offline'] or meta.get('immutable'):
+        return True
+    return time.time() - meta['created_at'] < settings['ttl_seconds']
+
+def read_entry(key):
+    """Return (frame, metadata) for a cache entry, or (None, None) if it is missing."""
+    data_file = settings['cache_dir'] / f"{key}.parquet"
+    meta_file = settings['cache_dir'] / f"{key}.json"
+    try:
+        with open(meta_file) as f:
+            meta = json.load(f)
+        if not is_fresh(meta):
+            return None, meta
+        frame = pd.read_parquet(data_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None, None
+
+    # Touch the data file so its mtime tracks the last access for LRU eviction
+    data_file.touch()
+    return frame, meta
+
+def write_entry(key, frame, immutable):
+    """Store a frame in the cache, then evict old entries if the cache is over its size cap."""
+    cache_dir = settings['cache_dir']
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data_file = cache_dir / f"{key}.parquet"
+    meta_file = cache_dir / f"{key}.json"
+
+    # Write to temp files and rename so concurrent processes never read a partial entry
+    temp_data = data_file.with_suffix('.parquet.tmp')
+    temp_meta = meta_file.with_suffix('.json.tmp')
+    try:
+        frame.to_parquet(temp_data, index=False)
+    except Exception as e:
+        logger.warning(f"Could not cache {key}: {e}")
+        temp_data.unlink(missing_ok=True)
+        return
+
+    with open(temp_meta, 'w') as f:
+        json.dump({'created_at': time.time(), 'immutable': immutable, 'rows': len(frame)}, f)
+    temp_data.replace(data_file)
+    temp_meta.replace(meta_file)
+
+    evict(keep=data_file)
+
+def evict(keep=None):
+    """Delete least recently used entries until the cache fits within max_bytes."""
+    entries = []
+    for data_file in settings['cache_dir'].glob("*.parquet"):
+        try:
+            stat = data_file.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, data_file))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, data_file in sorted(entries):
+        if total_bytes <= settings['max_bytes']:
+            break
+        if data_file == keep:
+            continue
+        data_file.unlink(missing_ok=True)
+        data_file.with_suffix('.json').unlink(missing_ok=True)
+        total_bytes -= size
+        logger.info(f"Evicted {data_file.stem} from the download cache")
+
+def key_lock(key):
+    """Return the lock that serializes loads of one cache key."""
+    with _key_locks_lock:
+        return _key_locks.setdefault(key, threading.Lock())
+
+def cached_import(dataset, season, loader, immutable=False):
+    """Return the nfl_data_py frame for (dataset, season), calling loader() on a cache miss.
+
+    Pass immutable=True for completed past seasons so they are never downloaded again.
+    """
+    with key_lock(cache_key(dataset, season)), stage(f"download_{dataset}") as timer:
+        frame = load_cached(dataset, season, loader, immutable)
+        timer['rows_out'] = len(frame) if frame is not None else 0
+    return frame
+
+def load_cached(dataset, season, loader, immutable):
+    """Read (dataset, season) from the cache or call loader() and cache its result."""
+    if not settings['enabled']:
+        return loader()
+
+    key = cache_key(dataset, season)
+    frame, meta = read_entry(key)
+    if frame is not None:
+        logger.info(f"Loaded {key} from the download cache ({len(frame)} rows)")
+        count('cache_hits')
+        return frame
+
+    if settings['offline']:
+        raise CacheMiss(f"{key} is not in the download cache at {settings['cache_dir']}")
+
+    if meta is not None:
+        logger.info(f"Cached {key} is older than the TTL, downloading again")
+
+    count('cache_misses')
+    frame = loader()
+    if frame is not None and not frame.empty:
+        write_entry(key, frame, immutable)
+    return frame
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Parlay Probability Engine
+
+Estimates the probability that every leg of a parlay hits, from nfl table game
+logs. A leg is (player_id, prop_type, line, side) where prop_type is one of
+the UI prop types in prop_summaries.PROP_STATS and side is "over" or "under".
+
+Legs in the same game are correlated (a QB's passing yards and his WR's
+receiving yards move together, and both offenses gain in a shootout), so
+their joint hit rate is measured directly over the past games where all of
+their players were on the field together. Legs in different games are
+treated as independent. When a group shares fewer than min_samples games,
+a Monte Carlo estimate that resamples whole game weeks stands in for the
+empirical joint rate.
+
+Either estimate is shrunk towards the product of the legs' individual hit
+rates with a beta prior worth DEFAULT_PRIOR_GAMES games per extra leg, so a
+group cannot look certain just because it happened to hit in the few games
+its players shared.
+
+Slips are scored in bulk: slips with the same shape are evaluated together
+as NumPy array operations, so thousands of candidate slips can be ranked per
+second.
+"""
+
+import logging
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from prop_summaries import PROP_STATS, fetch_game_logs
+
+logger = logging.getLogger(__name__)
+
+# Minimum shared games before a same-game group's empirical joint hit rate is trusted
+DEFAULT_MIN_SAMPLES = 8
+
+# Games of the independent estimate mixed into a group's joint hit rate, per leg after the first
+DEFAULT_PRIOR_GAMES = 10
+
+# Simulated weeks per Monte Carlo estimate
+DEFAULT_SIMULATIONS = 20000
+
+# nfl table columns the engine needs
+LOG_COLUMNS = ['player_id', 'team', 'opponent_team', 'season', 'week'] + sorted(
+    {col for columns in PROP_STATS.values() for col in columns}
+)
+
+def load_game_logs(supabase, seasons):
+    """Read the nfl table rows the engine needs for the given seasons."""
+    return fetch_game_logs(supabase, seasons, columns=LOG_COLUMNS)
+
+def build_leg_matrix(logs, legs, leg_games=None):
+    """Build the week-by-leg outcome matrix for a list of legs.
+
+    leg_games ({player_id: game_id}) names the game each player's legs are
+    bet on; legs in the same game are scored jointly. By default a player's
+    most recent game in the logs is used.
+
+    Returns a dict with:
+    - weeks: the (season, week) pairs in game order
+    - valid: (weeks x legs) bool, the player has a game log that week
+    - hit: (weeks x legs) bool, the leg hit that week (False when not valid)
+    - game: (weeks x legs) int, the game the leg's player played that week (-1 when not valid);
+      legs with the same code in a week were in the same game
+    - groups: game index per leg; legs sharing a group are scored jointly
+    - legs: the legs as passed in
+    """
+    leg_frame = pd.DataFrame(legs, columns=['player_id', 'prop_type', 'line', 'side'])
+    player_logs = logs[logs['player_id'].isin(leg_frame['player_id'].unique())]
+    player_logs = player_logs.sort_values(['season', 'week'], kind='stable')
+    weeks = pd.MultiIndex.from_frame(
+        logs[['season', 'week']].drop_duplicates().sort_values(['season', 'week'])
+    )
+
+    values = np.full((len(weeks), len(legs)), np.nan)
+    for prop_type, leg_index in leg_frame.groupby('prop_type').groups.items():
+        leg_positions = leg_index.to_numpy()
+        prop_values = pd.Series(
+            player_logs[PROP_STATS[prop_type]].fillna(0).sum(axis=1).to_numpy(),
+            index=pd.MultiIndex.from_frame(player_logs[['season', 'week', 'player_id']])
+        )
+        # Collapse the odd duplicate row so every (week, player) has one value
+        table = prop_values.groupby(level=[0, 1, 2]).sum().unstack('player_id').reindex(weeks)
+        table = table.reindex(columns=leg_frame.loc[leg_positions, 'player_id'])
+        values[:, leg_positions] = table.to_numpy(dtype=float)
+
+    # A game is its pair of teams, which is unique within a week
+    pairs = np.sort(player_logs[['team', 'opponent_team']].astype(str).to_numpy(), axis=1)
+    game_keys = pd.Series(pairs[:, 0], index=player_logs.index) + '-' + pairs[:, 1]
+    game_codes, _ = pd.factorize(game_keys)
+    player_games = pd.Series(game_codes, index=pd.MultiIndex.from_frame(player_logs[['season', 'week', 'player_id']]))
+    player_games = player_games.groupby(level=[0, 1, 2]).first().unstack('player_id').reindex(weeks)
+    game = player_games.reindex(columns=leg_frame['player_id']).fillna(-1).to_numpy(dtype=int)
+
+    lines = leg_frame['line'].to_numpy(dtype=float)
+    over = (leg_frame['side'] == 'over').to_numpy()
+    valid = ~np.isnan(values)
+    with np.errstate(invalid='ignore'):
+        hit = np.where(over, values > lines, values < lines) & valid
+
+    # Group legs by game, so both sides of a game share a group
+    if leg_games is None:
+        leg_games = (
+            player_logs['season'].astype(str) + '_' + player_logs['week'].astype(str) + '_' + game_keys
+        ).groupby(player_logs['player_id']).last()
+    groups, _ = pd.factorize(leg_frame['player_id'].map(leg_games))
+
+    return {
+        'weeks': list(weeks),
+        'valid': valid,
+        'hit': hit,
+        'game': game,
+        'groups': groups,
+        'legs': list(legs)
+    }
+
+def leg_hit_rates(matrix):
+    """Return each leg's individual hit rate (NaN for legs without any games)."""
+    games = matrix['valid'].sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return matrix['hit'].sum(axis=0) / games
+
+def monte_carlo_groups(matrix, group_legs, n_sims=DEFAULT_SIMULATIONS, rng=None, chunk_size=256):
+    """Estimate the joint hit rate of many groups of correlated legs by resampling whole game weeks.
+
+    group_legs is a (groups x legs) array of leg indices. Every group is scored
+    on the same sampled weeks, drawn from the weeks where any leg in the matrix
+    played. A leg whose player sat out a sampled week gets an outcome drawn
+    from that leg's own games, so sparse overlap still produces an estimate.
+    Groups with a leg that never played get NaN.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    valid = matrix['valid']
+    hit = matrix['hit']
+
+    played_weeks = np.flatnonzero(valid.any(axis=1))
+    estimates = np.full(len(group_legs), np.nan)
+    if len(played_weeks) == 0 or len(group_legs) == 0:
+        return estimates
+
+    draws = rng.choice(played_weeks, size=n_sims)
+    sim_valid = valid[draws]
+    sim_hit = hit[draws]
+    # One outcome per simulated week and leg from the leg's own games, used when the player sat out
+    own_hit = np.zeros_like(sim_hit)
+    for j in np.unique(group_legs):
+        own_outcomes = hit[valid[:, j], j]
+        if len(own_outcomes):
+            own_hit[:, j] = rng.choice(own_outcomes, size=n_sims)
+
+    playable = valid.any(axis=0)[group_legs].all(axis=1)
+    for start in range(0, len(group_legs), chunk_size):
+        chunk = group_legs[start:start + chunk_size]
+        # (simulated weeks x groups x legs in group)
+        outcomes = np.where(sim_valid[:, chunk], sim_hit[:, chunk], own_hit[:, chunk])
+        estimates[start:start + chunk_size] = outcomes.all(axis=2).mean(axis=0)
+    estimates[~playable] = np.nan
+    return estimates
+
+def lower_bound(p, n, z):
+    """Return z standard deviations below the mean of a Beta posterior for rate p over n games, floored at 0.
+
+    The posterior has a uniform prior, so a leg that hit in every game still gets a bound below 1.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = (p * n + 1) / (n + 2)
+        return np.maximum(mean - z * np.sqrt(mean * (1 - mean) / (n + 3)), 0)
+
+def slip_shape(groups):
+    """Canonicalize leg groups so slips like (KC, KC, BUF) and (SF, SF, DAL) share a shape."""
+    labels = {}
+    return tuple(labels.setdefault(group, len(labels)) for group in groups)
+
+def score_slips(matrix, slips, min_samples=DEFAULT_MIN_SAMPLES, prior_games=DEFAULT_PRIOR_GAMES,
+                n_sims=DEFAULT_SIMULATIONS, seed=0, z=None):
+    """Score many slips at once and return an array of joint hit probabilities.
+
+    Each slip is a sequence of leg indices into the matrix. Slips are bucketed
+    by shape, and within a bucket each same-game group is scored as array
+    operations over (weeks x slips x legs).
+
+    With z, also return a conservative lower bound per slip for ranking: each
+    group's estimate less z standard deviations for the games behind it,
+    multiplied across groups. Returns (probabilities, lower bounds) then.
+    """
+    rng = np.random.default_rng(seed)
+    valid = matrix['valid']
+    hit = matrix['hit']
+    game = matrix['game']
+    groups = matrix['groups']
+    rates = leg_hit_rates(matrix)
+    games = valid.sum(axis=0)
+
+    buckets = defaultdict(list)
+    for position, slip in enumerate(slips):
+        # Order legs by group so each group is a contiguous run of columns
+        slip = sorted(slip, key=lambda leg: groups[leg])
+        buckets[slip_shape(groups[slip])].append((position, slip))
+
+    probabilities = np.ones(len(slips))
+    lower_bounds = np.ones(len(slips))
+    for shape, entries in buckets.items():
+        positions = np.array([position for position, _ in entries])
+        legs = np.array([slip for _, slip in entries])
+        shape = np.array(shape)
+
+        for group in range(shape.max() + 1):
+            group_legs = legs[:, shape == group]
+            if group_legs.shape[1] == 1:
+                probabilities[positions] *= rates[group_legs[:, 0]]
+                if z is not None:
+                    lower_bounds[positions] *= lower_bound(rates[group_legs[:, 0]], games[group_legs[:, 0]], z)
+                continue
+
+            # (weeks x slips x legs in group); a shared game has every player on the field in the same game
+            group_games = game[:, group_legs]
+            same_game = (group_games == group_games[:, :, :1]).all(axis=2)
+            all_played = valid[:, group_legs].all(axis=2) & same_game
+            all_hit = hit[:, group_legs].all(axis=2) & same_game
+            shared = all_played.sum(axis=0)
+            hits = all_hit.sum(axis=0)
+
+            # Too little shared history for the empirical joint rate: estimate it with Monte Carlo instead,
+            # weighted by the games of the leg with the shortest history since that bounds what it knows
+            with np.errstate(invalid='ignore', divide='ignore'):
+                joint = hits / shared
+            sparse = shared < min_samples
+            weight = np.where(sparse, games[group_legs].min(axis=1), shared)
+            simulate = sparse & (weight > 0)
+            joint[simulate] = monte_carlo_groups(matrix, group_legs[simulate], n_sims=n_sims, rng=rng)
+            weight[~np.isfinite(joint)] = 0
+
+            # Shrink towards independence with a prior that grows with the legs in the group
+            independent = np.prod(rates[group_legs], axis=1)
+            prior = prior_games * (group_legs.shape[1] - 1)
+            group_p = (weight * np.nan_to_num(joint) + prior * independent) / (weight + prior)
+
+            probabilities[positions] *= group_p
+            if z is not None:
+                lower_bounds[positions] *= lower_bound(group_p, weight + prior, z)
+
+    if z is not None:
+        return probabilities, lower_bounds
+    return probabilities
+
+def independent_probabilities(matrix, slips):
+    """Return the naive product of individual leg hit rates for each slip."""
+    rates = leg_hit_rates(matrix)
+    return np.array([np.prod(rates[list(slip)]) for slip in slips])
+
+def score_parlay(logs, legs, leg_games=None, **options):
+    """Estimate one parlay's joint hit probability directly from game logs.
+
+    Returns (joint probability, independent probability), where the second
+    ignores same-game correlation like the betslip's per-leg hit rates do.
+    """
+    matrix = build_leg_matrix(logs, legs, leg_games)
+    slip = [list(range(len(legs)))]
+    return score_slips(matrix, slip, **options)[0], independent_probabilities(matrix, slip)[0]
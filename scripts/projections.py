@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Opponent-Adjusted Projections
+
+Projects every active player's next game for each prop type the player page
+offers, so the UI can default a prop's line from nfl_projections instead of
+a raw season average.
+
+- Baseline: the player's recency-weighted average, counting games where the
+  player recorded the stat (value > 0) like the UI does, with each game's
+  weight halving every HALF_LIFE_GAMES games back
+- Defense vs position: what each defense allows per game to each position,
+  recency-weighted by week and shrunk towards the league average, as a factor
+  of that average (1.2 = allows 20% more than average)
+- Projection: the baseline scaled by OPPONENT_WEIGHT of the next opponent's
+  defense-vs-position factor; the default line rounds it down to x.5
+
+Every step is a grouped pandas/NumPy operation over the whole league.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from prop_summaries import PROP_STATS, POSITION_PROPS, fetch_game_logs
+from upsert_engine import upsert_records
+
+logger = logging.getLogger(__name__)
+
+# A player's game weight halves every this many games back
+HALF_LIFE_GAMES = 5
+
+# A defense's game weight halves every this many weeks back
+DVP_HALF_LIFE_WEEKS = 8
+
+# League-average games added to every defense's allowances, so a few games do not make an outlier
+DVP_PRIOR_GAMES = 6
+
+# Share of the defense-vs-position adjustment applied to the baseline
+OPPONENT_WEIGHT = 0.5
+
+PROJECTION_CONFLICT_KEY = 'player_id,season,week,prop_type'
+
+LOG_COLUMNS = ['player_id', 'season', 'week', 'position', 'team', 'opponent_team'] + sorted(
+    {col for cols in PROP_STATS.values() for col in cols}
+)
+
+def build_values(logs):
+    """Melt game logs into one row per (player game, prop type) with its value and weeks before the latest week."""
+    logs = logs[logs['position'].isin(list(POSITION_PROPS))]
+    logs = logs.sort_values(['season', 'week'], kind='stable')
+    # Dense game-week order across seasons, 0 for the latest week
+    week_order = (logs['season'] * 100 + logs['week']).rank(method='dense').to_numpy()
+    weeks_back = week_order.max() - week_order if len(logs) else week_order
+
+    frames = []
+    for prop_type, columns in PROP_STATS.items():
+        frames.append(pd.DataFrame({
+            'player_id': logs['player_id'].to_numpy(),
+            'season': logs['season'].to_numpy(),
+            'week': logs['week'].to_numpy(),
+            'position': logs['position'].to_numpy(),
+            'team': logs['team'].to_numpy(),
+            'opponent_team': logs['opponent_team'].to_numpy(),
+            'weeks_back': weeks_back,
+            'prop_type': prop_type,
+            'value': logs[columns].fillna(0).sum(axis=1).to_numpy()
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+def defense_vs_position(values):
+    """Return each defense's allowance factor per (opponent_team, position, prop_type).
+
+    Per game totals allowed to a position are recency-weighted and shrunk
+    towards the league's weighted average with DVP_PRIOR_GAMES games.
+    """
+    games = (
+        values.groupby(['opponent_team', 'position', 'prop_type', 'season', 'week'], observed=True)
+        .agg(allowed=('value', 'sum'), weeks_back=('weeks_back', 'first'))
+        .reset_index()
+    )
+    games['weight'] = 0.5 ** (games['weeks_back'] / DVP_HALF_LIFE_WEEKS)
+    games['weighted'] = games['weight'] * games['allowed']
+
+    league = games.groupby(['position', 'prop_type'])[['weighted', 'weight']].sum()
+    league_average = (league['weighted'] / league['weight']).rename('league_average')
+
+    defense = games.groupby(['opponent_team', 'position', 'prop_type'])[['weighted', 'weight']].sum().reset_index()
+    defense = defense.join(league_average, on=['position', 'prop_type'])
+    shrunk = (defense['weighted'] + DVP_PRIOR_GAMES * defense['league_average']) / (defense['weight'] + DVP_PRIOR_GAMES)
+    defense['factor'] = np.where(defense['league_average'] > 0, shrunk / defense['league_average'], 1.0)
+    return defense[['opponent_team', 'position', 'prop_type', 'factor']]
+
+def player_baselines(values):
+    """Return each player's recency-weighted average per prop type over the games they recorded the stat."""
+    recorded = values[values['value'] > 0].copy()
+    # Values are in game order, so count games back from each player's most recent one
+    games_back = recorded.groupby(['player_id', 'prop_type'], sort=False).cumcount(ascending=False)
+    recorded['weight'] = 0.5 ** (games_back / HALF_LIFE_GAMES)
+    recorded['weighted'] = recorded['weight'] * recorded['value']
+
+    baselines = recorded.groupby(['player_id', 'prop_type']).agg(
+        games=('value', 'size'), weighted=('weighted', 'sum'), weight=('weight', 'sum')
+    ).reset_index()
+    baselines['baseline'] = baselines['weighted'] / baselines['weight']
+    return baselines[['player_id', 'prop_type', 'games', 'baseline']]
+
+def next_opponents(schedule_data):
+    """Return each team's next unplayed game as a frame of team, week and opponent_team."""
+    unplayed = schedule_data[schedule_data['home_score'].isna()]
+    sides = pd.concat([
+        pd.DataFrame({'team': unplayed['home_team'], 'week': unplayed['week'], 'opponent_team': unplayed['away_team']}),
+        pd.DataFrame({'team': unplayed['away_team'], 'week': unplayed['week'], 'opponent_team': unplayed['home_team']})
+    ])
+    return sides.sort_values('week', kind='stable').drop_duplicates('team')
+
+def build_projections(logs, schedule_data, season):
+    """Build one nfl_projections record per (player, prop type) for each player's next game this season."""
+    values = build_values(logs)
+    if values.empty:
+        return []
+
+    # Players project for their team in their most recent game of the season
+    current = values[values['season'] == season]
+    players = current.drop_duplicates('player_id', keep='last')[['player_id', 'position', 'team']]
+    players = players.merge(next_opponents(schedule_data), on='team')
+    offered = pd.DataFrame(
+        [(position, prop_type) for position, prop_types in POSITION_PROPS.items() for prop_type in prop_types],
+        columns=['position', 'prop_type']
+    )
+    projections = players.merge(offered, on='position').merge(player_baselines(values), on=['player_id', 'prop_type'])
+    projections = projections.merge(
+        defense_vs_position(values), on=['opponent_team', 'position', 'prop_type'], how='left'
+    )
+    projections['factor'] = projections['factor'].fillna(1.0)
+    projections['projection'] = projections['baseline'] * (1 + OPPONENT_WEIGHT * (projections['factor'] - 1))
+    projections['line'] = np.floor(projections['projection']) + 0.5
+
+    return [
+        {
+            'player_id': row.player_id,
+            'season': int(season),
+            'week': int(row.week),
+            'prop_type': row.prop_type,
+            'team': row.team,
+            'opponent_team': row.opponent_team,
+            'games': int(row.games),
+            'baseline': round(float(row.baseline), 2),
+            'dvp_factor': round(float(row.factor), 3),
+            'projection': round(float(row.projection), 2),
+            'line': float(row.line)
+        }
+        for row in projections.itertuples(index=False)
+    ]
+
+def refresh_projections(supabase, season, schedule_data, previous_seasons=1, **upsert_options):
+    """Recompute next-game projections from the nfl table and upsert them into nfl_projections."""
+    if schedule_data is None:
+        logger.warning(f"No schedule for {season}, skipping projections")
+        return None
+
+    seasons = list(range(season - previous_seasons, season + 1))
+    logs = fetch_game_logs(supabase, seasons, columns=LOG_COLUMNS)
+    if logs.empty:
+        logger.warning(f"No game logs found for {seasons}, skipping projections")
+        return None
+
+    records = build_projections(logs, schedule_data, season)
+    if not records:
+        logger.info(f"No upcoming games in {season}, skipping projections")
+        return None
+
+    logger.info(f"Built {len(records)} projections for {season}")
+    return upsert_records(supabase, 'nfl_projections', records, on_conflict=PROJECTION_CONFLICT_KEY,
+                          **upsert_options)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Player Prop Summaries
+
+Precomputes the per-player, per-prop numbers the betslip shows (average,
+median, high, low and hit rates at every half-point line) so the UI and API
+can read one row from the nfl_prop_summaries table instead of aggregating
+game logs in the browser.
+
+Summaries follow the UI's rules: only games where the player recorded the
+stat (value > 0) count, L5/L10/L20 are the last games of the current season,
+and the median is the upper median.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from upsert_engine import upsert_records
+
+logger = logging.getLogger(__name__)
+
+# UI prop types and the nfl table columns they add up
+PROP_STATS = {
+    'passing_yards': ['passing_yards'],
+    'passing_td': ['passing_tds'],
+    'completions': ['completions'],
+    'attempts': ['attempts'],
+    'interceptions': ['interceptions'],
+    'sacks': ['sacks'],
+    'rushing_yards': ['rushing_yards'],
+    'rushing_td': ['rushing_tds'],
+    'rushing_attempts': ['carries'],
+    'receiving_yards': ['receiving_yards'],
+    'receiving_td': ['receiving_tds'],
+    'receptions': ['receptions'],
+    'targets': ['targets'],
+    'total_yards': ['passing_yards', 'rushing_yards'],
+    'total_td': ['passing_tds', 'rushing_tds']
+}
+
+# Prop types offered on the player page for each position (see player-props.tsx)
+POSITION_PROPS = {
+    'QB': ['passing_yards', 'passing_td', 'rushing_yards', 'rushing_td', 'completions', 'attempts',
+           'interceptions', 'sacks', 'total_yards', 'total_td'],
+    'RB': ['rushing_yards', 'rushing_td', 'rushing_attempts', 'receiving_yards', 'receiving_td',
+           'receptions', 'total_yards', 'total_td'],
+    'WR': ['receiving_yards', 'receiving_td', 'receptions', 'targets'],
+    'TE': ['receiving_yards', 'receiving_td', 'receptions', 'targets']
+}
+
+# "Last N games" time frames
+RECENT_GAMES = [5, 10, 20]
+
+SUMMARY_CONFLICT_KEY = 'player_id,season,prop_type'
+
+def build_prop_values(logs):
+    """Melt game logs into one row per (player, game, prop type) holding the prop value."""
+    logs = logs.sort_values(['season', 'week'], kind='stable')
+    frames = []
+    for prop_type, columns in PROP_STATS.items():
+        frames.append(pd.DataFrame({
+            'player_id': logs['player_id'].to_numpy(),
+            'season': logs['season'].to_numpy(),
+            'prop_type': prop_type,
+            'value': logs[columns].fillna(0).sum(axis=1).to_numpy().astype(int)
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+def summarize_prop(player_ids, values):
+    """Summarize one prop type for every player with a single value histogram.
+
+    Returns a frame with games, mean, median, min, max and over_hits, where
+    over_hits[k] is the number of games over the line k + 0.5.
+    """
+    codes, players = pd.factorize(player_ids)
+    histogram = np.zeros((len(players), values.max() + 2), dtype=np.int32)
+    np.add.at(histogram, (codes, values), 1)
+
+    games = histogram.sum(axis=1)
+    cumulative = histogram.cumsum(axis=1)
+    at_least = games[:, None] - cumulative + histogram
+    value_range = np.arange(histogram.shape[1])
+    present = histogram > 0
+
+    low = present.argmax(axis=1)
+    high = histogram.shape[1] - 1 - present[:, ::-1].argmax(axis=1)
+    mean = (histogram * value_range).sum(axis=1) / games
+    median = (cumulative > (games // 2)[:, None]).argmax(axis=1)
+
+    # Lines 0.5 .. high + 0.5; at_least[:, k + 1] counts the games over line k + 0.5
+    over_hits = [at_least[i, 1:high[i] + 2].tolist() for i in range(len(players))]
+
+    return pd.DataFrame({
+        'player_id': players,
+        'games': games,
+        'mean': mean.round(2),
+        'median': median,
+        'min': low,
+        'max': high,
+        'over_hits': over_hits
+    })
+
+def summarize_time_frame(values, time_frame):
+    """Summarize every prop type over one time frame's rows."""
+    summaries = []
+    for prop_type, prop_values in values.groupby('prop_type', sort=False):
+        summary = summarize_prop(prop_values['player_id'].to_numpy(), prop_values['value'].to_numpy())
+        summary['prop_type'] = prop_type
+        summaries.append(summary)
+
+    if not summaries:
+        return pd.DataFrame()
+    summary = pd.concat(summaries, ignore_index=True)
+    summary['time_frame'] = time_frame
+    return summary
+
+def time_frames(values, season):
+    """Yield (name, rows) for L5/L10/L20 of the current season and each full season.
+
+    Like the UI, the last N games are taken first and games where the player
+    did not record the stat (value 0) are dropped afterwards.
+    """
+    current = values[values['season'] == season]
+    # Values are in game order, so count games back from the most recent one
+    games_back = current.groupby(['player_id', 'prop_type'], sort=False).cumcount(ascending=False)
+    for n in RECENT_GAMES:
+        recent = current[games_back < n]
+        yield f"L{n}", recent[recent['value'] > 0]
+
+    for frame_season in sorted(values['season'].unique(), reverse=True):
+        yield str(frame_season), values[(values['season'] == frame_season) & (values['value'] > 0)]
+
+def build_prop_summaries(logs, season):
+    """Build one nfl_prop_summaries record per (player, prop type) from nfl table rows."""
+    values = build_prop_values(logs)
+    frames = [summarize_time_frame(rows, name) for name, rows in time_frames(values, season)]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return []
+    summary = pd.concat(frames, ignore_index=True)
+
+    records = {}
+    for row in summary.itertuples(index=False):
+        key = (row.player_id, row.prop_type)
+        record = records.setdefault(key, {
+            'player_id': row.player_id,
+            'season': int(season),
+            'prop_type': row.prop_type,
+            'games': 0,
+            'mean': None,
+            'median': None,
+            'min': None,
+            'max': None,
+            'last_5_avg': None,
+            'last_10_avg': None,
+            'last_20_avg': None,
+            'hit_curves': {}
+        })
+        record['hit_curves'][row.time_frame] = {
+            'games': int(row.games),
+            'mean': float(row.mean),
+            'median': int(row.median),
+            'min': int(row.min),
+            'max': int(row.max),
+            'over_hits': row.over_hits
+        }
+        if row.time_frame == str(season):
+            record.update(games=int(row.games), mean=float(row.mean), median=int(row.median),
+                          min=int(row.min), max=int(row.max))
+        elif row.time_frame.startswith('L'):
+            record[f"last_{row.time_frame[1:]}_avg"] = float(row.mean)
+
+    return list(records.values())
+
+def fetch_game_logs(supabase, seasons, columns=None, page_size=1000):
+    """Read nfl table rows for the given seasons (None for every season), one page at a time.
+
+    Defaults to the columns needed for summaries.
+    """
+    if columns is None:
+        columns = ['player_id', 'season', 'week'] + sorted({col for cols in PROP_STATS.values() for col in cols})
+    select = ','.join(columns)
+
+    rows = []
+    start = 0
+    while True:
+        query = supabase.table('nfl').select(select)
+        if seasons is not None:
+            query = query.in_('season', seasons)
+        result = query.order('id').range(start, start + page_size - 1).execute()
+        rows.extend(result.data)
+        if len(result.data) < page_size:
+            break
+        start += page_size
+
+    logger.info(f"Fetched {len(rows)} game logs for seasons {seasons or 'all'}")
+    return pd.DataFrame(rows)
+
+def refresh_prop_summaries(supabase, season, previous_seasons=1, **upsert_options):
+    """Recompute prop summaries from the nfl table and upsert them into nfl_prop_summaries."""
+    seasons = list(range(season - previous_seasons, season + 1))
+    logs = fetch_game_logs(supabase, seasons)
+    if logs.empty:
+        logger.warning(f"No game logs found for {seasons}, skipping prop summaries")
+        return None
+
+    records = build_prop_summaries(logs, season)
+    logger.info(f"Built {len(records)} prop summaries for {season}")
+    return upsert_records(supabase, 'nfl_prop_summaries', records, on_conflict=SUMMARY_CONFLICT_KEY,
+                          **upsert_options)
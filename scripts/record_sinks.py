@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Record Sinks
+
+Destinations for the batches of records produced by the streaming ingestion
+pipeline in update_nfl_stats.py. A sink is a generator that is sent one batch
+(a list of record dicts) at a time and finishes when it is sent None,
+returning a summary dict:
+
+    sink = csv_sink(path)
+    next(sink)
+    sink.send(batch)
+    ...
+    summary = finish_sink(sink)
+
+run_pipeline drives any number of sinks from one stream of batches, so each
+batch is written everywhere before the next one is built and memory stays flat.
+
+postgres_sink needs psycopg (3.x), which is only imported when it is used.
+"""
+
+import io
+import csv
+import queue
+import sqlite3
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from upsert_engine import upsert_records
+from instrumentation import stage
+
+logger = logging.getLogger(__name__)
+
+def finish_sink(sink):
+    """Signal the end of the stream to a sink and return its summary."""
+    try:
+        sink.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Sink did not finish at the end of the stream")
+
+def run_pipeline(batches, sinks):
+    """Send every batch to every sink and return each sink's summary by name."""
+    for sink in sinks.values():
+        next(sink)
+
+    try:
+        for batch in batches:
+            for sink in sinks.values():
+                sink.send(batch)
+    except BaseException:
+        for sink in sinks.values():
+            sink.close()
+        raise
+
+    return {name: finish_sink(sink) for name, sink in sinks.items()}
+
+def supabase_sink(client, table_name, on_conflict, **upsert_options):
+    """Upsert batches with upsert_records, which runs in a background thread fed through a small queue.
+
+    Extra keyword arguments (batch_size, workers, max_retries, dead_letter_file)
+    are passed through to upsert_records. Returns its summary.
+    """
+    pending = queue.Queue(maxsize=2)
+    records = (record for batch in iter(pending.get, None) for record in batch)
+
+    def put(item, future):
+        # Never block forever on a full queue if the upsert thread has died
+        while True:
+            try:
+                pending.put(item, timeout=1)
+                return
+            except queue.Full:
+                if future.done():
+                    future.result()
+                    return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(upsert_records, client, table_name, records, on_conflict, **upsert_options)
+        try:
+            while True:
+                batch = yield
+                if batch is None:
+                    break
+                put(batch, future)
+        finally:
+            put(None, future)
+
+    return future.result()
+
+def csv_sink(path):
+    """Append batches to a CSV backup file as they arrive. The file is only created once a batch arrives."""
+    f = None
+    rows = 0
+    try:
+        while True:
+            batch = yield
+            if batch is None:
+                break
+            with stage('backup_write', rows_in=len(batch)) as timer:
+                if f is None:
+                    f = open(path, 'w', newline='')
+                    writer = csv.DictWriter(f, fieldnames=list(batch[0]))
+                    writer.writeheader()
+                written = f.tell()
+                writer.writerows(batch)
+                timer.update(rows_out=len(batch), bytes=f.tell() - written)
+            rows += len(batch)
+    finally:
+        if f is not None:
+            f.close()
+
+    if rows:
+        logger.info(f"Saved backup file: {path} ({rows} records)")
+    return {'rows_written': rows, 'path': str(path)}
+
+def sqlite_sink(path, table_name, conflict_columns):
+    """Upsert batches into a local SQLite table, a stand-in for the Supabase table.
+
+    The table and a unique index on conflict_columns are created from the
+    first batch's fields if they do not exist yet.
+    """
+    connection = sqlite3.connect(path)
+    statement = None
+    rows = 0
+    try:
+        while True:
+            batch = yield
+            if batch is None:
+                break
+
+            if statement is None:
+                columns = list(batch[0])
+                column_list = ', '.join(columns)
+                conflict_list = ', '.join(conflict_columns)
+                updates = ', '.join(f"{col} = excluded.{col}" for col in columns if col not in conflict_columns)
+                connection.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({column_list})")
+                connection.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_conflict_key ON {table_name} ({conflict_list})"
+                )
+                statement = (
+                    f"INSERT INTO {table_name} ({column_list}) VALUES ({', '.join('?' * len(columns))}) "
+                    f"ON CONFLICT ({conflict_list}) DO UPDATE SET {updates}"
+                )
+
+            with stage('sqlite_upsert', rows_in=len(batch)) as timer:
+                connection.executemany(statement, [tuple(record[col] for col in columns) for record in batch])
+                connection.commit()
+                timer['rows_out'] = len(batch)
+            rows += len(batch)
+    finally:
+        connection.close()
+
+    logger.info(f"Upserted {rows} records into {table_name} in {path}")
+    return {'rows_written': rows, 'path': str(path)}
+
+def copy_field(value):
+    """Format a value for COPY's text format: None as \\N, with backslashes, tabs and newlines escaped."""
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def secondary_indexes(cursor, table_name):
+    """Return (name, definition) of a table's indexes that are neither unique nor the primary key."""
+    cursor.execute(
+        "SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid JOIN pg_class t ON t.oid = x.indrelid "
+        "WHERE t.relname = %s AND NOT x.indisunique AND NOT x.indisprimary",
+        (table_name,)
+    )
+    return cursor.fetchall()
+
+def drop_secondary_indexes(cursor, table_name):
+    """Drop a table's secondary indexes and return their (name, definition) so they can be recreated."""
+    indexes = secondary_indexes(cursor, table_name)
+    for name, definition in indexes:
+        # Logged so an index can be recreated by hand if the load dies before it is restored
+        logger.info(f"Dropping index {name}: {definition}")
+        cursor.execute(f"DROP INDEX {name}")
+    return indexes
+
+def create_indexes(cursor, indexes):
+    """Recreate indexes returned by drop_secondary_indexes."""
+    with stage('postgres_reindex'):
+        for name, definition in indexes:
+            cursor.execute(definition)
+
+@contextmanager
+def secondary_indexes_dropped(dsn, table_name):
+    """Drop a table's secondary indexes for the duration of a bulk load spanning several postgres_sink runs.
+
+    The indexes are recreated on exit, also when the load fails. Yields their (name, definition).
+    """
+    import psycopg
+
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        indexes = drop_secondary_indexes(connection.cursor(), table_name)
+        logger.info(f"Dropped {len(indexes)} secondary indexes on {table_name}")
+    try:
+        yield indexes
+    finally:
+        with psycopg.connect(dsn, autocommit=True) as connection:
+            create_indexes(connection.cursor(), indexes)
+        logger.info(f"Recreated {len(indexes)} secondary indexes on {table_name}")
+
+def postgres_sink(dsn, table_name, conflict_columns, drop_indexes=False):
+    """Bulk load batches into a Postgres table: COPY into a staging table, then one INSERT ... ON CONFLICT.
+
+    Each batch is written to an in-memory text buffer and copied into a
+    temporary staging table. At the end of the stream the staging rows are
+    merged into table_name in a single statement (the last row wins when a
+    key repeats), inside the same transaction. With drop_indexes=True the
+    table's secondary indexes are dropped before the merge and recreated
+    after it, which is faster for large backfills; the unique index on
+    conflict_columns is always kept. To keep the indexes dropped across
+    several sinks, wrap them in secondary_indexes_dropped instead.
+    """
+    import psycopg
+
+    staging_table = f"{table_name}_staging"
+    connection = psycopg.connect(dsn)
+    columns = None
+    rows = 0
+    try:
+        with connection.cursor() as cursor:
+            while True:
+                batch = yield
+                if batch is None:
+                    break
+
+                if columns is None:
+                    columns = list(batch[0])
+                    column_list = ', '.join(columns)
+                    cursor.execute(
+                        f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS "
+                        f"SELECT {column_list} FROM {table_name} WITH NO DATA"
+                    )
+                    copy_statement = f"COPY {staging_table} ({column_list}) FROM STDIN"
+
+                with stage('postgres_copy', rows_in=len(batch)) as timer:
+                    buffer = io.StringIO()
+                    for record in batch:
+                        buffer.write('\t'.join(copy_field(record[col]) for col in columns) + '\n')
+                    with cursor.copy(copy_statement) as copy:
+                        copy.write(buffer.getvalue())
+                    timer.update(rows_out=len(batch), bytes=buffer.tell())
+                rows += len(batch)
+
+            merged = 0
+            indexes = []
+            if columns is not None:
+                if drop_indexes:
+                    indexes = drop_secondary_indexes(cursor, table_name)
+                    logger.info(f"Dropped {len(indexes)} secondary indexes on {table_name}")
+
+                conflict_list = ', '.join(conflict_columns)
+                updates = ', '.join(f"{col} = EXCLUDED.{col}" for col in columns if col not in conflict_columns)
+                with stage('postgres_merge', rows_in=rows) as timer:
+                    cursor.execute(
+                        f"INSERT INTO {table_name} ({column_list}) "
+                        f"SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {staging_table} "
+                        f"ORDER BY {conflict_list}, ctid DESC "
+                        f"ON CONFLICT ({conflict_list}) DO UPDATE SET {updates}"
+                    )
+                    merged = cursor.rowcount
+                    timer['rows_out'] = merged
+
+                if indexes:
+                    create_indexes(cursor, indexes)
+                    logger.info(f"Recreated {len(indexes)} secondary indexes on {table_name}")
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    logger.info(f"Copied {rows} records into {table_name} and merged {merged}")
+    return {'rows_written': rows, 'rows_merged': merged, 'rebuilt_indexes': len(indexes)}
@@ -75,6 +75,73 @@ CREATE TRIGGER update_nfl_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Create the nfl_prop_summaries table (precomputed by scripts/prop_summaries.py after each ingestion)
+CREATE TABLE IF NOT EXISTS nfl_prop_summaries (
+    id SERIAL PRIMARY KEY,
+    player_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    prop_type TEXT NOT NULL,
+    
+    -- Current season summary (games where the player recorded the stat)
+    games INTEGER DEFAULT 0,
+    mean DECIMAL(6,2),
+    median INTEGER,
+    min INTEGER,
+    max INTEGER,
+    last_5_avg DECIMAL(6,2),
+    last_10_avg DECIMAL(6,2),
+    last_20_avg DECIMAL(6,2),
+    
+    -- Per time frame (L5, L10, L20, <season>): games, mean, median, min, max and
+    -- over_hits, where over_hits[k] is the number of games over the line k + 0.5
+    hit_curves JSONB,
+    
+    -- Metadata
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_nfl_prop_summaries_unique ON nfl_prop_summaries (player_id, season, prop_type);
+
+DROP TRIGGER IF EXISTS update_nfl_prop_summaries_updated_at ON nfl_prop_summaries;
+CREATE TRIGGER update_nfl_prop_summaries_updated_at
+    BEFORE UPDATE ON nfl_prop_summaries
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Create the nfl_projections table (opponent-adjusted next-game projections from scripts/projections.py)
+CREATE TABLE IF NOT EXISTS nfl_projections (
+    id SERIAL PRIMARY KEY,
+    player_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    prop_type TEXT NOT NULL,
+    team TEXT,
+    opponent_team TEXT,
+    
+    -- Games the baseline is averaged over (games where the player recorded the stat)
+    games INTEGER DEFAULT 0,
+    -- Recency-weighted average
+    baseline DECIMAL(6,2),
+    -- Opponent's defense-vs-position allowance as a factor of the league average
+    dvp_factor DECIMAL(5,3),
+    projection DECIMAL(6,2),
+    -- Default line: the projection rounded down to x.5
+    line DECIMAL(6,1),
+    
+    -- Metadata
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_nfl_projections_unique ON nfl_projections (player_id, season, week, prop_type);
+
+DROP TRIGGER IF EXISTS update_nfl_projections_updated_at ON nfl_projections;
+CREATE TRIGGER update_nfl_projections_updated_at
+    BEFORE UPDATE ON nfl_projections
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
 -- Verify the table was created
 SELECT 
     column_name, 
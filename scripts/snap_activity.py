@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Snap Count Activity Filter
+
+Decides which rostered offensive players are active from their season
+offensive snap totals.
+
+- Players are matched on their Pro Football Reference id (rosters.pfr_id ==
+  snap_counts.pfr_player_id), falling back to the nflverse id crosswalk for
+  roster rows without one, so players who share a name are never merged
+- Thresholds are set per position
+- Snap totals are kept per season in .nfl_snap_totals.json together with the
+  games already counted, so each run only adds the games played since the last
+  one instead of regrouping the whole season
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import pandas as pd
+import nfl_data_py as nfl
+
+from nfl_cache import cached_import
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOTALS_FILE = Path(__file__).parent / ".nfl_snap_totals.json"
+
+# Minimum season offensive snaps to count as active, per roster position
+DEFAULT_MIN_SNAPS = {
+    'QB': 50,
+    'RB': 50,
+    'WR': 50,
+    'TE': 50
+}
+
+def parse_min_snaps(value):
+    """Parse "QB=100,RB=40" (or a single number for every position) into a thresholds dict."""
+    if '=' not in value:
+        return dict.fromkeys(DEFAULT_MIN_SNAPS, int(value))
+
+    thresholds = dict(DEFAULT_MIN_SNAPS)
+    for item in value.split(','):
+        position, snaps = item.split('=')
+        thresholds[position.strip().upper()] = int(snaps)
+    return thresholds
+
+def load_snap_totals(season, totals_file=DEFAULT_TOTALS_FILE):
+    """Return (games already counted, snaps by pfr id) for a season."""
+    if not totals_file.exists():
+        return set(), pd.Series(dtype='int64')
+
+    with open(totals_file) as f:
+        entry = json.load(f).get(str(season))
+    if entry is None:
+        return set(), pd.Series(dtype='int64')
+    return set(entry['games']), pd.Series(entry['snaps'], dtype='int64')
+
+def save_snap_totals(season, games, totals, totals_file=DEFAULT_TOTALS_FILE):
+    """Store a season's snap totals, replacing the previous file atomically."""
+    seasons = {}
+    if totals_file.exists():
+        with open(totals_file) as f:
+            seasons = json.load(f)
+
+    seasons[str(season)] = {
+        'games': sorted(games),
+        'snaps': {pfr_id: int(snaps) for pfr_id, snaps in totals.items()}
+    }
+    temp_file = totals_file.with_suffix('.tmp')
+    with open(temp_file, 'w') as f:
+        json.dump(seasons, f)
+    temp_file.replace(totals_file)
+
+def update_snap_totals(season, snaps_data, totals_file=DEFAULT_TOTALS_FILE):
+    """Add the offensive snaps of games not counted yet to a season's totals and return them by pfr id."""
+    games, totals = load_snap_totals(season, totals_file)
+
+    new_snaps = snaps_data[~snaps_data['game_id'].isin(games)]
+    if new_snaps.empty:
+        logger.info(f"Snap totals for {season} are up to date ({len(games)} games)")
+        return totals
+
+    new_totals = new_snaps.groupby('pfr_player_id')['offense_snaps'].sum().astype('int64')
+    totals = totals.add(new_totals, fill_value=0).astype('int64')
+    new_games = set(new_snaps['game_id'].unique())
+    save_snap_totals(season, games | new_games, totals, totals_file)
+
+    logger.info(f"Added {len(new_games)} games to the {season} snap totals ({len(games | new_games)} games, {len(totals)} players)")
+    return totals
+
+def download_id_crosswalk():
+    """Download the gsis_id -> pfr_id crosswalk as a Series indexed by gsis_id."""
+    ids = cached_import('ids', None, lambda: nfl.import_ids(columns=['name'], ids=['gsis', 'pfr']))
+    ids = ids.dropna(subset=['gsis_id', 'pfr_id']).drop_duplicates('gsis_id')
+    return ids.set_index('gsis_id')['pfr_id']
+
+def roster_pfr_ids(rosters_data):
+    """Return each roster row's pfr id, from the roster itself or else the id crosswalk."""
+    if 'pfr_id' in rosters_data.columns:
+        pfr_ids = rosters_data['pfr_id']
+    else:
+        pfr_ids = pd.Series(None, index=rosters_data.index, dtype=object)
+    missing = pfr_ids.isna()
+    if missing.any():
+        try:
+            crosswalk = download_id_crosswalk()
+            pfr_ids = pfr_ids.fillna(rosters_data['player_id'].map(crosswalk))
+            logger.info(f"Matched {int(missing.sum() - pfr_ids.isna().sum())} of {int(missing.sum())} roster rows without a pfr_id through the id crosswalk")
+        except Exception as e:
+            logger.error(f"Could not load the id crosswalk, {int(missing.sum())} roster rows without a pfr_id "
+                         f"will count 0 snaps and be filtered out: {e}")
+    return pfr_ids
+
+def filter_active_players(rosters_data, snap_totals, min_snaps=None):
+    """Keep roster rows whose player's season snap total meets their position's threshold."""
+    min_snaps = min_snaps or DEFAULT_MIN_SNAPS
+    snaps = roster_pfr_ids(rosters_data).map(snap_totals).fillna(0)
+    thresholds = rosters_data['position'].map(min_snaps)
+    return rosters_data[(snaps >= thresholds).to_numpy()]
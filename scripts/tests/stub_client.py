@@ -0,0 +1,51 @@
+"""A local stand-in for the Supabase client, shared by the upsert and ingestion tests."""
+
+import threading
+from types import SimpleNamespace
+
+class StubTable:
+    """Query builder for one table of the stub client."""
+
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+
+    def upsert(self, records, on_conflict=None):
+        self.records = records
+        self.on_conflict = on_conflict
+        return self
+
+    def execute(self):
+        return self.client.execute(self.table_name, self.records, self.on_conflict)
+
+class StubClient:
+    """Keeps upserted rows by table and conflict key.
+
+    A batch holding a record for which fail(record) is true raises, as do the
+    first failures_before_success calls.
+    """
+
+    def __init__(self, fail=None, failures_before_success=0):
+        self.fail = fail or (lambda record: False)
+        self.failures_before_success = failures_before_success
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.upserted = []
+        self.rows = {}
+
+    def table(self, name):
+        return StubTable(self, name)
+
+    def execute(self, table_name, records, on_conflict):
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.failures_before_success:
+                raise ConnectionError("transient")
+        if any(self.fail(record) for record in records):
+            raise ValueError("rejected")
+        with self.lock:
+            for record in records:
+                key = tuple(record[column] for column in on_conflict.split(','))
+                self.rows[(table_name, key)] = record
+                self.upserted.append(record)
+        return SimpleNamespace(data=records)
@@ -0,0 +1,98 @@
+"""Regression test: the vectorized game-result join matches the original iterrows/apply version."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from update_nfl_stats import add_game_results, apply_ingest_schema
+
+def legacy_game_results(data, schedule_data):
+    """The original implementation, kept as the oracle."""
+    game_results = {}
+    for _, game in schedule_data.iterrows():
+        week = game['week']
+        home_team = game['home_team']
+        away_team = game['away_team']
+        home_score = game['home_score']
+        away_score = game['away_score']
+
+        if pd.isna(home_score) or pd.isna(away_score):
+            continue
+
+        point_diff = game['result']
+        if point_diff > 0:
+            home_result = f"W {int(home_score)}-{int(away_score)}"
+            away_result = f"L {int(away_score)}-{int(home_score)}"
+        elif point_diff < 0:
+            home_result = f"L {int(home_score)}-{int(away_score)}"
+            away_result = f"W {int(away_score)}-{int(home_score)}"
+        else:
+            home_result = f"T {int(home_score)}-{int(away_score)}"
+            away_result = home_result
+
+        game_results[(week, home_team, away_team)] = home_result
+        game_results[(week, away_team, home_team)] = away_result
+
+    return data.apply(
+        lambda row: game_results.get((row['week'], row['recent_team'], row['opponent_team']), 'N/A'),
+        axis=1
+    ).tolist()
+
+def schedule(games):
+    """Build a schedule frame from (season, week, home, away, home_score, away_score) tuples."""
+    frame = pd.DataFrame(games, columns=['season', 'week', 'home_team', 'away_team', 'home_score', 'away_score'])
+    frame['result'] = frame['home_score'] - frame['away_score']
+    return frame
+
+def weekly(rows):
+    """Build weekly player rows from (season, week, team, opponent) tuples."""
+    frame = pd.DataFrame(rows, columns=['season', 'week', 'recent_team', 'opponent_team'])
+    frame['player_id'] = [f"00-{i:07d}" for i in range(len(frame))]
+    return frame
+
+SCHEDULE = schedule([
+    (2023, 1, 'KC', 'DET', 20, 21),         # home loss, replayed below
+    (2023, 2, 'BUF', 'NYJ', 31, 10),        # home win
+    (2023, 3, 'SF', 'DAL', 17, 17),         # tie
+    (2023, 4, 'GB', 'CHI', np.nan, np.nan), # not played yet
+    (2023, 5, 'MIA', 'NE', 24, np.nan),     # one score missing
+    (2023, 7, 'LV', 'DEN', 13, 16),         # home loss
+    (2024, 1, 'DET', 'KC', 27, 24),         # (week, team, opponent) repeated from 2023
+])
+
+WEEKLY = weekly([
+    (2023, 1, 'KC', 'DET'), (2023, 1, 'DET', 'KC'),
+    (2023, 2, 'BUF', 'NYJ'), (2023, 2, 'NYJ', 'BUF'),
+    (2023, 3, 'SF', 'DAL'), (2023, 3, 'DAL', 'SF'),
+    (2023, 4, 'GB', 'CHI'),
+    (2023, 5, 'NE', 'MIA'),
+    (2023, 6, 'KC', 'LV'),                  # no game on the schedule
+    (2023, 2, 'BUF', 'MIA'),                # opponent does not match the scheduled game
+    (2024, 1, 'KC', 'DET'), (2024, 1, 'DET', 'KC'),
+    (2023, 7, 'LV', 'DEN'), (2023, 7, 'DEN', 'LV'),
+])
+
+def test_matches_legacy_results():
+    expected = legacy_game_results(WEEKLY.copy(), SCHEDULE)
+    assert add_game_results(WEEKLY.copy(), SCHEDULE)['game_result'].tolist() == expected
+
+@pytest.mark.parametrize('row, result', [
+    (12, 'L 13-16'), (13, 'W 16-13'),      # each side gets its own score first
+    (2, 'W 31-10'), (3, 'L 10-31'),
+    (4, 'T 17-17'), (5, 'T 17-17'),        # ties use the home score first for both teams
+    (6, 'N/A'), (7, 'N/A'),                # missing scores
+    (8, 'N/A'), (9, 'N/A'),                # unmatched rows
+])
+def test_expected_strings(row, result):
+    assert add_game_results(WEEKLY.copy(), SCHEDULE)['game_result'].iloc[row] == result
+
+def test_repeated_key_across_seasons_uses_latest_game():
+    # The legacy dict is keyed without the season, so the later game overwrites the earlier one
+    results = add_game_results(WEEKLY.copy(), SCHEDULE)['game_result']
+    assert results.iloc[0] == results.iloc[10] == 'L 24-27'
+    assert results.iloc[1] == results.iloc[11] == 'W 27-24'
+
+def test_matches_legacy_results_on_typed_data():
+    typed = apply_ingest_schema(WEEKLY.copy())
+    expected = legacy_game_results(WEEKLY.copy(), SCHEDULE)
+    assert add_game_results(typed, SCHEDULE)['game_result'].tolist() == expected
@@ -0,0 +1,95 @@
+"""Tests for incremental ingestion: only new or changed rows reach the database, the backup gets every row."""
+
+import pandas as pd
+import pytest
+
+from update_nfl_stats import INGEST_SCHEMA, apply_ingest_schema, update_database
+from stub_client import StubClient
+
+SEASON = 2024
+
+def weekly(rows):
+    """Build typed weekly data from (player_id, team, opponent, week, receiving_yards) tuples."""
+    frame = pd.DataFrame(rows, columns=['player_id', 'recent_team', 'opponent_team', 'week', 'receiving_yards'])
+    for column, dtype in INGEST_SCHEMA.items():
+        if column not in frame.columns:
+            frame[column] = 0 if dtype.startswith(('int', 'float')) else 'X'
+    frame['player_name'] = frame['player_id']
+    frame['season'] = SEASON
+    frame['season_type'] = 'REG'
+    return apply_ingest_schema(frame)
+
+SCHEDULE = pd.DataFrame({
+    'season': [SEASON, SEASON], 'week': [1, 2],
+    'home_team': ['KC', 'BUF'], 'away_team': ['BUF', 'KC'],
+    'home_score': [27, 20], 'away_score': [24, 23],
+    'result': [3, -3]
+})
+
+WEEKLY = weekly([
+    ('00-01', 'KC', 'BUF', 1, 80), ('00-02', 'BUF', 'KC', 1, 45), ('00-03', 'KC', 'BUF', 1, 12),
+    ('00-01', 'KC', 'BUF', 2, 95), ('00-02', 'BUF', 'KC', 2, 30), ('00-03', 'KC', 'BUF', 2, 0),
+])
+
+OPTIONS = {'batch_size': 2, 'workers': 1, 'max_retries': 0, 'base_delay': 0}
+
+@pytest.fixture
+def run(tmp_path):
+    """Run an incremental update of WEEKLY (or the given frame) with a stub client."""
+    def run(client, weekly_data=WEEKLY):
+        return update_database(SEASON, incremental=True, state_file=tmp_path / 'state.json',
+                               backup_file=tmp_path / 'backup.csv', client=client,
+                               weekly_data=weekly_data.copy(), schedule_data=SCHEDULE, **OPTIONS)
+    return run
+
+def upserted_keys(client):
+    return sorted((record['player_id'], record['week']) for record in client.upserted)
+
+def test_first_run_upserts_every_row(run):
+    client = StubClient()
+    summaries = run(client)
+
+    assert summaries['supabase']['rows_upserted'] == len(WEEKLY)
+    assert client.upserted[0]['game_result'] == 'W 27-24'
+
+def test_rerun_on_the_same_data_upserts_nothing(run):
+    run(StubClient())
+
+    client = StubClient()
+    summaries = run(client)
+
+    assert summaries['supabase']['rows_upserted'] == 0
+    assert client.upserted == []
+
+def test_only_changed_rows_are_upserted_again(run):
+    run(StubClient())
+
+    changed = WEEKLY.copy()
+    changed.loc[4, 'receiving_yards'] = 31
+    client = StubClient()
+    summaries = run(client, changed)
+
+    assert summaries['supabase']['rows_upserted'] == 1
+    assert upserted_keys(client) == [('00-02', 2)]
+    assert client.upserted[0]['receiving_yards'] == 31
+
+def test_rows_of_failed_batches_are_retried_on_the_next_run(run):
+    summaries = run(StubClient(fail=lambda record: record['player_id'] == '00-02'))
+    failed = sorted((record['player_id'], record['week']) for record in summaries['supabase']['failed_records'])
+    assert ('00-02', 1) in failed and ('00-02', 2) in failed
+
+    client = StubClient()
+    summaries = run(client)
+
+    assert upserted_keys(client) == failed
+    assert summaries['supabase']['failed_batches'] == 0
+
+def test_backup_holds_the_full_season_on_incremental_runs(run, tmp_path):
+    run(StubClient())
+    changed = WEEKLY.copy()
+    changed.loc[0, 'receiving_yards'] = 81
+    run(StubClient(), changed)
+
+    backup = pd.read_csv(tmp_path / 'backup.csv')
+    assert len(backup) == len(WEEKLY)
+    assert sorted(backup['receiving_yards']) == sorted(changed['receiving_yards'])
@@ -0,0 +1,35 @@
+"""Equivalence test: js_export writes the same bytes as the legacy to_dict + json.dumps export."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark_serializer import legacy_export
+from js_export import write_js_export, column_to_list
+
+def timestamps(*values):
+    return pd.to_datetime(list(values), format='ISO8601').as_unit('ns')
+
+FRAME = pd.DataFrame({
+    'player_id': ['00-01', '00-02', '00-03', '00-04'],
+    'jersey_number': [8.0, np.nan, 34.0, 87.0],
+    'weight': [225, 210, 218, 250],
+    'status': ['ACT', None, 'RES', 'ACT'],
+    # Fractional seconds in one row must not add a zero fraction to the others
+    'birth_date': timestamps('1983-12-02', '1990-05-17 12:30:00.250000', None, '1989-10-05 08:00:00'),
+    'updated_at': timestamps('2024-09-01 10:00:00', '2024-09-01 10:00:00.000000500',
+                             '2024-09-01 10:00:01', '2024-09-01 10:00:00.123456'),
+    'gameday': timestamps('2024-09-05 20:20', '2024-09-08 13:00', None, '2024-09-08 16:25').tz_localize('US/Eastern'),
+})
+
+def test_matches_legacy_export(tmp_path):
+    legacy_export(tmp_path / 'legacy.js', 'rosters', FRAME)
+    write_js_export(tmp_path / 'rosters.js', 'rosters', FRAME)
+
+    assert (tmp_path / 'rosters.js').read_bytes() == (tmp_path / 'legacy.js').read_bytes()
+
+@pytest.mark.parametrize('column', ['birth_date', 'updated_at', 'gameday'])
+def test_timestamps_match_isoformat_per_value(column):
+    expected = [None if pd.isna(value) else value.isoformat() for value in FRAME[column]]
+
+    assert column_to_list(FRAME[column]) == expected
@@ -0,0 +1,99 @@
+"""Tests for the sink protocol: run_pipeline fanning batches out to the CSV, SQLite and Supabase sinks."""
+
+import csv
+import sqlite3
+
+import pytest
+
+from record_sinks import run_pipeline, csv_sink, sqlite_sink, supabase_sink
+from stub_client import StubClient
+
+def records(*keys, value=0):
+    return [{'id': key, 'week': 1, 'value': value} for key in keys]
+
+def failing_stream(batches, error):
+    """Yield batches, then raise error as a failing download or validation stage would."""
+    yield from batches
+    raise error
+
+def read_csv(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+def read_table(path, table_name='nfl'):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(f"SELECT id, week, value FROM {table_name} ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+def test_every_batch_reaches_every_sink(tmp_path):
+    sinks = {
+        'backup': csv_sink(tmp_path / 'backup.csv'),
+        'sqlite': sqlite_sink(tmp_path / 'nfl.db', 'nfl', ['id', 'week']),
+    }
+    summaries = run_pipeline([records(1, 2), records(3)], sinks)
+
+    assert summaries['backup']['rows_written'] == 3
+    assert summaries['sqlite']['rows_written'] == 3
+    assert [row['id'] for row in read_csv(tmp_path / 'backup.csv')] == ['1', '2', '3']
+    assert read_table(tmp_path / 'nfl.db') == [(1, 1, 0), (2, 1, 0), (3, 1, 0)]
+
+def test_sqlite_upsert_keeps_the_last_row_for_a_repeated_conflict_key(tmp_path):
+    sinks = {
+        'backup': csv_sink(tmp_path / 'backup.csv'),
+        'sqlite': sqlite_sink(tmp_path / 'nfl.db', 'nfl', ['id', 'week']),
+    }
+    run_pipeline([records(1, 2, value=10), records(2, value=20), records(2, value=30)], sinks)
+
+    assert read_table(tmp_path / 'nfl.db') == [(1, 1, 10), (2, 1, 30)]
+    # The backup keeps every row as it arrived
+    assert [row['value'] for row in read_csv(tmp_path / 'backup.csv')] == ['10', '10', '20', '30']
+
+def test_sqlite_upsert_updates_rows_from_an_earlier_run(tmp_path):
+    run_pipeline([records(1, 2, value=10)], {'sqlite': sqlite_sink(tmp_path / 'nfl.db', 'nfl', ['id', 'week'])})
+    run_pipeline([records(2, value=20)], {'sqlite': sqlite_sink(tmp_path / 'nfl.db', 'nfl', ['id', 'week'])})
+
+    assert read_table(tmp_path / 'nfl.db') == [(1, 1, 10), (2, 1, 20)]
+
+def test_empty_stream_writes_no_backup(tmp_path):
+    summaries = run_pipeline([], {'backup': csv_sink(tmp_path / 'backup.csv')})
+
+    assert summaries['backup']['rows_written'] == 0
+    assert not (tmp_path / 'backup.csv').exists()
+
+def test_failing_stream_closes_every_sink(tmp_path):
+    sinks = {
+        'backup': csv_sink(tmp_path / 'backup.csv'),
+        'sqlite': sqlite_sink(tmp_path / 'nfl.db', 'nfl', ['id', 'week']),
+    }
+    with pytest.raises(RuntimeError, match="download failed"):
+        run_pipeline(failing_stream([records(1, 2), records(3)], RuntimeError("download failed")), sinks)
+
+    # Closed sinks have run their cleanup, and what arrived before the error was written
+    assert all(sink.gi_frame is None for sink in sinks.values())
+    assert [row['id'] for row in read_csv(tmp_path / 'backup.csv')] == ['1', '2', '3']
+    assert read_table(tmp_path / 'nfl.db') == [(1, 1, 0), (2, 1, 0), (3, 1, 0)]
+
+def test_supabase_sink_upserts_through_the_client():
+    client = StubClient()
+    summaries = run_pipeline([records(1, 2), records(3)],
+                             {'supabase': supabase_sink(client, 'nfl', 'id,week', batch_size=2, workers=1)})
+
+    assert summaries['supabase']['rows_upserted'] == 3
+    assert sorted(key for (_, key) in client.rows) == [(1, 1), (2, 1), (3, 1)]
+
+def test_failing_stream_stops_the_upsert_thread():
+    client = StubClient()
+    sink = supabase_sink(client, 'nfl', 'id,week', batch_size=1, workers=1)
+    with pytest.raises(RuntimeError):
+        run_pipeline(failing_stream([records(1), records(2)], RuntimeError("download failed")), {'supabase': sink})
+
+    assert sink.gi_frame is None
+    assert sorted(key for (_, key) in client.rows) == [(1, 1), (2, 1)]
+
+def test_dead_upsert_thread_does_not_hang_the_pipeline():
+    # upsert_records fails before reading any batch, so nothing drains the queue
+    sink = supabase_sink(StubClient(), 'nfl', 'id,week', workers=0)
+    with pytest.raises(ValueError):
+        run_pipeline((records(key) for key in range(10)), {'supabase': sink})
@@ -0,0 +1,131 @@
+"""Tests for batched upserts, retries, dead-lettering and dead-letter replay against a local stub client."""
+
+import json
+
+import pytest
+
+from upsert_engine import upsert_records, replay_dead_letters
+from stub_client import StubClient
+
+RETRY_OPTIONS = {'max_retries': 0, 'base_delay': 0, 'workers': 1}
+
+def records(*keys):
+    return [{'id': key, 'value': key * 10} for key in keys]
+
+def failing(keys):
+    keys = set(keys)
+    return lambda record: record['id'] in keys
+
+def upserted_ids(client):
+    return sorted(key for (_, (key,)) in client.rows)
+
+def read_entries(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def test_upserts_every_batch():
+    client = StubClient()
+    summary = upsert_records(client, 'nfl', records(1, 2, 3, 4, 5), 'id', batch_size=2, **RETRY_OPTIONS)
+
+    assert summary['rows_upserted'] == 5
+    assert summary['batches'] == 3
+    assert summary['failed_batches'] == 0
+    assert summary['failed_records'] == []
+    assert upserted_ids(client) == [1, 2, 3, 4, 5]
+
+def test_retries_transient_failures():
+    client = StubClient(failures_before_success=2)
+    summary = upsert_records(client, 'nfl', records(1, 2), 'id', batch_size=2,
+                             max_retries=2, base_delay=0, workers=1)
+
+    assert summary['rows_upserted'] == 2
+    assert summary['retries'] == 2
+    assert summary['failed_batches'] == 0
+
+def test_failed_batches_are_dead_lettered(tmp_path):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    client = StubClient(fail=failing({3}))
+    summary = upsert_records(client, 'nfl', records(1, 2, 3, 4, 5), 'id', batch_size=2,
+                             dead_letter_file=dead_letter_file, **RETRY_OPTIONS)
+
+    assert summary['rows_upserted'] == 3
+    assert summary['failed_batches'] == 1
+    assert summary['failed_rows'] == 2
+    assert summary['failed_records'] == records(3, 4)
+
+    entries = read_entries(dead_letter_file)
+    assert len(entries) == 1
+    assert entries[0]['table'] == 'nfl'
+    assert entries[0]['on_conflict'] == 'id'
+    assert entries[0]['batch'] == 2
+    assert entries[0]['error'] == 'rejected'
+    assert entries[0]['records'] == records(3, 4)
+
+def test_replay_upserts_dead_letters_and_removes_the_file(tmp_path):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    upsert_records(StubClient(fail=failing({1})), 'nfl', records(1, 2), 'id', batch_size=2,
+                   dead_letter_file=dead_letter_file, **RETRY_OPTIONS)
+
+    client = StubClient()
+    summaries = replay_dead_letters(client, dead_letter_file, **RETRY_OPTIONS)
+
+    assert [summary['rows_upserted'] for summary in summaries] == [2]
+    assert upserted_ids(client) == [1, 2]
+    assert not dead_letter_file.exists()
+    assert not dead_letter_file.with_suffix('.replaying').exists()
+
+def test_replay_writes_rows_failing_again_back(tmp_path):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    upsert_records(StubClient(fail=failing({1, 3})), 'nfl', records(1, 2, 3), 'id', batch_size=1,
+                   dead_letter_file=dead_letter_file, **RETRY_OPTIONS)
+
+    summaries = replay_dead_letters(StubClient(fail=failing({3})), dead_letter_file, batch_size=1, **RETRY_OPTIONS)
+
+    assert summaries[0]['rows_upserted'] == 1
+    assert summaries[0]['failed_records'] == records(3)
+    assert [entry['records'] for entry in read_entries(dead_letter_file)] == [records(3)]
+    assert not dead_letter_file.with_suffix('.replaying').exists()
+
+def test_replay_merges_into_an_interrupted_replay(tmp_path):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    replay_file = dead_letter_file.with_suffix('.replaying')
+    # A replay crashed after moving batch 1 aside, then a later run dead-lettered batch 2
+    upsert_records(StubClient(fail=failing({1})), 'nfl', records(1), 'id',
+                   dead_letter_file=replay_file, **RETRY_OPTIONS)
+    upsert_records(StubClient(fail=failing({2})), 'nfl', records(2), 'id',
+                   dead_letter_file=dead_letter_file, **RETRY_OPTIONS)
+
+    client = StubClient(fail=failing({2}))
+    summaries = replay_dead_letters(client, dead_letter_file, batch_size=1, **RETRY_OPTIONS)
+
+    assert summaries[0]['rows_upserted'] == 1
+    assert upserted_ids(client) == [1]
+    assert [entry['records'] for entry in read_entries(dead_letter_file)] == [records(2)]
+    assert not replay_file.exists()
+
+def test_replay_resumes_a_leftover_replay_file(tmp_path):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    replay_file = dead_letter_file.with_suffix('.replaying')
+    upsert_records(StubClient(fail=failing({1})), 'nfl', records(1), 'id',
+                   dead_letter_file=replay_file, **RETRY_OPTIONS)
+
+    client = StubClient()
+    replay_dead_letters(client, dead_letter_file, **RETRY_OPTIONS)
+
+    assert upserted_ids(client) == [1]
+    assert not replay_file.exists()
+    assert not dead_letter_file.exists()
+
+def test_replay_without_dead_letters_does_nothing(tmp_path):
+    assert replay_dead_letters(StubClient(), tmp_path / 'dead_letters.jsonl') is None
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_dead_letters_every_failed_batch_across_workers(tmp_path, workers):
+    dead_letter_file = tmp_path / 'dead_letters.jsonl'
+    summary = upsert_records(StubClient(fail=failing(set(range(0, 40, 2)))), 'nfl', records(*range(40)), 'id',
+                             batch_size=1, workers=workers, max_retries=0, base_delay=0,
+                             dead_letter_file=dead_letter_file)
+
+    assert summary['failed_batches'] == 20
+    assert sorted(record['id'] for record in summary['failed_records']) == list(range(0, 40, 2))
+    assert sorted(entry['records'][0]['id'] for entry in read_entries(dead_letter_file)) == list(range(0, 40, 2))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Update All NFL Data
+
+Runs the static data export (update_nfl_data.py) and the weekly stats
+ingestion (update_nfl_stats.py) as one job graph. Every download starts
+right away in a thread pool, and each later stage starts as soon as the
+downloads it needs are ready:
+
+    teams, rosters, schedule, snap_counts -> export
+    weekly, schedule                      -> upsert -> summaries, projections -> notify
+
+Every dataset is downloaded once and handed to the stages that need it,
+even with the download cache off, and the schedule is shared by both jobs.
+The wall-clock time is close to the slowest download plus the stages after
+it, instead of the sum of every download.
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from nfl_cache import add_cache_arguments, configure_from_args
+from instrumentation import run, stage, add_instrumentation_arguments, start_run, finish_run
+from snap_activity import DEFAULT_MIN_SNAPS, parse_min_snaps
+from update_nfl_data import (
+    CHANGED_EXIT_CODE,
+    download_rosters_data,
+    download_schedule_data,
+    download_snap_counts_data,
+    download_teams_data,
+    get_current_season,
+    save,
+)
+from update_nfl_stats import (
+    DEFAULT_DEAD_LETTER_FILE,
+    download_weekly_data,
+    get_supabase_client,
+    notify_game_log_service,
+    update_database,
+)
+from prop_summaries import refresh_prop_summaries
+from projections import refresh_projections
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_JOBS = ['teams', 'rosters', 'schedule', 'snap_counts', 'weekly']
+
+def build_jobs(season, args):
+    """Return the job graph as {name: (dependencies, func)}; func gets the dependencies' results in order."""
+    upsert_options = {
+        'batch_size': args.batch_size,
+        'workers': args.upsert_workers,
+        'max_retries': args.max_retries,
+        'dead_letter_file': args.dead_letter_file
+    }
+    backup_file = None if args.no_backup else Path(f"temp_nfl_{season}.csv")
+
+    def export(teams_data, rosters_data, schedule_data, snaps_data):
+        return save(teams_data, rosters_data, schedule_data, season, compact=args.compact, prune=args.prune,
+                    columnar=args.columnar, min_snaps=args.min_snaps, snaps_data=snaps_data)
+
+    def upsert(weekly_data, schedule_data):
+        return update_database(season, incremental=args.incremental, backup_file=backup_file,
+                               weekly_data=weekly_data, schedule_data=schedule_data, **upsert_options)
+
+    def summaries(upserted):
+        if upserted is not None:
+            return refresh_prop_summaries(get_supabase_client(), season, **upsert_options)
+
+    def projections(upserted, schedule_data):
+        if upserted is not None:
+            return refresh_projections(get_supabase_client(), season, schedule_data, **upsert_options)
+
+    def notify(upserted, *refreshed):
+        if upserted is not None:
+            notify_game_log_service()
+
+    jobs = {
+        'teams': ([], download_teams_data),
+        'rosters': ([], lambda: download_rosters_data(season)),
+        'schedule': ([], lambda: download_schedule_data(season)),
+        'snap_counts': ([], lambda: download_snap_counts_data(season)),
+        'weekly': ([], lambda: download_weekly_data(season)),
+        'export': (['teams', 'rosters', 'schedule', 'snap_counts'], export),
+        'upsert': (['weekly', 'schedule'], upsert),
+        'summaries': (['upsert'], summaries),
+        'projections': (['upsert', 'schedule'], projections),
+        'notify': (['upsert', 'summaries', 'projections'], notify)
+    }
+
+    skipped = set()
+    if args.skip_export:
+        skipped.add('export')
+    if args.skip_stats:
+        skipped.update(['upsert', 'summaries', 'projections', 'notify'])
+    if args.skip_summaries:
+        skipped.add('summaries')
+    if args.skip_projections:
+        skipped.add('projections')
+    jobs = {
+        name: ([dep for dep in deps if dep not in skipped], func)
+        for name, (deps, func) in jobs.items() if name not in skipped
+    }
+    return prune_jobs(jobs)
+
+def prune_jobs(jobs):
+    """Drop downloads that no remaining stage depends on."""
+    needed = {dep for deps, func in jobs.values() for dep in deps}
+    return {name: job for name, job in jobs.items() if name not in DOWNLOAD_JOBS or name in needed}
+
+async def run_jobs(jobs, workers):
+    """Run each job in a thread pool once the jobs it depends on have finished and return {name: result}.
+
+    A job that raised, or depends on one that did, has the exception as its result.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = {}
+
+    def timed(name, func, inputs):
+        with stage(f"job_{name}"):
+            return func(*inputs)
+
+    async def run_job(name):
+        dependencies, func = jobs[name]
+        inputs = [await tasks[dependency] for dependency in dependencies]
+        logger.info(f"Starting {name}")
+        started = time.perf_counter()
+        result = await loop.run_in_executor(executor, timed, name, func, inputs)
+        logger.info(f"Finished {name} in {time.perf_counter() - started:.1f}s")
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for name in jobs:
+            tasks[name] = asyncio.create_task(run_job(name))
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    for name, result in zip(tasks, results):
+        if isinstance(result, Exception):
+            logger.error(f"Job {name} failed: {result}")
+    return dict(zip(tasks, results))
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the static data export and weekly stats ingestion together.")
+    parser.add_argument('--workers', type=int, default=len(DOWNLOAD_JOBS),
+                        help=f"Jobs run at the same time (default: {len(DOWNLOAD_JOBS)}, one per download)")
+    parser.add_argument('--skip-export', action='store_true',
+                        help="Do not export teams, rosters and schedule to src/lib/data")
+    parser.add_argument('--skip-stats', action='store_true',
+                        help="Do not ingest weekly stats")
+    parser.add_argument('--skip-summaries', action='store_true',
+                        help="Do not recompute the nfl_prop_summaries table after ingestion")
+    parser.add_argument('--skip-projections', action='store_true',
+                        help="Do not recompute the nfl_projections table after ingestion")
+    parser.add_argument('--compact', action='store_true',
+                        help="Write compact (non-indented) JSON into the data files")
+    parser.add_argument('--prune', action='store_true',
+                        help="Only export the columns the frontend reads")
+    parser.add_argument('--columnar', action='store_true',
+                        help="Write pruned, column-oriented data files and per-team roster shards")
+    parser.add_argument('--min-snaps', type=parse_min_snaps, default=DEFAULT_MIN_SNAPS,
+                        help="Season offensive snaps for a rostered player to count as active (default: 50)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only upsert stats rows that are new or changed since the last run")
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help="Records per upsert batch (default: 100)")
+    parser.add_argument('--upsert-workers', type=int, default=4,
+                        help="Number of concurrent upsert workers (default: 4)")
+    parser.add_argument('--max-retries', type=int, default=4,
+                        help="Retries per failed batch before it is dead-lettered (default: 4)")
+    parser.add_argument('--dead-letter-file', type=Path, default=DEFAULT_DEAD_LETTER_FILE,
+                        help=f"File that receives batches which still fail (default: {DEFAULT_DEAD_LETTER_FILE.name})")
+    parser.add_argument('--no-backup', action='store_true',
+                        help="Do not write the CSV backup of the ingested stats")
+    parser.add_argument('--exit-code', action='store_true',
+                        help=f"Exit with status {CHANGED_EXIT_CODE} if any exported data file changed")
+    add_cache_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    """Run every job and report how long the downloads took against the whole run."""
+    args = parse_args()
+    configure_from_args(args)
+    start_run('update_all', args)
+    started = time.perf_counter()
+
+    season = get_current_season()
+    logger.info(f"Current NFL season: {season}")
+    jobs = build_jobs(season, args)
+    results = asyncio.run(run_jobs(jobs, args.workers))
+
+    download_seconds = [run['stages'][f"job_{name}"]['seconds'] for name in DOWNLOAD_JOBS if f"job_{name}" in run['stages']]
+    if download_seconds:
+        logger.info(f"Downloads took {sum(download_seconds):.1f}s in total, {max(download_seconds):.1f}s for the "
+                    f"slowest; the whole run took {time.perf_counter() - started:.1f}s")
+
+    failed = [name for name, result in results.items() if isinstance(result, Exception)]
+    if 'upsert' in results and results['upsert'] is None:
+        failed.append('upsert')
+    if failed:
+        logger.error(f"Failed jobs: {', '.join(failed)}")
+        finish_run('failed')
+        sys.exit(1)
+
+    finish_run()
+    if args.exit_code and results.get('export'):
+        sys.exit(CHANGED_EXIT_CODE)
+
+if __name__ == "__main__":
+    main()
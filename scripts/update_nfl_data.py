@@ -9,6 +9,7 @@ Should run once per week during the NFL season.
 import os
 import sys
 import logging
+import argparse
 from datetime import datetime
 from pathlib import Path
 
@@ -19,7 +20,27 @@ from dotenv import load_dotenv
 import nfl_data_py as nfl
 import pandas as pd
 import numpy as np
-import json
+
+from nfl_cache import cached_import, add_cache_arguments, configure_from_args
+from instrumentation import add_instrumentation_arguments, start_run, finish_run
+from snap_activity import (
+    DEFAULT_MIN_SNAPS,
+    DEFAULT_TOTALS_FILE,
+    parse_min_snaps,
+    update_snap_totals,
+    filter_active_players,
+)
+from game_context import build_game_context, write_game_context
+from js_export import (
+    write_js_export,
+    write_js_columnar,
+    write_shards,
+    update_manifest,
+    project_columns,
+    file_sizes,
+    legacy_sizes,
+    log_size_report,
+)
 
 # Load environment variables
 load_dotenv()
@@ -31,11 +52,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns the frontend reads from each dataset; everything else is dropped with --prune or --columnar
+EXPORT_COLUMNS = {
+    'teams': [
+        'team_abbr', 'team_name', 'team_id', 'team_nick', 'team_conf', 'team_division',
+        'team_color', 'team_color2', 'team_logo_espn'
+    ],
+    'rosters': [
+        'season', 'team', 'position', 'jersey_number', 'status', 'player_name', 'first_name',
+        'last_name', 'player_id', 'height', 'weight', 'years_exp', 'age', 'headshot_url'
+    ],
+    'schedule': [
+        'game_id', 'season', 'game_type', 'week', 'gameday', 'weekday', 'gametime',
+        'away_team', 'away_score', 'home_team', 'home_score', 'location', 'result', 'total',
+        'overtime', 'away_moneyline', 'home_moneyline', 'spread_line', 'away_spread_odds',
+        'home_spread_odds', 'total_line', 'under_odds', 'over_odds', 'div_game', 'roof',
+        'surface', 'away_qb_name', 'home_qb_name', 'stadium'
+    ]
+}
+
+DEFAULT_LIB_DATA_DIR = Path(__file__).parent.parent / "src" / "lib" / "data"
+
+# Exit status with --exit-code when a data file changed and the site needs a rebuild
+CHANGED_EXIT_CODE = 3
+
+# Datasets split into one lazily importable columnar module per value of this column
+SHARD_COLUMNS = {
+    'rosters': 'team'
+}
+
 def download_teams_data():
     """Download teams data."""
     try:
         logger.info("Downloading teams data...")
-        teams_data = nfl.import_team_desc()
+        teams_data = cached_import('teams', None, nfl.import_team_desc)
         
         if not teams_data.empty:
             logger.info(f"Successfully downloaded teams data: {len(teams_data)} teams")
@@ -54,7 +104,8 @@ def download_rosters_data(season):
     """Download rosters data for the specified season."""
     try:
         logger.info(f"Downloading rosters data for {season}...")
-        rosters_data = nfl.import_seasonal_rosters([season])
+        rosters_data = cached_import('rosters', season, lambda: nfl.import_seasonal_rosters([season]),
+                                     immutable=season < get_current_season())
         
         if not rosters_data.empty:
             logger.info(f"Successfully downloaded rosters data: {len(rosters_data)} roster entries")
@@ -71,7 +122,8 @@ def download_schedule_data(season):
     """Download schedule data for the specified season."""
     try:
         logger.info(f"Downloading schedule data for {season}...")
-        schedule_data = nfl.import_schedules([season])
+        schedule_data = cached_import('schedules', season, lambda: nfl.import_schedules([season]),
+                                      immutable=season < get_current_season())
         
         if not schedule_data.empty:
             logger.info(f"Successfully downloaded schedule data: {len(schedule_data)} games")
@@ -84,6 +136,24 @@ def download_schedule_data(season):
         logger.error(f"Error downloading schedule data for {season}: {e}")
         return None
 
+def download_snap_counts_data(season):
+    """Download snap counts data for the specified season."""
+    try:
+        logger.info(f"Downloading snap counts data for {season}...")
+        snaps_data = cached_import('snap_counts', season, lambda: nfl.import_snap_counts([season]),
+                                   immutable=season < get_current_season())
+        
+        if not snaps_data.empty:
+            logger.info(f"Successfully downloaded snap counts data: {len(snaps_data)} rows")
+            return snaps_data
+        else:
+            logger.warning(f"No snap counts data available for {season}")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error downloading snap counts data for {season}: {e}")
+        return None
+
 def deduplicate_teams(teams_data):
     """Remove duplicate teams based on team_id, keeping the most recent version."""
     if teams_data is None or teams_data.empty:
@@ -121,38 +191,33 @@ def convert_nan_to_null(obj):
     else:
         return obj
 
-def filter_active_offensive_players(rosters_data, season, min_snaps=50):
-    """Filter rosters to only include active offensive players (QB, RB, WR, TE) who have taken snaps."""
+def filter_active_offensive_players(rosters_data, season, min_snaps=None, totals_file=DEFAULT_TOTALS_FILE,
+                                    snaps_data=None):
+    """Filter rosters to only include active offensive players (QB, RB, WR, TE) who have taken snaps.
+
+    min_snaps maps each position to its minimum season offensive snaps (default: DEFAULT_MIN_SNAPS).
+    Snap counts are downloaded unless snaps_data is passed.
+    """
     if rosters_data is None or rosters_data.empty:
         return rosters_data
     
     logger.info("Filtering rosters to active offensive players only...")
-    
-    # Define offensive positions
-    offensive_positions = ['QB', 'RB', 'WR', 'TE']
+    min_snaps = min_snaps or DEFAULT_MIN_SNAPS
     
     # Filter rosters to only include offensive players
-    offensive_rosters = rosters_data[rosters_data['position'].isin(offensive_positions)]
+    offensive_rosters = rosters_data[rosters_data['position'].isin(list(min_snaps))]
     logger.info(f"Offensive players: {len(offensive_rosters)}")
     
     try:
         # Get snap counts data to find players who have taken snaps
-        logger.info("Downloading snap counts to filter active players...")
-        snaps_data = nfl.import_snap_counts([season])
+        if snaps_data is None:
+            snaps_data = download_snap_counts_data(season)
         
-        if not snaps_data.empty:
-            # Filter to offensive positions
-            offensive_snaps = snaps_data[snaps_data['position'].isin(offensive_positions)]
+        if snaps_data is not None and not snaps_data.empty:
+            # Season snap totals by pfr id, only adding games not counted on previous runs
+            snap_totals = update_snap_totals(season, snaps_data, totals_file)
             
-            # Calculate total snaps per player
-            player_snap_totals = offensive_snaps.groupby('player')['offense_snaps'].sum()
-            
-            # Get players with minimum snap count
-            active_players = player_snap_totals[player_snap_totals >= min_snaps].index.tolist()
-            logger.info(f"Players with {min_snaps}+ snaps: {len(active_players)}")
-            
-            # Filter offensive rosters to only include players who have taken snaps
-            active_offensive_rosters = offensive_rosters[offensive_rosters['player_name'].isin(active_players)]
+            active_offensive_rosters = filter_active_players(offensive_rosters, snap_totals, min_snaps)
             
             logger.info(f"Active offensive players: {len(offensive_rosters)} -> {len(active_offensive_rosters)}")
             return active_offensive_rosters
@@ -165,50 +230,98 @@ def filter_active_offensive_players(rosters_data, season, min_snaps=50):
         logger.warning("Returning all offensive players due to error")
         return offensive_rosters
 
-def save(teams_data, rosters_data, schedule_data, season):
-    """Save static data to lib/data folder as JavaScript files."""
+def export_dataset(lib_data_dir, name, frame, compact=False, prune=False, columnar=False):
+    """Write one dataset to lib/data and return the files written, main file first.
+
+    The main file always holds an array of row objects. Datasets in
+    SHARD_COLUMNS are also split into per-value columnar modules, e.g.
+    rosters/KC.js, which the roster view imports on demand. With columnar,
+    the whole dataset is written next to the main file as <name>.columnar.js too.
+    """
+    if prune or columnar:
+        frame = project_columns(frame, EXPORT_COLUMNS[name], name)
+    
+    data_file = lib_data_dir / f"{name}.js"
+    write_js_export(data_file, name, frame, compact=compact or columnar)
+    data_files = [data_file]
+    
+    columnar_file = lib_data_dir / f"{name}.columnar.js"
+    if columnar:
+        write_js_columnar(columnar_file, name, frame)
+        data_files.append(columnar_file)
+    elif columnar_file.exists():
+        columnar_file.unlink()
+        logger.info(f"Removed stale columnar file: {columnar_file}")
+    
+    if name in SHARD_COLUMNS:
+        shards = frame if prune or columnar else project_columns(frame, EXPORT_COLUMNS[name], name)
+        shard_files = write_shards(lib_data_dir / name, name, shards, SHARD_COLUMNS[name])
+        logger.info(f"Saved {len(shard_files)} {name} shards: {lib_data_dir / name}")
+        data_files.extend(shard_files)
+    
+    return data_files
+
+def save(teams_data, rosters_data, schedule_data, season, compact=False, prune=False, columnar=False,
+         size_report=False, min_snaps=None, lib_data_dir=None, totals_file=DEFAULT_TOTALS_FILE, snaps_data=None):
+    """Save static data to lib/data folder as JavaScript files.
+
+    Unchanged files are left untouched and manifest.json records each
+    dataset's file hashes and row count. Returns the names of the datasets
+    that changed.
+    """
     # Create lib/data directory if it doesn't exist
-    lib_data_dir = Path("../src/lib/data")
+    lib_data_dir = Path(lib_data_dir) if lib_data_dir is not None else DEFAULT_LIB_DATA_DIR
     lib_data_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"Saving static data to {lib_data_dir.absolute()}")
     
-    # Save teams data
-    if teams_data is not None:
-        teams_file = lib_data_dir / "teams.js"
-        # Deduplicate teams and convert to records
-        teams_deduped = deduplicate_teams(teams_data)
-        teams_records = teams_deduped.to_dict('records') if hasattr(teams_deduped, 'to_dict') else teams_deduped
-        teams_records_clean = convert_nan_to_null(teams_records)
-        teams_js = f"export const teams = {json.dumps(teams_records_clean, indent=2)};"
-        with open(teams_file, 'w') as f:
-            f.write(teams_js)
-        logger.info(f"Saved teams data: {teams_file}")
-    
-    # Save rosters data (active offensive players only)
+    # Deduplicate teams and filter rosters to active offensive players only
     if rosters_data is not None:
-        rosters_file = lib_data_dir / "rosters.js"
-        # Filter to active offensive players only, convert to records and handle nan values
-        active_offensive_rosters = filter_active_offensive_players(rosters_data, season)
-        rosters_records = active_offensive_rosters.to_dict('records')
-        rosters_records_clean = convert_nan_to_null(rosters_records)
-        rosters_js = f"export const rosters = {json.dumps(rosters_records_clean, indent=2)};"
-        with open(rosters_file, 'w') as f:
-            f.write(rosters_js)
-        logger.info(f"Saved active offensive rosters data: {rosters_file}")
-    
-    # Save schedule data
+        rosters_data = filter_active_offensive_players(rosters_data, season, min_snaps, totals_file, snaps_data)
+    datasets = {
+        'teams': deduplicate_teams(teams_data) if teams_data is not None else None,
+        'rosters': rosters_data,
+        'schedule': schedule_data
+    }
+    
+    sizes = []
+    exported = {}
+    for name, frame in datasets.items():
+        if frame is None:
+            continue
+        
+        data_files = export_dataset(lib_data_dir, name, frame, compact=compact, prune=prune, columnar=columnar)
+        logger.info(f"Saved {name} data: {data_files[0]}")
+        exported[name] = {'rows': len(frame), 'files': data_files}
+        
+        if size_report:
+            before = legacy_sizes(name, frame)
+            sizes.append((name, before, file_sizes(data_files[:1])))
+            columnar_files = [path for path in data_files[1:] if path.parent == lib_data_dir]
+            if columnar_files:
+                sizes.append((f"{name}.columnar", before, file_sizes(columnar_files)))
+            shard_files = [path for path in data_files[1:] if path.parent != lib_data_dir]
+            if shard_files:
+                sizes.append((f"{name}/*", before, file_sizes(shard_files)))
+    
+    # Vig-removed win/total probabilities and implied team totals per week, keyed by game_id
     if schedule_data is not None:
-        schedule_file = lib_data_dir / "schedule.js"
-        # Convert to records and handle nan values
-        schedule_records = schedule_data.to_dict('records')
-        schedule_records_clean = convert_nan_to_null(schedule_records)
-        schedule_js = f"export const schedule = {json.dumps(schedule_records_clean, indent=2)};"
-        with open(schedule_file, 'w') as f:
-            f.write(schedule_js)
-        logger.info(f"Saved schedule data: {schedule_file}")
+        context = build_game_context(schedule_data)
+        context_files = write_game_context(context, lib_data_dir / "game_context")
+        exported['game_context'] = {'rows': len(context), 'files': context_files}
+    
+    if sizes:
+        logger.info("Size report (before: every column as indented records):")
+        log_size_report(sizes)
+    
+    changed = update_manifest(lib_data_dir / "manifest.json", exported)
+    if changed:
+        logger.info(f"Changed datasets: {', '.join(changed)}")
+    else:
+        logger.info("No data changed since the last export")
     
     logger.info("All static data saved to lib/data folder successfully!")
+    return changed
 
 def get_current_season():
     """Get the current NFL season."""
@@ -226,8 +339,32 @@ def get_current_season():
     else:
         return current_year
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Download teams, rosters and schedule data into src/lib/data.")
+    parser.add_argument('--compact', action='store_true',
+                        help="Write compact (non-indented) JSON into the data files")
+    parser.add_argument('--prune', action='store_true',
+                        help="Only export the columns the frontend reads")
+    parser.add_argument('--columnar', action='store_true',
+                        help="Also write pruned, column-oriented <name>.columnar.js files")
+    parser.add_argument('--size-report', action='store_true',
+                        help="Log raw and gzip sizes before and after pruning/compaction")
+    parser.add_argument('--min-snaps', type=parse_min_snaps, default=DEFAULT_MIN_SNAPS,
+                        help="Season offensive snaps for a rostered player to count as active, "
+                             "e.g. 50 or QB=100,RB=40 (default: 50 for every position)")
+    parser.add_argument('--exit-code', action='store_true',
+                        help=f"Exit with status {CHANGED_EXIT_CODE} if any data file changed, so CI can skip "
+                             "the rebuild when nothing did")
+    add_cache_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return parser.parse_args()
+
 def main():
     """Main function to update static data."""
+    args = parse_args()
+    configure_from_args(args)
+    start_run('update_nfl_data', args)
     logger.info("Starting static data update...")
     
     try:
@@ -241,13 +378,19 @@ def main():
         schedule_data = download_schedule_data(current_season)
         
         # Save to lib/data folder
-        save(teams_data, rosters_data, schedule_data, current_season)
+        changed = save(teams_data, rosters_data, schedule_data, current_season, compact=args.compact,
+             prune=args.prune, columnar=args.columnar, size_report=args.size_report, min_snaps=args.min_snaps)
         
         logger.info("Static data update completed successfully!")
+        finish_run()
         
     except Exception as e:
         logger.error(f"Error in main process: {e}")
+        finish_run('error')
         raise
+    
+    if args.exit_code and changed:
+        sys.exit(CHANGED_EXIT_CODE)
 
 if __name__ == "__main__":
     main()
@@ -8,8 +8,10 @@ Should run every 24 hours during the NFL season.
 
 import os
 import sys
+import json
 import logging
-from datetime import datetime, timedelta
+import argparse
+import urllib.request
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -18,8 +20,17 @@ sys.path.append(str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 import nfl_data_py as nfl
 import pandas as pd
+import numpy as np
 from supabase import create_client, Client
 
+from nfl_cache import cached_import, add_cache_arguments, configure_from_args
+from update_nfl_data import get_current_season, download_schedule_data
+from upsert_engine import iter_batches, replay_dead_letters
+from record_sinks import run_pipeline, finish_sink, supabase_sink, csv_sink, sqlite_sink, postgres_sink
+from instrumentation import stage, count, add_instrumentation_arguments, start_run, finish_run
+from prop_summaries import refresh_prop_summaries
+from projections import refresh_projections
+
 # Load environment variables
 load_dotenv()
 
@@ -30,6 +41,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Local state for incremental runs (last ingested season/week and per-row content hashes)
+DEFAULT_STATE_FILE = Path(__file__).parent / ".nfl_stats_state.json"
+
+# Batches that still fail after retries are written here so they can be replayed
+DEFAULT_DEAD_LETTER_FILE = Path(__file__).parent / "nfl_dead_letters.jsonl"
+
+# Upsert conflict key of the nfl table
+CONFLICT_KEY = 'player_id,team,week,season'
+
+# Weekly data columns and their names in our table schema
+# Note: game_result is excluded from database insertion until column is added to schema
+COLUMNS_MAPPING = {
+    'player_id': 'player_id',
+    'player_name': 'player_name',
+    'player_display_name': 'player_display_name',
+    'position': 'position',
+    'position_group': 'position_group',
+    'recent_team': 'team',
+    'week': 'week',
+    'season': 'season',
+    'season_type': 'season_type',
+    'opponent_team': 'opponent_team',
+    'game_result': 'game_result',
+    'completions': 'completions',
+    'attempts': 'attempts',
+    'passing_yards': 'passing_yards',
+    'passing_tds': 'passing_tds',
+    'interceptions': 'interceptions',
+    'sacks': 'sacks',
+    'carries': 'carries',
+    'rushing_yards': 'rushing_yards',
+    'rushing_tds': 'rushing_tds',
+    'receptions': 'receptions',
+    'targets': 'targets',
+    'receiving_yards': 'receiving_yards',
+    'receiving_tds': 'receiving_tds',
+    'fantasy_points': 'fantasy_points',
+    'fantasy_points_ppr': 'fantasy_points_ppr'
+}
+
+# Define which columns should be integers vs decimals
+INTEGER_COLUMNS = [
+    'week', 'season', 'completions', 'attempts', 'passing_yards', 
+    'passing_tds', 'interceptions', 'sacks', 'carries', 'rushing_yards', 
+    'rushing_tds', 'receptions', 'targets', 'receiving_yards', 'receiving_tds'
+]
+
+# Declared dtypes of the weekly columns we load; nothing else is read from nfl_data_py.
+# Counts that fit are int8/int16 and repeated strings are categoricals.
+INGEST_SCHEMA = {
+    'player_id': 'object',
+    'player_name': 'object',
+    'player_display_name': 'object',
+    'position': 'category',
+    'position_group': 'category',
+    'recent_team': 'category',
+    'week': 'int8',
+    'season': 'int16',
+    'season_type': 'category',
+    'opponent_team': 'category',
+    'completions': 'int16',
+    'attempts': 'int16',
+    'passing_yards': 'int16',
+    'passing_tds': 'int8',
+    'interceptions': 'int8',
+    'sacks': 'int8',
+    'carries': 'int16',
+    'rushing_yards': 'int16',
+    'rushing_tds': 'int8',
+    'receptions': 'int16',
+    'targets': 'int16',
+    'receiving_yards': 'int16',
+    'receiving_tds': 'int8',
+    'fantasy_points': 'float32',
+    'fantasy_points_ppr': 'float32'
+}
+
 # Initialize Supabase client
 def get_supabase_client():
     """Initialize and return Supabase client."""
@@ -41,27 +129,31 @@ def get_supabase_client():
     
     return create_client(url, key)
 
-def get_current_season():
-    """Get the current NFL season."""
-    current_date = datetime.now()
-    current_year = current_date.year
-    current_month = current_date.month
-    current_day = current_date.day
-    
-    # NFL season starts on September 4th
-    # If we're before September 4th, we're still in the previous season
-    if current_month == 9 and current_day < 4:
-        return current_year - 1
-    elif current_month < 9:
-        return current_year - 1
-    else:
-        return current_year
+def apply_ingest_schema(data):
+    """Project weekly data to the INGEST_SCHEMA columns and cast them to their declared dtypes."""
+    columns = [col for col in INGEST_SCHEMA if col in data.columns]
+    typed = {}
+    for col in columns:
+        dtype = INGEST_SCHEMA[col]
+        if dtype.startswith('int'):
+            typed[col] = pd.to_numeric(data[col], errors='coerce').fillna(0).astype(dtype)
+        else:
+            typed[col] = data[col].astype(dtype)
+    return pd.DataFrame(typed, index=data.index)
 
 def download_weekly_data(season):
-    """Download weekly data for the specified season."""
+    """Download weekly data for the specified season, typed by INGEST_SCHEMA."""
     try:
         logger.info(f"Downloading weekly data for {season}...")
-        weekly_data = nfl.import_weekly_data([season])
+        # thread_requests makes nfl_data_py pass the column list to read_parquet instead of reading every column
+        weekly_data = cached_import(
+            'weekly', season,
+            lambda: nfl.import_weekly_data([season], columns=list(INGEST_SCHEMA), downcast=True,
+                                           thread_requests=True),
+            immutable=season < get_current_season()
+        )
+        # Also applies to entries cached before the schema existed, which hold every column
+        weekly_data = apply_ingest_schema(weekly_data)
         
         if not weekly_data.empty:
             logger.info(f"Successfully downloaded {len(weekly_data)} rows for {season}")
@@ -74,132 +166,103 @@ def download_weekly_data(season):
         logger.error(f"Error downloading weekly data for {season}: {e}")
         return None
 
-def download_schedule_data(season):
-    """Download schedule data for the specified season."""
-    try:
-        logger.info(f"Downloading schedule data for {season}...")
-        schedule_data = nfl.import_schedules([season])
-        
-        if not schedule_data.empty:
-            logger.info(f"Successfully downloaded {len(schedule_data)} schedule rows for {season}")
-            return schedule_data
+def build_game_results(schedule_data):
+    """Build a (week, team, opponent) -> game_result frame covering both sides of every scored game."""
+    # Skip games with missing scores
+    games = schedule_data.dropna(subset=['home_score', 'away_score'])
+    home_score = games['home_score'].astype(int).astype(str)
+    away_score = games['away_score'].astype(int).astype(str)
+    
+    # Use the result column (point differential) to determine winner
+    point_diff = games['result']
+    home_won = (point_diff > 0).to_numpy()
+    away_won = (point_diff < 0).to_numpy()
+    home_outcome = pd.Series(np.select([home_won, away_won], ['W', 'L'], default='T'), index=games.index)
+    away_outcome = pd.Series(np.select([home_won, away_won], ['L', 'W'], default='T'), index=games.index)
+    
+    # Ties report the home score first for both teams
+    home_result = home_outcome + ' ' + home_score + '-' + away_score
+    away_result = (away_outcome + ' ' + away_score + '-' + home_score).where(home_won | away_won, home_result)
+    
+    home_results = pd.DataFrame({
+        'week': games['week'], 'team': games['home_team'], 'opponent': games['away_team'],
+        'game_result': home_result, 'order': np.arange(len(games)) * 2
+    })
+    away_results = pd.DataFrame({
+        'week': games['week'], 'team': games['away_team'], 'opponent': games['home_team'],
+        'game_result': away_result, 'order': np.arange(len(games)) * 2 + 1
+    })
+    
+    # Later games win when a (week, team, opponent) key repeats, e.g. across seasons
+    game_results = pd.concat([home_results, away_results]).sort_values('order')
+    game_results = game_results.drop_duplicates(subset=['week', 'team', 'opponent'], keep='last')
+    return game_results.drop(columns='order')
+
+def join_game_results(data, game_results):
+    """Left-join player rows to build_game_results output on (week, team, opponent); unmatched rows get 'N/A'."""
+    with stage('game_results', rows_in=len(data)) as timer:
+        game_keys = data[['week', 'recent_team', 'opponent_team']].rename(
+            columns={'recent_team': 'team', 'opponent_team': 'opponent'}
+        )
+        merged = game_keys.merge(game_results, on=['week', 'team', 'opponent'], how='left')
+        data['game_result'] = merged['game_result'].fillna('N/A').to_numpy()
+        timer['rows_out'] = int((data['game_result'] != 'N/A').sum())
+    return data
+
+def add_game_results(data, schedule_data):
+    """Add a game_result column ("W 27-20", "L 20-27", "T 20-20" or 'N/A') from the schedule."""
+    logger.info("Adding game results from schedule data...")
+    game_results = build_game_results(schedule_data)
+    join_game_results(data, game_results)
+    logger.info(f"Added game results for {len(game_results)} team games")
+    return data
+
+def prepare_frame(data, season, schedule_data=None):
+    """Map weekly data to the nfl table schema, keeping the compact ingestion dtypes."""
+    # Debug: Let's see what columns are actually available
+    logger.debug(f"Available columns in NFL data: {list(data.columns)}")
+    
+    # Add game results if schedule data is available
+    if schedule_data is not None:
+        add_game_results(data, schedule_data)
+    
+    # Filter to only include columns that exist in the data and our schema
+    available_columns = [col for col in COLUMNS_MAPPING.keys() if col in data.columns]
+    logger.debug(f"Columns that will be mapped: {available_columns}")
+    
+    # Select only the columns we need and apply column mapping (rename columns to match database schema)
+    prepared_data = data[available_columns].rename(columns=COLUMNS_MAPPING)
+    
+    # Add season column if it doesn't exist
+    if 'season' not in prepared_data.columns:
+        prepared_data['season'] = season
+    
+    # Clean up any NaN values and convert data types
+    for col in prepared_data.columns:
+        column = prepared_data[col]
+        if col in INTEGER_COLUMNS:
+            # Typed columns are already clean; convert anything else to integer, handling NaN and decimal values
+            if not pd.api.types.is_integer_dtype(column):
+                prepared_data[col] = pd.to_numeric(column, errors='coerce').fillna(0).astype(int)
+        elif isinstance(column.dtype, pd.CategoricalDtype):
+            # Categoricals can only be filled with one of their categories
+            if column.isna().any():
+                prepared_data[col] = column.cat.add_categories([0]).fillna(0)
         else:
-            logger.warning(f"No schedule data available for {season}")
-            return None
-            
-    except Exception as e:
-        logger.error(f"Error downloading schedule data for {season}: {e}")
-        return None
+            # For non-integer columns, just fill NaN
+            prepared_data[col] = column.fillna(0)
+    
+    return prepared_data
+
+def iter_records(prepared_data, chunk_size=1000):
+    """Yield prepared rows as record dicts, converting one chunk of the frame at a time."""
+    for start in range(0, len(prepared_data), chunk_size):
+        yield from prepared_data.iloc[start:start + chunk_size].to_dict('records')
 
 def prepare_data(data, season, schedule_data=None):
-    """Prepare the weekly data for insertion into Supabase."""
+    """Prepare the weekly data for insertion into Supabase as a list of records."""
     try:
-        # Debug: Let's see what columns are actually available
-        logger.info(f"Available columns in NFL data: {list(data.columns)}")
-        
-        # Add game results if schedule data is available
-        if schedule_data is not None:
-            logger.info("Adding game results from schedule data...")
-            # Create a mapping of (week, team, opponent) to game result
-            game_results = {}
-            for _, game in schedule_data.iterrows():
-                week = game['week']
-                home_team = game['home_team']
-                away_team = game['away_team']
-                home_score = game['home_score']
-                away_score = game['away_score']
-                
-                # Skip if scores are missing
-                if pd.isna(home_score) or pd.isna(away_score):
-                    continue
-                
-                # Use the result column (point differential) to determine winner
-                point_diff = game['result']
-                if point_diff > 0:
-                    home_result = f"W {int(home_score)}-{int(away_score)}"
-                    away_result = f"L {int(away_score)}-{int(home_score)}"
-                elif point_diff < 0:
-                    home_result = f"L {int(home_score)}-{int(away_score)}"
-                    away_result = f"W {int(away_score)}-{int(home_score)}"
-                else:
-                    home_result = f"T {int(home_score)}-{int(away_score)}"
-                    away_result = home_result
-                
-                # Store results for both teams
-                game_results[(week, home_team, away_team)] = home_result
-                game_results[(week, away_team, home_team)] = away_result
-            
-            # Add game result to player data
-            data['game_result'] = data.apply(
-                lambda row: game_results.get((row['week'], row['recent_team'], row['opponent_team']), 'N/A'),
-                axis=1
-            )
-            logger.info(f"Added game results for {len(game_results)} games")
-        
-        # Select and rename columns to match our table schema
-        # Note: game_result is excluded from database insertion until column is added to schema
-        columns_mapping = {
-            'player_id': 'player_id',
-            'player_name': 'player_name',
-            'player_display_name': 'player_display_name',
-            'position': 'position',
-            'position_group': 'position_group',
-            'recent_team': 'team',
-            'week': 'week',
-            'season': 'season',
-            'season_type': 'season_type',
-            'opponent_team': 'opponent_team',
-            'game_result': 'game_result',
-            'completions': 'completions',
-            'attempts': 'attempts',
-            'passing_yards': 'passing_yards',
-            'passing_tds': 'passing_tds',
-            'interceptions': 'interceptions',
-            'sacks': 'sacks',
-            'carries': 'carries',
-            'rushing_yards': 'rushing_yards',
-            'rushing_tds': 'rushing_tds',
-            'receptions': 'receptions',
-            'targets': 'targets',
-            'receiving_yards': 'receiving_yards',
-            'receiving_tds': 'receiving_tds',
-            'fantasy_points': 'fantasy_points',
-            'fantasy_points_ppr': 'fantasy_points_ppr'
-        }
-        
-        # Define which columns should be integers vs decimals
-        integer_columns = [
-            'week', 'season', 'completions', 'attempts', 'passing_yards', 
-            'passing_tds', 'interceptions', 'sacks', 'carries', 'rushing_yards', 
-            'rushing_tds', 'receptions', 'targets', 'receiving_yards', 'receiving_tds'
-        ]
-        
-        # Filter to only include columns that exist in the data and our schema
-        available_columns = [col for col in columns_mapping.keys() if col in data.columns]
-        logger.info(f"Columns that will be mapped: {available_columns}")
-        
-        # Create a new dataframe with only the columns we need and apply column mapping
-        prepared_data = data[available_columns].copy()
-        
-        # Apply column mapping (rename columns to match database schema)
-        prepared_data = prepared_data.rename(columns=columns_mapping)
-        
-        # Add season column if it doesn't exist
-        if 'season' not in prepared_data.columns:
-            prepared_data['season'] = season
-        
-        # Clean up any NaN values and convert data types
-        for col in prepared_data.columns:
-            if col in integer_columns:
-                # Convert to integer, handling NaN and decimal values
-                prepared_data[col] = pd.to_numeric(prepared_data[col], errors='coerce').fillna(0).astype(int)
-            else:
-                # For non-integer columns, just fill NaN
-                prepared_data[col] = prepared_data[col].fillna(0)
-        
-        # Convert to list of dictionaries for Supabase insertion
-        records = prepared_data.to_dict('records')
-        
+        records = list(iter_records(prepare_frame(data, season, schedule_data)))
         logger.info(f"Prepared {len(records)} records for Supabase insertion")
         return records
         
@@ -207,77 +270,320 @@ def prepare_data(data, season, schedule_data=None):
         logger.error(f"Error preparing data for Supabase: {e}")
         return None
 
-def update_database(data, season, schedule_data=None):
-    """Update the database with new weekly data."""
+def load_ingest_state(state_file):
+    """Load the incremental ingestion state, or an empty state if there is none yet."""
+    if not state_file.exists():
+        return {'season': None, 'week': None, 'row_hashes': {}}
+    
+    with open(state_file) as f:
+        return json.load(f)
+
+def save_ingest_state(state, state_file):
+    """Write the incremental ingestion state, replacing the previous file atomically."""
+    temp_file = state_file.with_suffix('.tmp')
+    with open(temp_file, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_file, state_file)
+    logger.info(f"Saved ingestion state for {state['season']} week {state['week']}: {state_file}")
+
+def compute_row_hashes(data, season):
+    """Hash each prepared row, keyed on the nfl table conflict key."""
+    row_seasons = data['season'].astype(str) if 'season' in data.columns else str(season)
+    keys = (
+        data['player_id'].astype(str) + ',' + data['team'].astype(str) + ',' +
+        data['week'].astype(str) + ',' + row_seasons
+    )
+    hashes = pd.util.hash_pandas_object(data, index=False).astype(str)
+    return pd.Series(hashes.to_numpy(), index=keys.to_numpy())
+
+def select_changed_rows(data, row_hashes, state, season):
+    """Return a boolean mask of the rows that are new or changed since the last ingestion."""
+    # Hashes from a different season can never match, so start over when the season rolls
+    previous_hashes = state['row_hashes'] if state.get('season') == season else {}
+    previous = row_hashes.index.map(previous_hashes.get)
+    return pd.Series(previous.to_numpy() != row_hashes.to_numpy(), index=data.index)
+
+def fetch_chunks(seasons, chunk_size=5000, stats=None, downloaded=None):
+    """Pipeline stage: download each season's weekly data and yield it in chunks of chunk_size rows.
+
+    Seasons in downloaded ({season: weekly data}) are used as they are instead
+    of being downloaded again. Only one season is held in memory at a time.
+    """
+    downloaded = downloaded or {}
+    for season in seasons:
+        data = downloaded[season] if downloaded.get(season) is not None else download_weekly_data(season)
+        if data is None:
+            continue
+        if stats is not None:
+            stats['rows_fetched'] = stats.get('rows_fetched', 0) + len(data)
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start:start + chunk_size]
+
+def normalize_chunks(chunks):
+    """Pipeline stage: cast chunks to the INGEST_SCHEMA columns and dtypes."""
+    for chunk in chunks:
+        yield apply_ingest_schema(chunk)
+
+def enrich_chunks(chunks, schedules=None):
+    """Pipeline stage: add game results from each season's schedule, taken from schedules if given."""
+    schedules = schedules or {}
+    results_season = None
+    game_results = None
+    for chunk in chunks:
+        season = int(chunk['season'].iloc[0])
+        if season != results_season:
+            schedule_data = schedules.get(season)
+            if schedule_data is None:
+                schedule_data = download_schedule_data(season)
+            game_results = build_game_results(schedule_data) if schedule_data is not None else None
+            results_season = season
+        if game_results is not None:
+            join_game_results(chunk, game_results)
+        yield chunk
+
+def select_changed_frames(frames, state, season, new_state):
+    """Pipeline stage for incremental runs: only pass on prepared rows that are new or changed since the last ingestion.
+
+    Every row's hash is recorded in new_state['row_hashes'] as the frames flow through.
+    """
+    skipped = 0
+    for frame in frames:
+        row_hashes = compute_row_hashes(frame, season)
+        changed = select_changed_rows(frame, row_hashes, state, season)
+        new_state['row_hashes'].update(row_hashes.items())
+        if len(frame):
+            new_state['week'] = max(new_state['week'] or 0, int(frame['week'].max()))
+        skipped += int((~changed).sum())
+        count('unchanged_rows', int((~changed).sum()))
+        if changed.any():
+            yield frame[changed]
+    logger.info(f"Incremental mode: {skipped} unchanged rows skipped")
+
+def validate_chunks(chunks, season):
+    """Pipeline stage: map chunks to the nfl table schema and drop rows that cannot be upserted."""
+    for chunk in chunks:
+        with stage('prepare', rows_in=len(chunk)) as timer:
+            prepared_data = prepare_frame(chunk, season)
+            invalid = (prepared_data['player_id'].isin([0, '']) | (prepared_data['week'] < 1))
+            if invalid.any():
+                logger.warning(f"Dropping {int(invalid.sum())} rows without a player_id or week")
+                count('invalid_rows', int(invalid.sum()))
+                prepared_data = prepared_data[~invalid]
+            timer['rows_out'] = len(prepared_data)
+        yield prepared_data
+
+def batch_records(frames, batch_size=100):
+    """Pipeline stage: turn prepared frames into lists of up to batch_size record dicts."""
+    return iter_batches((record for frame in frames for record in iter_records(frame)), batch_size)
+
+def tee_frames(frames, sink, name, summaries, batch_size=100):
+    """Pipeline stage: send every frame's records to sink in batches, then pass the frame on unchanged.
+
+    The sink's summary is stored in summaries[name] once the frames run out.
+    """
+    next(sink)
+    try:
+        for frame in frames:
+            for batch in batch_records([frame], batch_size):
+                sink.send(batch)
+            yield frame
+    except BaseException:
+        sink.close()
+        raise
+    summaries[name] = finish_sink(sink)
+
+def update_database(season, incremental=False, state_file=DEFAULT_STATE_FILE, backup_file=None, sqlite_file=None,
+                    postgres_dsn=None, chunk_size=5000, client=None, weekly_data=None, schedule_data=None,
+                    **upsert_options):
+    """Stream a season of weekly data into the database.
+
+    Chunks flow through fetch -> normalize -> enrich -> validate -> batch and
+    each batch is sent to every sink: Supabase, plus the optional CSV backup
+    and local SQLite copy, and a direct Postgres connection bulk loaded
+    with COPY (postgres_dsn). Extra keyword arguments (batch_size, workers,
+    max_retries, dead_letter_file) are passed through to upsert_records.
+    Pass client to upsert through something other than the Supabase client
+    from the environment, e.g. a stub, and weekly_data/schedule_data to use
+    frames that were already downloaded.
+
+    Incremental runs only send new or changed rows to the database sinks;
+    the CSV backup still gets every row. If Supabase cannot be reached the
+    data still goes to the local sinks and is saved to temp_weekly_<season>.csv.
+    Returns the summary of each sink, or None if no data was downloaded or
+    Supabase could not be reached.
+    """
     try:
         # Initialize Supabase client
-        supabase = get_supabase_client()
+        supabase = client if client is not None else get_supabase_client()
         logger.info("Connected to Supabase successfully")
+    except Exception as e:
+        logger.error(f"Error connecting to Supabase: {e}")
+        supabase = None
+        # Fallback to saving temporary file
+        backup_file = Path(f"temp_weekly_{season}.csv")
+        # Nothing is upserted, so there is nothing to compare against
+        incremental = False
+    
+    try:
+        sinks = {}
+        if supabase is not None:
+            sinks['supabase'] = supabase_sink(supabase, 'nfl', CONFLICT_KEY, **upsert_options)
+        if backup_file is not None:
+            sinks['backup'] = csv_sink(backup_file)
+        if sqlite_file is not None:
+            sinks['sqlite'] = sqlite_sink(sqlite_file, 'nfl', CONFLICT_KEY.split(','))
+        if postgres_dsn is not None:
+            sinks['postgres'] = postgres_sink(postgres_dsn, 'nfl', CONFLICT_KEY.split(','))
         
-        # Prepare data for insertion
-        records = prepare_data(data, season, schedule_data)
+        stats = {}
+        batch_size = upsert_options.get('batch_size', 100)
+        chunks = fetch_chunks([season], chunk_size, stats, downloaded={season: weekly_data})
+        chunks = enrich_chunks(normalize_chunks(chunks), schedules={season: schedule_data})
+        frames = validate_chunks(chunks, season)
+        tee_summaries = {}
+        if incremental:
+            # The backup is taken before the change filter so it always holds the whole season
+            if 'backup' in sinks:
+                frames = tee_frames(frames, sinks.pop('backup'), 'backup', tee_summaries, batch_size)
+            state = load_ingest_state(state_file)
+            new_state = {'season': season, 'week': None, 'row_hashes': {}}
+            # Hash the prepared rows, so game results and the table mapping are part of the content
+            frames = select_changed_frames(frames, state, season, new_state)
         
-        if not records:
-            logger.error("No records prepared for insertion")
-            return
+        # Upsert data into the nfl table (insert or update existing records) while writing the other sinks
+        summaries = run_pipeline(batch_records(frames, batch_size), sinks)
+        summaries.update(tee_summaries)
         
-        # Upsert data into the nfl table (insert or update existing records)
-        logger.info(f"Upserting {len(records)} records into Supabase...")
+        if not stats.get('rows_fetched'):
+            logger.error("Failed to download weekly data")
+            return None
         
-        # Upsert in batches to avoid overwhelming the API
-        batch_size = 100
-        total_upserted = 0
+        if supabase is None:
+            logger.info(f"Database update failed, saved to temporary file: {backup_file}")
+            return None
         
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            try:
-                # Use upsert to handle existing records
-                result = supabase.table('nfl').upsert(batch, on_conflict='player_id,team,week,season').execute()
-                batch_upserted = len(result.data) if result.data else 0
-                total_upserted += batch_upserted
-                logger.info(f"Upserted batch {i//batch_size + 1}: {batch_upserted} records")
-            except Exception as e:
-                logger.error(f"Error upserting batch {i//batch_size + 1}: {e}")
-                # Continue with next batch instead of failing completely
+        summary = summaries['supabase']
+        logger.info(f"Database update completed! Total records upserted: {summary['rows_upserted']}")
         
-        logger.info(f"Database update completed! Total records upserted: {total_upserted}")
+        if incremental:
+            # Keep the previous hashes for failed rows so the next run retries them
+            previous_hashes = state['row_hashes'] if state.get('season') == season else {}
+            for record in summary['failed_records']:
+                key = f"{record['player_id']},{record['team']},{record['week']},{record['season']}"
+                if key in previous_hashes:
+                    new_state['row_hashes'][key] = previous_hashes[key]
+                else:
+                    new_state['row_hashes'].pop(key, None)
+            save_ingest_state(new_state, state_file)
         
-        # Also save to temporary file as backup
-        temp_file = Path(f"temp_nfl_{season}.csv")
-        data.to_csv(temp_file, index=False)
-        logger.info(f"Saved backup file: {temp_file}")
+        return summaries
         
     except Exception as e:
         logger.error(f"Error updating database: {e}")
-        # Fallback to saving temporary file
-        temp_file = Path(f"temp_weekly_{season}.csv")
-        data.to_csv(temp_file, index=False)
-        logger.info(f"Database update failed, saved to temporary file: {temp_file}")
+        return None
+
+def notify_game_log_service():
+    """Ask the game log service at GAME_LOG_SERVICE_URL, if set, to reload its store and drop cached responses."""
+    url = os.environ.get("GAME_LOG_SERVICE_URL")
+    if not url:
+        return
+    
+    try:
+        request = urllib.request.Request(f"{url.rstrip('/')}/reload", method='POST')
+        with urllib.request.urlopen(request, timeout=120) as response:
+            logger.info(f"Game log service reloaded: {response.read().decode()}")
+    except Exception as e:
+        logger.warning(f"Could not reload the game log service at {url}: {e}")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Download weekly NFL stats and upsert them into Supabase.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only prepare and upsert rows that are new or changed since the last run")
+    parser.add_argument('--state-file', type=Path, default=DEFAULT_STATE_FILE,
+                        help=f"Incremental ingestion state file (default: {DEFAULT_STATE_FILE.name})")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Number of concurrent upsert workers (default: 4)")
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help="Records per upsert batch (default: 100)")
+    parser.add_argument('--max-retries', type=int, default=4,
+                        help="Retries per failed batch before it is dead-lettered (default: 4)")
+    parser.add_argument('--dead-letter-file', type=Path, default=DEFAULT_DEAD_LETTER_FILE,
+                        help=f"File that receives batches which still fail (default: {DEFAULT_DEAD_LETTER_FILE.name})")
+    parser.add_argument('--replay-dead-letters', action='store_true',
+                        help="Replay the dead-letter file instead of downloading new data")
+    parser.add_argument('--backup-file', type=Path,
+                        help="CSV backup written while upserting (default: temp_nfl_<season>.csv)")
+    parser.add_argument('--no-backup', action='store_true',
+                        help="Do not write the CSV backup")
+    parser.add_argument('--sqlite-file', type=Path,
+                        help="Also upsert the records into a local SQLite database")
+    parser.add_argument('--postgres-dsn',
+                        help="Also bulk load the records into this Postgres database with COPY")
+    parser.add_argument('--skip-summaries', action='store_true',
+                        help="Do not recompute the nfl_prop_summaries table after ingestion")
+    parser.add_argument('--skip-projections', action='store_true',
+                        help="Do not recompute the nfl_projections table after ingestion")
+    add_cache_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return parser.parse_args()
 
 def main():
     """Main function to update weekly stats."""
+    args = parse_args()
+    configure_from_args(args)
+    start_run('update_nfl_stats', args)
     logger.info("Starting weekly stats update...")
     
+    upsert_options = {
+        'batch_size': args.batch_size,
+        'workers': args.workers,
+        'max_retries': args.max_retries,
+        'dead_letter_file': args.dead_letter_file
+    }
+    
     try:
+        if args.replay_dead_letters:
+            dead_letter_file = upsert_options.pop('dead_letter_file')
+            replay_dead_letters(get_supabase_client(), dead_letter_file, **upsert_options)
+            finish_run()
+            return
+        
         # Get current season
         current_season = get_current_season()
         logger.info(f"Current NFL season: {current_season}")
         
-        # Download weekly data
-        weekly_data = download_weekly_data(current_season)
+        backup_file = None
+        if not args.no_backup:
+            backup_file = args.backup_file or Path(f"temp_nfl_{current_season}.csv")
         
-        # Download schedule data for game results
-        schedule_data = download_schedule_data(current_season)
+        # Stream weekly data into the database
+        summaries = update_database(current_season, incremental=args.incremental, state_file=args.state_file,
+                                    backup_file=backup_file, sqlite_file=args.sqlite_file,
+                                    postgres_dsn=args.postgres_dsn, **upsert_options)
         
-        if weekly_data is not None:
-            # Update database
-            update_database(weekly_data, current_season, schedule_data)
+        if summaries is not None:
+            # Precompute per-player prop summaries for the UI and API
+            if not args.skip_summaries:
+                refresh_prop_summaries(get_supabase_client(), current_season, **upsert_options)
+            
+            # Opponent-adjusted projections for each player's next game
+            if not args.skip_projections:
+                refresh_projections(get_supabase_client(), current_season, download_schedule_data(current_season),
+                                    **upsert_options)
+            
+            # Drop game logs cached by the local query service
+            notify_game_log_service()
+            
             logger.info("Weekly stats update completed successfully!")
+            finish_run()
         else:
-            logger.error("Failed to download weekly data")
+            logger.error("Weekly stats update failed")
+            finish_run('failed')
             
     except Exception as e:
         logger.error(f"Error in main process: {e}")
+        finish_run('error')
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Supabase Upsert Engine
+
+Upserts records into a Supabase table in concurrent batches. Failed batches
+are retried with exponential backoff and jitter, and batches that still fail
+are written to a dead-letter file so they can be replayed later.
+
+The engine only needs an object with a `table(name)` method returning a
+builder with `upsert(records, on_conflict=...).execute()`, so a local stub can
+stand in for the Supabase client.
+"""
+
+import json
+import time
+import random
+import logging
+import threading
+from datetime import datetime
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from instrumentation import stage, count
+
+logger = logging.getLogger(__name__)
+
+def iter_batches(records, batch_size):
+    """Yield lists of up to batch_size records from any iterable of records."""
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def backoff_delay(attempt, base_delay, max_delay):
+    """Return an exponential backoff delay with full jitter for the given retry attempt."""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+def percentile(sorted_values, pct):
+    """Return the pct percentile of an already sorted list (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def write_dead_letter(dead_letter_file, lock, table_name, on_conflict, batch_number, batch, error):
+    """Append a failed batch to the dead-letter file as one JSON line."""
+    entry = {
+        'table': table_name,
+        'on_conflict': on_conflict,
+        'batch': batch_number,
+        'failed_at': datetime.now().isoformat(),
+        'error': str(error),
+        'records': batch
+    }
+    with lock:
+        with open(dead_letter_file, 'a') as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+def upsert_batch(client, table_name, batch, on_conflict, batch_number, max_retries, base_delay, max_delay):
+    """Upsert a single batch, retrying on failure. Returns (rows upserted, attempt latencies, retries)."""
+    latencies = []
+    for attempt in range(max_retries + 1):
+        started = time.perf_counter()
+        try:
+            with stage('upsert_batch', rows_in=len(batch)) as timer:
+                result = client.table(table_name).upsert(batch, on_conflict=on_conflict).execute()
+                timer['rows_out'] = len(result.data) if result.data else 0
+            latencies.append(time.perf_counter() - started)
+            return timer['rows_out'], latencies, attempt
+        except Exception as e:
+            latencies.append(time.perf_counter() - started)
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(f"Batch {batch_number} failed (attempt {attempt + 1}/{max_retries + 1}): {e}; retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+def upsert_records(client, table_name, records, on_conflict, batch_size=100, workers=4,
+                   max_retries=4, base_delay=0.5, max_delay=30.0, dead_letter_file=None):
+    """Upsert records in concurrent batches and return a summary of the run.
+
+    At most `workers * 2` batches are in flight at once, so a slow API holds
+    back the producer instead of buffering the whole record stream in memory.
+    """
+    lock = threading.Lock()
+    in_flight = {}
+    latencies = []
+    failed_records = []
+    summary = {
+        'rows_upserted': 0,
+        'batches': 0,
+        'retries': 0,
+        'failed_batches': 0,
+        'failed_rows': 0
+    }
+
+    def collect(done):
+        for future in done:
+            batch_number, batch = in_flight.pop(future)
+            try:
+                rows, attempt_latencies, retries = future.result()
+                summary['rows_upserted'] += rows
+                summary['retries'] += retries
+                count('upsert_retries', retries)
+                latencies.extend(attempt_latencies)
+                logger.info(f"Upserted batch {batch_number}: {rows} records")
+            except Exception as e:
+                logger.error(f"Error upserting batch {batch_number} after {max_retries + 1} attempts: {e}")
+                summary['retries'] += max_retries
+                summary['failed_batches'] += 1
+                summary['failed_rows'] += len(batch)
+                count('upsert_retries', max_retries)
+                count('failed_batches')
+                count('failed_rows', len(batch))
+                failed_records.extend(batch)
+                if dead_letter_file is not None:
+                    write_dead_letter(dead_letter_file, lock, table_name, on_conflict, batch_number, batch, e)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch_number, batch in enumerate(iter_batches(records, batch_size), start=1):
+            # Backpressure: wait for a slot before pulling more records
+            while len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            future = executor.submit(upsert_batch, client, table_name, batch, on_conflict,
+                                     batch_number, max_retries, base_delay, max_delay)
+            in_flight[future] = (batch_number, batch)
+            summary['batches'] += 1
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    summary['elapsed_seconds'] = elapsed
+    summary['rows_per_second'] = summary['rows_upserted'] / elapsed if elapsed > 0 else 0.0
+    summary['latency_p50'] = percentile(latencies, 50)
+    summary['latency_p90'] = percentile(latencies, 90)
+    summary['latency_p99'] = percentile(latencies, 99)
+    summary['failed_records'] = failed_records
+
+    logger.info(
+        f"Upserted {summary['rows_upserted']} rows in {summary['batches']} batches over {elapsed:.2f}s "
+        f"({summary['rows_per_second']:.0f} rows/sec, {workers} workers); "
+        f"batch latency p50={summary['latency_p50'] * 1000:.0f}ms "
+        f"p90={summary['latency_p90'] * 1000:.0f}ms p99={summary['latency_p99'] * 1000:.0f}ms; "
+        f"{summary['retries']} retries"
+    )
+    if summary['failed_batches']:
+        logger.error(
+            f"{summary['failed_batches']} batches ({summary['failed_rows']} rows) failed"
+            + (f" and were written to {dead_letter_file}" if dead_letter_file is not None else "")
+        )
+
+    return summary
+
+def replay_dead_letters(client, dead_letter_file, **upsert_options):
+    """Replay every batch in a dead-letter file. Batches that fail again are written back to it.
+
+    Batches left in the .replaying file by a replay that crashed are replayed too.
+    """
+    replay_file = dead_letter_file.with_suffix('.replaying')
+    if not dead_letter_file.exists() and not replay_file.exists():
+        logger.info(f"No dead-letter file to replay: {dead_letter_file}")
+        return None
+
+    # Move the file aside first so batches failing again are appended to a fresh file
+    if not replay_file.exists():
+        dead_letter_file.replace(replay_file)
+    elif dead_letter_file.exists():
+        # An earlier replay crashed: add the new dead letters to its file instead of overwriting it
+        logger.warning(f"Resuming an interrupted replay: {replay_file}")
+        with open(dead_letter_file) as source, open(replay_file, 'a') as target:
+            target.write(source.read())
+        dead_letter_file.unlink()
+    else:
+        logger.warning(f"Resuming an interrupted replay: {replay_file}")
+
+    with open(replay_file) as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    logger.info(f"Replaying {len(entries)} dead-lettered batches from {dead_letter_file}")
+
+    summaries = []
+    for table_name, on_conflict in sorted({(e['table'], e['on_conflict']) for e in entries}):
+        records = [
+            record
+            for entry in entries if (entry['table'], entry['on_conflict']) == (table_name, on_conflict)
+            for record in entry['records']
+        ]
+        summaries.append(upsert_records(client, table_name, records, on_conflict,
+                                        dead_letter_file=dead_letter_file, **upsert_options))
+
+    replay_file.unlink()
+    return summaries
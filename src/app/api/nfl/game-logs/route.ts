@@ -6,6 +6,28 @@ const supabaseUrl = process.env.SUPABASE_URL!;
 const supabaseKey = process.env.SUPABASE_ANON_KEY!;
 const supabase = createClient(supabaseUrl, supabaseKey);
 
+// Optional local game log service (scripts/game_log_service.py) that answers from memory
+const gameLogServiceUrl = process.env.GAME_LOG_SERVICE_URL;
+
+// Filters passed through to the game log service
+const SERVICE_FILTERS = ['season', 'seasonType', 'opponent', 'location', 'last'];
+
+async function fetchFromService(searchParams: URLSearchParams) {
+  const params = new URLSearchParams();
+  for (const name of ['playerId', ...SERVICE_FILTERS]) {
+    const value = searchParams.get(name);
+    if (value) {
+      params.set(name, value);
+    }
+  }
+
+  const response = await fetch(`${gameLogServiceUrl}/game-logs?${params}`, { cache: 'no-store' });
+  if (!response.ok) {
+    throw new Error(`Game log service returned ${response.status}`);
+  }
+  return response.json();
+}
+
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
@@ -18,6 +40,15 @@ export async function GET(request: NextRequest) {
       );
     }
 
+    // Answer from the local game log service when configured, falling back to Supabase
+    if (gameLogServiceUrl) {
+      try {
+        return NextResponse.json(await fetchFromService(searchParams));
+      } catch (serviceError) {
+        console.error('Game log service error:', serviceError);
+      }
+    }
+
     // Query the database for all game logs for the player (all seasons)
     const { data, error } = await supabase
       .from('nfl')
@@ -0,0 +1,66 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { createClient } from '@supabase/supabase-js';
+
+// Initialize Supabase client
+const supabaseUrl = process.env.SUPABASE_URL!;
+const supabaseKey = process.env.SUPABASE_ANON_KEY!;
+const supabase = createClient(supabaseUrl, supabaseKey);
+
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url);
+    const playerId = searchParams.get('playerId');
+
+    if (!playerId) {
+      return NextResponse.json(
+        { error: 'playerId parameter is required' },
+        { status: 400 }
+      );
+    }
+
+    // Precomputed by scripts/projections.py after each stats ingestion; latest week first
+    const { data, error } = await supabase
+      .from('nfl_projections')
+      .select('season, week, prop_type, opponent_team, games, baseline, dvp_factor, projection, line')
+      .eq('player_id', playerId)
+      .order('season', { ascending: false })
+      .order('week', { ascending: false });
+
+    if (error) {
+      console.error('Supabase error:', error);
+      return NextResponse.json(
+        { error: 'Failed to fetch projections' },
+        { status: 500 }
+      );
+    }
+
+    // Only the player's next game
+    const latest = data?.[0];
+    const projections = data
+      ?.filter(projection => projection.season === latest.season && projection.week === latest.week)
+      .map(projection => ({
+        season: projection.season,
+        week: projection.week,
+        propType: projection.prop_type,
+        opponent: projection.opponent_team,
+        games: projection.games,
+        baseline: projection.baseline,
+        opponentFactor: projection.dvp_factor,
+        projection: projection.projection,
+        line: projection.line,
+      })) || [];
+
+    return NextResponse.json({
+      playerId,
+      projections,
+      total: projections.length
+    });
+
+  } catch (error) {
+    console.error('API error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
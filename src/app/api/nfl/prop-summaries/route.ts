@@ -0,0 +1,72 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { createClient } from '@supabase/supabase-js';
+
+// Initialize Supabase client
+const supabaseUrl = process.env.SUPABASE_URL!;
+const supabaseKey = process.env.SUPABASE_ANON_KEY!;
+const supabase = createClient(supabaseUrl, supabaseKey);
+
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url);
+    const playerId = searchParams.get('playerId');
+    const propType = searchParams.get('propType');
+
+    if (!playerId) {
+      return NextResponse.json(
+        { error: 'playerId parameter is required' },
+        { status: 400 }
+      );
+    }
+
+    // Precomputed by scripts/prop_summaries.py after each stats ingestion
+    let query = supabase
+      .from('nfl_prop_summaries')
+      .select('season, prop_type, games, mean, median, min, max, last_5_avg, last_10_avg, last_20_avg, hit_curves')
+      .eq('player_id', playerId)
+      .order('season', { ascending: false });
+
+    if (propType) {
+      query = query.eq('prop_type', propType);
+    }
+
+    const { data, error } = await query;
+
+    if (error) {
+      console.error('Supabase error:', error);
+      return NextResponse.json(
+        { error: 'Failed to fetch prop summaries' },
+        { status: 500 }
+      );
+    }
+
+    // Transform the data to match our UI expectations
+    const summaries = data?.map(summary => ({
+      season: summary.season,
+      propType: summary.prop_type,
+      games: summary.games,
+      average: summary.mean,
+      median: summary.median,
+      low: summary.min,
+      high: summary.max,
+      last5Average: summary.last_5_avg,
+      last10Average: summary.last_10_avg,
+      last20Average: summary.last_20_avg,
+      // { L5 | L10 | L20 | <season>: { games, mean, median, min, max, over_hits } }
+      hitCurves: summary.hit_curves,
+    })) || [];
+
+    return NextResponse.json({
+      playerId,
+      summaries,
+      total: summaries.length
+    });
+
+  } catch (error) {
+    console.error('API error:', error);
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    );
+  }
+}
@@ -61,6 +61,7 @@ export function Player({ player, team, onBack, onAddLine, betLines = [] }: Playe
   const [gameLogs, setGameLogs] = useState<any[]>([])
   const [rawGameLogs, setRawGameLogs] = useState<any[]>([])
   const [gameLogsLoading, setGameLogsLoading] = useState(false)
+  const [projectedLines, setProjectedLines] = useState<Record<string, number>>({})
   const [selectedSeason, setSelectedSeason] = useState(2024)
 
   // Helper function to get team info by abbreviation
@@ -134,10 +135,37 @@ export function Player({ player, team, onBack, onAddLine, betLines = [] }: Playe
     }
   }
 
-  // Fetch game logs when player changes
+  // Fetch opponent-adjusted lines for the player's next game (prop type -> line)
+  // Responses that arrive after the player changed (isStale) are ignored
+  const fetchProjections = async (playerId: string, isStale: () => boolean) => {
+    // Drop the previous player's lines so they never show against this player
+    setProjectedLines({})
+    try {
+      const response = await fetch(`/api/nfl/projections?playerId=${playerId}`)
+      if (!response.ok) {
+        throw new Error('Failed to fetch projections')
+      }
+      const data = await response.json()
+      const lines: Record<string, number> = {}
+      for (const projection of data.projections || []) {
+        lines[projection.propType] = projection.line
+      }
+      if (!isStale()) setProjectedLines(lines)
+    } catch (error) {
+      console.error('Error fetching projections:', error)
+      if (!isStale()) setProjectedLines({})
+    }
+  }
+
+  // Fetch game logs and projections when player changes
   useEffect(() => {
+    let cancelled = false
     if (player && player.player_id) {
       fetchGameLogs(player.player_id)
+      fetchProjections(player.player_id, () => cancelled)
+    }
+    return () => {
+      cancelled = true
     }
   }, [player])
 
@@ -300,6 +328,7 @@ export function Player({ player, team, onBack, onAddLine, betLines = [] }: Playe
             onAddLine={onAddLine}
             betLines={betLines}
             rawGameLogs={rawGameLogs}
+            projectedLines={projectedLines}
           />
         </div>
 
@@ -1,5 +1,6 @@
+import { useState, useEffect } from "react"
 import { Button } from "@/components/ui/button"
-import { rosters } from "@/lib/data/rosters"
+import { decodeColumnar } from "@/lib/columnar"
 import { PlayerCard } from "../ui/player-card"
 
 interface TeamPlayersViewProps {
@@ -9,10 +10,24 @@ interface TeamPlayersViewProps {
 }
 
 export function Roster({ team, onBack, onPlayerClick }: TeamPlayersViewProps) {
-  // Get players for selected team
-  const getTeamPlayers = (teamAbbr: string) => {
-    return rosters.filter(player => player.team === teamAbbr)
-  }
+  const [teamPlayers, setTeamPlayers] = useState<any[]>([])
+
+  // Load the selected team's roster shard on demand instead of every team's roster up front
+  useEffect(() => {
+    let cancelled = false
+    setTeamPlayers([])
+    import(`@/lib/data/rosters/${team.team_abbr}.js`)
+      .then(({ rosters }) => {
+        if (!cancelled) setTeamPlayers(decodeColumnar(rosters))
+      })
+      .catch((error) => {
+        console.error('Error loading roster:', error)
+        if (!cancelled) setTeamPlayers([])
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [team.team_abbr])
 
   // Group players by position
   const groupPlayersByPosition = (players: any[]) => {
@@ -36,7 +51,6 @@ export function Roster({ team, onBack, onPlayerClick }: TeamPlayersViewProps) {
       }, {} as { [key: string]: any[] })
   }
 
-  const teamPlayers = getTeamPlayers(team.team_abbr)
   const groupedPlayers = groupPlayersByPosition(teamPlayers)
 
   return (
@@ -49,9 +49,11 @@ interface PlayerPropsProps {
     }>
   }>
   rawGameLogs: any[]
+  // Opponent-adjusted default lines by prop type, from /api/nfl/projections
+  projectedLines?: Record<string, number>
 }
 
-export function PlayerProps({ player, gameLogsLoading, onAddLine, betLines = [], rawGameLogs }: PlayerPropsProps) {
+export function PlayerProps({ player, gameLogsLoading, onAddLine, betLines = [], rawGameLogs, projectedLines = {} }: PlayerPropsProps) {
   // Get position-specific prop buttons
   const getPropButtons = (player: any) => {
     const position = player.position
@@ -166,7 +168,10 @@ export function PlayerProps({ player, gameLogsLoading, onAddLine, betLines = [],
       .filter(val => val > 0) // Only include games where the player played
     
     const average = values.length > 0 ? values.reduce((sum, val) => sum + val, 0) / values.length : 0
-    const defaultValue = average > 0 ? (Math.floor(average) + 0.5).toString() : "0.5"
+    const projectedLine = projectedLines[prop.type]
+    const defaultValue = projectedLine !== undefined
+      ? projectedLine.toString()
+      : average > 0 ? (Math.floor(average) + 0.5).toString() : "0.5"
     
     onAddLine({
       player: player.player_name,
@@ -0,0 +1,30 @@
+// Column-oriented data files written by scripts/update_nfl_data.py: the per-team
+// roster shards, and <name>.columnar.js next to the row-array files with --columnar
+export interface ColumnarDataset {
+  length: number
+  columns: Record<string, unknown[]>
+  dictionaries: Record<string, unknown[]>
+}
+
+// Expand a columnar dataset back into row objects.
+// Dictionary-encoded columns store an index into dictionaries[column] (or null).
+//
+// Per-team roster shards are imported lazily (see components/dashboard/roster.tsx), e.g.
+//   const { rosters } = await import(`@/lib/data/rosters/${teamAbbr}.js`)
+//   const players = decodeColumnar(rosters)
+export function decodeColumnar<T = Record<string, any>>(dataset: ColumnarDataset): T[] {
+  const names = Object.keys(dataset.columns)
+  const rows: T[] = new Array(dataset.length)
+
+  for (let i = 0; i < dataset.length; i++) {
+    const row: Record<string, unknown> = {}
+    for (const name of names) {
+      const value = dataset.columns[name][i]
+      const dictionary = dataset.dictionaries[name]
+      row[name] = dictionary && value !== null ? dictionary[value as number] : value
+    }
+    rows[i] = row as T
+  }
+
+  return rows
+}
@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,0,2,0,1,1,3,0,1,3,0,3,0,1],"jersey_number":[0.0,6.0,17.0,1.0,4.0,20.0,22.0,85.0,14.0,31.0,84.0,89.0,87.0,18.0,33.0],"status":[0,1,0,0,0,0,0,0,2,1,0,0,0,0,1],"player_name":["Zach Pascal","James Conner","Zay Jones","Kyler Murray","Greg Dortch","DeeJay Dallas","Michael Carter","Trey McBride","Michael Wilson","Emari Demercado","Elijah Higgins","Xavier Weaver","Tip Reiman","Marvin Harrison Jr.","Trey Benson"],"first_name":["Zachary","James","Isaiah","Kyler","Greg","Demetrius","Michael","Trey","Michael","Emari","Elijah","Xavier","Tip","Marvin","Trey"],"last_name":["Pascal","Conner","Jones","Murray","Dortch","Dallas","Carter","McBride","Wilson","Demercado","Higgins","Weaver","Reiman","Harrison","Benson"],"player_id":["00-0033251","00-0033553","00-0033891","00-0035228","00-0035500","00-0036425","00-0036924","00-0037744","00-0038559","00-0038705","00-0039041","00-0039521","00-0039737","00-0039849","00-0039921"],"height":[74.0,73.0,74.0,70.0,67.0,70.0,68.0,76.0,74.0,69.0,75.0,73.0,76.0,76.0,73.0],"weight":[214,233,200,207,173,214,200,245,209,210,234,180,270,205,215],"years_exp":[7,7,7,5,5,4,3,2,1,1,1,0,0,0,0],"age":[29.0,29.0,29.0,27.0,26.0,25.0,25.0,24.0,24.0,25.0,23.0,23.0,22.0,22.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pfhgz8ofqgoubhnuqtme","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rtvys5j7sxjrlbpy5iim","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uxtqpnwdviolravhnrkw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lsladvvsaptc29bbcah2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gkog6lrht3rnktwiberj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qsij89kqrxap0jba9zwh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wylipaunq6cueyj8h1in","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hfdgljgi9gfaskomdl1h","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/spsbduvpqe21tgkwhvbc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pvd4nrkfpg8h1yamerrr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sodpdh4uhbhzjxbnmao1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/m2tuzam94o1qm46kwmxo","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/grt6fspk8dlqbuzcrq7m","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/o6hg5zeofmxvzjjpo2sf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/iu0gbspz3kjdqlazvtkn"]},"dictionaries":{"team":["ARI"],"position":["WR","RB","QB","TE"],"status":["ACT","RES","INA"]}};
\ No newline at end of file
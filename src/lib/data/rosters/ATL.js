@@ -0,0 +1 @@
+export const rosters = {"length":10,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,2,2,1,1,2,3,3],"jersey_number":[18.0,85.0,34.0,12.0,1.0,89.0,8.0,5.0,25.0,7.0],"status":[0,0,0,0,1,0,0,0,0,0],"player_name":["Kirk Cousins","Ross Dwelley","Ray-Ray McCloud","KhaDarel Hodge","Darnell Mooney","Charlie Woerner","Kyle Pitts","Drake London","Tyler Allgeier","Bijan Robinson"],"first_name":["Kirk","Ross","Ray-Ray","KhaDarel Lott","Darnell","Charlie","Kyle","Drake","Tyler","Bijan"],"last_name":["Cousins","Dwelley","McCloud","Hodge","Mooney","Woerner","Pitts","London","Allgeier","Robinson"],"player_id":["00-0029604","00-0034073","00-0034407","00-0034854","00-0036309","00-0036429","00-0036970","00-0037238","00-0037263","00-0038542"],"height":[75.0,77.0,69.0,74.0,71.0,77.0,78.0,76.0,70.0,71.0],"weight":[202,240,190,205,172,245,250,210,220,214],"years_exp":[12,6,6,6,4,4,3,2,2,1],"age":[36.0,29.0,27.0,29.0,26.0,26.0,23.0,23.0,24.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yt6n07jezvfmcsoq0j13","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ukd8ctqgskd8q5psumou","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/nvwn3sdihyyd2itjt7vy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/h3r6hfokmtgtxz8mljho","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/c1ixyspw0eshl3a2qrly","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hllqdtlyjbs2gbdgn6lj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/t8ymqyhvv8i1r80jyhy2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wikjazqtt3uunjufgqrf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yosaj2anmqoujqrgzecd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rydwvaod6ethdjap41l6"]},"dictionaries":{"team":["ATL"],"position":["QB","TE","WR","RB"],"status":["ACT","INA"]}};
\ No newline at end of file
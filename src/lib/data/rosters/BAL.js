@@ -0,0 +1 @@
+export const rosters = {"length":11,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,1,0,0,2,2,0,0],"jersey_number":[15.0,22.0,89.0,8.0,43.0,7.0,16.0,80.0,88.0,4.0,81.0],"status":[0,0,0,0,0,0,0,0,0,1,0],"player_name":["Nelson Agholor","Derrick Henry","Mark Andrews","Lamar Jackson","Justice Hill","Rashod Bateman","Tylan Wallace","Isaiah Likely","Charlie Kolar","Zay Flowers","Devontez Walker"],"first_name":["Nelson","Derrick","Mark","Lamar","Justice","Rashod","Tylan","Isaiah","Charlie","Xavien","Devontez"],"last_name":["Agholor","Henry","Andrews","Jackson","Hill","Bateman","Wallace","Likely","Kolar","Flowers","Walker"],"player_id":["00-0031549","00-0032764","00-0034753","00-0034796","00-0034975","00-0036550","00-0036630","00-0037838","00-0038046","00-0039064","00-0039792"],"height":[72.0,75.0,77.0,74.0,70.0,73.0,71.0,76.0,78.0,69.0,73.0],"weight":[198,247,255,212,200,210,190,240,255,172,200],"years_exp":[9,8,6,6,5,3,3,2,2,1,0],"age":[31.0,30.0,28.0,27.0,26.0,24.0,25.0,24.0,25.0,23.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wyxfkarcjgqdz3pl8nnr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/m7bv3lv9puapabltvykk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/y5maejm3puruskwc344y","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/cruqs6qpbykh7a2whd7p","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jeeq17ah67zxc6vdamhk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jkcapzvd65fxivefjv8l","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/e3ghtadqh39zhu0iieht","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xmikfnklnpjmzjhbjrur","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/n7duzqver13movvgcint","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/oidhqwg0fjvanyk57nc1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jsgddyppttajr7czq18x"]},"dictionaries":{"team":["BAL"],"position":["WR","RB","TE","QB"],"status":["ACT","INA"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,0,1,1,2,3,3,2,0,3,2,0],"jersey_number":[18.0,1.0,13.0,11.0,17.0,26.0,88.0,85.0,4.0,10.0,86.0,22.0,0.0],"status":[0,0,0,0,0,0,0,0,0,0,0,0,0],"player_name":["Amari Cooper","Curtis Samuel","Mack Hollins","Mitchell Trubisky","Josh Allen","Ty Johnson","Dawson Knox","Quintin Morris","James Cook","Khalil Shakir","Dalton Kincaid","Ray Davis","Keon Coleman"],"first_name":["Amari","Curtis","Mack","Mitchell","Joshua","Ty","Dawson","Quintin","James","Khalil","Dalton","Re'Mahn","Keon"],"last_name":["Cooper","Samuel","Hollins","Trubisky","Allen","Johnson","Knox","Morris","Cook","Shakir","Kincaid","Davis","Coleman"],"player_id":["00-0031544","00-0033282","00-0033555","00-0033869","00-0034857","00-0035537","00-0035689","00-0036590","00-0037248","00-0037261","00-0038933","00-0039875","00-0039901"],"height":[73.0,71.0,76.0,75.0,77.0,70.0,76.0,74.0,71.0,72.0,76.0,68.0,76.0],"weight":[211,195,221,215,237,210,254,251,190,190,240,216,215],"years_exp":[9,7,7,7,6,5,5,3,2,2,1,0,0],"age":[30.0,28.0,30.0,30.0,28.0,26.0,27.0,25.0,24.0,24.0,24.0,24.0,21.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zmtzqznqui37unmo5xv9","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mq62ulflifrpjrcyknbj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xchw7quzjszgrm6psbyg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jetjlsljpb3shogn5grq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lq4ezafbszwwt2qsvhqv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zdedn4xqr2jy6mddh5pb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uazfj5l5vzow2oyfa1s6","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ftrqrbuqecl9yhcqrcmw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bzdvrarxum9zate4te4b","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ch2yarhiobqlvr9ls2yw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rsimqxdfwlb1n9qd4w3g","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xm8csnleyxsop4pldyby","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ipwpdgb0cm3xy3d8zu1l"]},"dictionaries":{"team":["BUF"],"position":["WR","QB","RB","TE"],"status":["ACT"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":14,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,1,2,3,1,3,2,3,1,0,1,2,1],"jersey_number":[14.0,19.0,83.0,80.0,6.0,11.0,30.0,82.0,3.0,13.0,9.0,17.0,0.0,18.0],"status":[0,0,0,1,0,2,1,0,0,3,0,0,0,0],"player_name":["Andy Dalton","Adam Thielen","David Moore","Ian Thomas","Miles Sanders","Trenton Irwin","Chuba Hubbard","Tommy Tremble","Raheem Blackshear","Deven Thompkins","Bryce Young","Xavier Legette","Ja'Tavion Sanders","Jalen Coker"],"first_name":["Andrew","Adam","David","Ian","Miles","Trenton","Chuba","Tommy","Raheem","Deven","Bryce","Xavier","Ja'Tavion","Jalen"],"last_name":["Dalton","Thielen","Moore","Thomas","Sanders","Irwin","Hubbard","Tremble","Blackshear","Thompkins","Young","Legette","Sanders","Coker"],"player_id":["00-0027973","00-0030035","00-0033589","00-0034365","00-0035243","00-0035341","00-0036555","00-0037005","00-0037429","00-0037487","00-0039150","00-0039342","00-0039356","00-0039491"],"height":[74.0,74.0,72.0,76.0,71.0,74.0,73.0,76.0,69.0,68.0,70.0,75.0,76.0,75.0],"weight":[220,200,215,260,211,207,207,248,194,155,194,227,243,213],"years_exp":[13,11,7,6,5,5,3,3,2,2,1,0,0,0],"age":[36.0,34.0,29.0,28.0,27.0,28.0,25.0,24.0,26.0,24.0,23.0,23.0,21.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/az1zo7fl2tozg50tgs0d","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pxehgo0l9xl03n7dronf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/i2esmsczxxoq7pzvg6yf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qrcffo16hdkcvxuvjppy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lvyjbie3d0ro8ohgphe0","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/q6yiyvs3vlibz7w0wa9b","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/oyis5zooijf0xfme9csj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jn0kmd8lg9hu4fjnnat9","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sv6aefajv1duatig0buu","https://static.www.nfl.com/image/private/f_auto,q_auto/league/gt0yeyl9y8s6onw8wcdr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gdmtmmviwadpobyjogal","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/a3etuvp3kqtwmtkioq8g","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/egisbinbqmttmub4po1g","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wk9xewrixauh09f71pqh"]},"dictionaries":{"team":["CAR"],"position":["QB","WR","TE","RB"],"status":["ACT","RES","DEV","INA"]}};
\ No newline at end of file
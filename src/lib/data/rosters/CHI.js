@@ -0,0 +1 @@
+export const rosters = {"length":10,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0],"position":[0,1,1,0,2,2,0,2,3,1],"jersey_number":[84.0,13.0,11.0,14.0,20.0,4.0,85.0,23.0,18.0,15.0],"status":[0,0,1,0,2,0,0,0,0,0],"player_name":["Marcedes Lewis","Keenan Allen","DeAndre Carter","Gerald Everett","Travis Homer","D'Andre Swift","Cole Kmet","Roschon Johnson","Caleb Williams","Rome Odunze"],"first_name":["Marcedes","Keenan","DeAndre","Gerald","Travis","D'Andre","Cole","Roschon","Caleb","Rome"],"last_name":["Lewis","Allen","Carter","Everett","Homer","Swift","Kmet","Johnson","Williams","Odunze"],"player_id":["00-0024243","00-0030279","00-0031763","00-0033895","00-0035594","00-0036275","00-0036290","00-0039021","00-0039918","00-0039919"],"height":[78.0,74.0,68.0,75.0,70.0,69.0,78.0,72.0,73.0,75.0],"weight":[267,211,190,240,202,211,258,222,215,215],"years_exp":[18,11,9,7,5,4,4,1,0,0],"age":[40.0,32.0,31.0,30.0,26.0,25.0,25.0,23.0,22.0,22.0],"headshot_url":["https://static.www.nfl.com/image/private/f_auto,q_auto/league/ppq07tipygpftz5csipx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lngo1onvkcqjnq7ozkuu","https://static.www.nfl.com/image/private/f_auto,q_auto/league/mh4cvggohuakwwhobzrk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/aayw74rhaupmfnnikzak","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/eg1e7va024emnbm55got","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xlqznrxbapcjhxxazkbx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fdxpctcmwjupassg9g9d","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/skajjk8i3zdrvzqmucww","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/idewrhb7kngpdtrvku31","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/labs8tstecnehvzfmrs5"]},"dictionaries":{"team":["CHI"],"position":["TE","WR","RB","QB"],"status":["ACT","RES","INA"]}};
\ No newline at end of file
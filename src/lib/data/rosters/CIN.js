@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,0,1,2,3,2,1,1,2,0,2,0],"jersey_number":[87.0,88.0,89.0,31.0,5.0,9.0,1.0,34.0,30.0,80.0,85.0,81.0,83.0],"status":[0,0,0,1,0,0,0,0,2,0,0,2,1],"player_name":["Tanner Hudson","Mike Gesicki","Drew Sample","Zack Moss","Tee Higgins","Joe Burrow","Ja'Marr Chase","Khalil Herbert","Chase Brown","Andrei Iosivas","Cam Grandy","Jermaine Burton","Erick All"],"first_name":["Tanner","Michael","Drew","Zaccheus","Tamaurice","Joe","Ja'Marr","Khalil","Chase","Andrei","Cam","Jermaine","Erick"],"last_name":["Hudson","Gesicki","Sample","Moss","Higgins","Burrow","Chase","Herbert","Brown","Iosivas","Grandy","Burton","All"],"player_id":["00-0034613","00-0034829","00-0035631","00-0036251","00-0036410","00-0036442","00-0036900","00-0036906","00-0038597","00-0038619","00-0039631","00-0039810","00-0039814"],"height":[77.0,78.0,77.0,70.0,76.0,76.0,72.0,69.0,70.0,75.0,77.0,72.0,77.0],"weight":[239,252,259,215,210,216,200,212,205,200,260,200,255],"years_exp":[6,6,5,4,4,4,3,3,1,1,0,0,0],"age":[29.0,28.0,28.0,26.0,25.0,27.0,24.0,26.0,24.0,24.0,24.0,23.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fbtxfvqvgv0al8msbr1e","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zabpknonv9ozmkyw4qqt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xufsbdqfujdqnrnozhg4","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/oxrltdgoquiabhihhgnk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/swqgkrdmjecz3vumrex5","https://static.www.nfl.com/image/private/f_auto,q_auto/league/jzzqz5ubkilrn9dpxtlp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qkcb3qt2fhasfgtfuprd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rz6zmdluhpsaylbvmpgr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rxzzjpgjgjsmmkekp6zu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pgbqgzrxmbnmpcnkhsya","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uay5dmniqx1baal3q3uu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ifbhq7ghxf2mcvhzuxsz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ifkhcxze7lnxkpzjvsmk"]},"dictionaries":{"team":["CIN"],"position":["TE","RB","WR","QB"],"status":["ACT","RES","INA"]}};
\ No newline at end of file
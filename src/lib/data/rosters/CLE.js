@@ -0,0 +1 @@
+export const rosters = {"length":16,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,0,1,2,1,2,3,3,2,2,0,0,1,3,3],"jersey_number":[5.0,84.0,4.0,85.0,27.0,88.0,24.0,3.0,8.0,34.0,20.0,2.0,17.0,86.0,19.0,80.0],"status":[0,1,1,1,2,2,1,2,2,1,1,2,2,2,1,2],"player_name":["Jameis Winston","Geoff Swaim","Deshaun Watson","David Njoku","D'Onta Foreman","Jordan Akins","Nick Chubb","Jerry Jeudy","Elijah Moore","Jerome Ford","Pierre Strong","Bailey Zappe","Dorian Thompson-Robinson","Blake Whiteheart","Cedric Tillman","Jamari Thrash"],"first_name":["Jameis","Geoffrey","Derrick","David","D'Onta","Jordan","Nicholas","Jerry","Elijah","Jerome","Pierre","Bailey","Dorian","Blake","Cedric","Jamari"],"last_name":["Winston","Swaim","Watson","Njoku","Foreman","Akins","Chubb","Jeudy","Moore","Ford","Strong","Zappe","Thompson-Robinson","Whiteheart","Tillman","Thrash"],"player_id":["00-0031503","00-0032141","00-0033537","00-0033885","00-0033925","00-0034364","00-0034791","00-0036407","00-0036980","00-0037267","00-0038098","00-0038108","00-0038583","00-0038710","00-0038979","00-0039379"],"height":[76.0,76.0,75.0,76.0,73.0,76.0,71.0,73.0,70.0,70.0,71.0,73.0,74.0,76.0,75.0,72.0],"weight":[231,260,221,246,233,243,225,192,184,220,205,220,205,243,215,185],"years_exp":[9,9,7,7,7,6,6,4,3,2,2,2,1,1,1,0],"age":[30.0,30.0,28.0,28.0,28.0,32.0,28.0,25.0,24.0,24.0,25.0,25.0,24.0,24.0,24.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/chdeosreuupotgq0eqlm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kecuhwgbqvlqt6gb0dz6","https://static.www.nfl.com/image/private/f_auto,q_auto/league/otfs2docj6eahaebo5xn","https://static.www.nfl.com/image/private/f_auto,q_auto/league/ilvxwdllivrvwbuj69cm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/shlxaet74pmn8arznphw","https://static.www.nfl.com/image/private/f_auto,q_auto/league/fgkl9zfpy2yxrkxfge84","https://static.www.nfl.com/image/private/f_auto,q_auto/league/a8ib0haur75wrhqrbtyo","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/szca1v9butuqkjs7ekpm","https://static.www.nfl.com/image/private/f_auto,q_auto/league/bhwvzckfhhcqhb7zdqyj","https://static.www.nfl.com/image/private/f_auto,q_auto/league/djggmwo5v8osoboiseo2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xvsnviejqwulftgrccpb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/m0aps8mb4jev4t4tduir","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ujuyt3hpswlin3aahmhu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kwsgfizrabfarbea4dbd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fp371fgk45btt01uvucq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/khjue5xlvlhzha9znbl3"]},"dictionaries":{"team":["CLE"],"position":["QB","TE","RB","WR"],"status":["INA","RES","ACT"]}};
\ No newline at end of file
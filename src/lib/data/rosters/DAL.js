@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,1,2,0,1,0,0,3,3,2,0,0,0,3],"jersey_number":[3.0,4.0,10.0,23.0,88.0,19.0,1.0,9.0,87.0,86.0,42.0,83.0,81.0,80.0,89.0],"status":[0,1,0,0,1,0,0,0,0,0,0,0,0,0,0],"player_name":["Brandin Cooks","Dak Prescott","Cooper Rush","Rico Dowdle","CeeDee Lamb","Trey Lance","Jalen Tolbert","KaVontae Turpin","Jake Ferguson","Luke Schoonmaker","Deuce Vaughn","Jalen Brooks","Jonathan Mingo","Ryan Flournoy","Brevyn Spann-Ford"],"first_name":["Brandin","Rayne","Cooper","Rico","Cedarian","Trey","Jalen","Kavontae","Jake","Luke","Christopher","Jalen","Jonathan","Ryan","Brevyn"],"last_name":["Cooks","Prescott","Rush","Dowdle","Lamb","Lance","Tolbert","Turpin","Ferguson","Schoonmaker","Vaughn","Brooks","Mingo","Flournoy","Spann-Ford"],"player_id":["00-0031236","00-0033077","00-0033662","00-0036139","00-0036358","00-0037012","00-0037666","00-0037801","00-0038041","00-0038547","00-0038622","00-0038640","00-0039062","00-0039410","00-0039530"],"height":[70.0,74.0,75.0,72.0,74.0,76.0,73.0,69.0,77.0,77.0,66.0,74.0,74.0,73.0,79.0],"weight":[183,238,225,215,189,226,195,153,250,250,176,205,225,197,270],"years_exp":[10,8,7,4,4,3,2,5,2,1,1,1,1,0,0],"age":[30.0,31.0,30.0,26.0,25.0,24.0,25.0,28.0,25.0,25.0,22.0,24.0,23.0,24.0,24.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pjoksfxpbba4hevwpuop","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xmtaggdnhuyl4pdwtv8j","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/amuag2qiwa9veml1lhvs","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fe8ge4f6vvtyihou5czu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tfuj9njqdw2dovkwhryc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fas0q1ssb3ihak6pduet","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/cek1m1cbly5rfmmmjpcc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lwkox2bvc6k3hqmidf4q","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lbvrn1ibwszd6tzgh6o1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fd4exg1hqzlm9sk6ruu6","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uzxaeh4dssbmvz3lwaan","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jdwbrmypfsotpdw86w6u","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/slc08tcccvtyqr61dtkd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yq2tbkoz2anbit6zc8ms","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bn9b4pb8om6w3escvitt"]},"dictionaries":{"team":["DAL"],"position":["WR","QB","RB","TE"],"status":["ACT","RES"]}};
\ No newline at end of file
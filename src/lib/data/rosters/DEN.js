@@ -0,0 +1 @@
+export const rosters = {"length":10,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,2,1,1,2,0,3,0],"jersey_number":[14.0,84.0,82.0,33.0,85.0,45.0,38.0,17.0,10.0,16.0],"status":[0,0,0,0,0,0,0,0,0,0],"player_name":["Courtland Sutton","Lil'Jordan Humphrey","Adam Trautman","Javonte Williams","Lucas Krull","Nate Adkins","Jaleel McLaughlin","Devaughn Vele","Bo Nix","Troy Franklin"],"first_name":["Courtland","Lil'Jordan","Adam","Javonte","Lucas","Nate","Jaleel","Devaughn","Bo","Troy"],"last_name":["Sutton","Humphrey","Trautman","Williams","Krull","Adkins","McLaughlin","Vele","Nix","Franklin"],"player_id":["00-0034348","00-0035406","00-0036422","00-0036997","00-0037539","00-0038783","00-0038794","00-0039424","00-0039732","00-0039868"],"height":[76.0,76.0,77.0,70.0,78.0,75.0,67.0,77.0,74.0,75.0],"weight":[216,225,253,220,260,252,183,210,217,187],"years_exp":[6,5,4,3,2,1,1,0,0,0],"age":[28.0,26.0,27.0,24.0,26.0,25.0,23.0,26.0,24.0,21.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qts95gbd6hv65s9eiseq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yjmyfuozafxd7zwf3mlr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qvqigum2qjhil0z3er2c","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dm8qipfrz2nes9kgpcyp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/v3rdtydz7dh4s5oyzejs","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zbvo4oy4twbharwpmsqv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ndqnhudqtipzrnzslyla","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f2lz4vsh2daurrwdamzv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zibtvsprpauxnytis229","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/w429urxwxc8sw4bsbvxz"]},"dictionaries":{"team":["DEN"],"position":["WR","TE","RB","QB"],"status":["ACT"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,0,2,3,2,3,3,0,0,3,2],"jersey_number":[8.0,11.0,16.0,17.0,13.0,43.0,5.0,84.0,89.0,14.0,9.0,87.0,26.0],"status":[0,0,0,0,0,1,0,0,0,0,0,0,0],"player_name":["Allen Robinson","Kalif Raymond","Jared Goff","Tim Patrick","Craig Reynolds","Parker Hesse","David Montgomery","Shane Zylstra","Brock Wright","Amon-Ra St. Brown","Jameson Williams","Sam LaPorta","Jahmyr Gibbs"],"first_name":["Allen","Kalif","Jared","Tim","Craig","Parker","David","Shane","Brock","Amon-Ra","Jameson","Sam","Jahmyr"],"last_name":["Robinson","Raymond","Goff","Patrick","Reynolds","Hesse","Montgomery","Zylstra","Wright","St. Brown","Williams","LaPorta","Gibbs"],"player_id":["00-0031428","00-0032464","00-0033106","00-0033375","00-0035567","00-0035572","00-0035685","00-0036534","00-0036754","00-0036963","00-0037240","00-0039065","00-0039139"],"height":[74.0,68.0,76.0,76.0,71.0,75.0,71.0,76.0,77.0,72.0,73.0,75.0,69.0],"weight":[220,182,223,212,215,261,222,215,255,195,189,249,200],"years_exp":[10,8,8,7,5,5,5,3,3,3,2,1,1],"age":[31.0,30.0,29.0,30.0,28.0,29.0,27.0,27.0,25.0,24.0,23.0,23.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fyukft9lraurbsq0laom","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hogsyuf9rqnzydmhbsht","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jxyaiwwkabzmmphouxil","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tsbe7jbwmgzby45hnb3j","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kfohmdfiai96uqcl7c03","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/roaaw3cph7q6cxdco70k","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/nwdb4paueb1x4gv7tlb9","https://static.www.nfl.com/image/private/f_auto,q_auto/league/e6np1mvcmbxp76d7lbqy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/irowew9hgqaa9vcd8fri","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jmfuamqblg8jag0stpnq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kt6xzcnjbe9affdfsayt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ucw8cfj5t5nwkx670wzu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f5y3osxxtov5rgfv4ra5"]},"dictionaries":{"team":["DET"],"position":["WR","QB","RB","TE"],"status":["ACT","CUT"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,2,2,1,2,2,0,0,3,3,3,2],"jersey_number":[8.0,10.0,80.0,86.0,87.0,9.0,2.0,13.0,18.0,30.0,31.0,89.0,85.0,88.0,11.0],"status":[0,0,0,0,0,1,0,0,0,0,0,1,0,0,0],"player_name":["Josh Jacobs","Jordan Love","Bo Melton","John FitzPatrick","Romeo Doubs","Christian Watson","Malik Willis","Dontayvion Wicks","Malik Heath","Chris Brooks","Emanuel Wilson","Ben Sims","Tucker Kraft","Luke Musgrave","Jayden Reed"],"first_name":["Joshua","Jordan","Bo","John","Romeo","Christian","Malik","Dontayvion","Malik","Christopher","Emanuel","Ben","Tucker","Luke","Jayden"],"last_name":["Jacobs","Love","Melton","FitzPatrick","Doubs","Watson","Willis","Wicks","Heath","Brooks","Wilson","Sims","Kraft","Musgrave","Reed"],"player_id":["00-0035700","00-0036264","00-0037091","00-0037306","00-0037816","00-0038124","00-0038128","00-0038393","00-0038465","00-0038685","00-0038797","00-0038809","00-0038996","00-0039144","00-0039146"],"height":[70.0,76.0,71.0,79.0,74.0,76.0,73.0,73.0,74.0,73.0,71.0,77.0,77.0,78.0,71.0],"weight":[220,220,195,250,200,208,215,208,215,230,220,258,255,252,190],"years_exp":[5,4,2,2,2,2,2,1,1,1,1,1,1,1,1],"age":[26.0,25.0,25.0,24.0,24.0,25.0,25.0,23.0,24.0,24.0,25.0,24.0,23.0,23.0,24.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ksdusqxnwqtnph0htcfx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/a8xqle2vmsnumawdhswb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bhmhwurwugjmymgjforf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/k7m700qda76lqtt7zj8e","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dyulbddqbqshoqdxgo63","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qenktpex0mep8er8dzxj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/e6w0hpe2pzefydmhqmr7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ghsev2bmz8kvhm8dsbey","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xbhxvulvdrkbz5svka5f","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uuahiqarbpnfv8xlihlu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hpscbhsmjocm8kmwfbuc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mfl9febpyc8nk2abxcf2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/klrmgekdzx1ywjjmixp7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mn9nugrtq8kb8sysrvne","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/blh2tfg9qjthqo2g6ot4"]},"dictionaries":{"team":["GB"],"position":["RB","QB","WR","TE"],"status":["ACT","INA"]}};
\ No newline at end of file
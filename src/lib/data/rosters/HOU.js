@@ -0,0 +1 @@
+export const rosters = {"length":16,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,1,2,0,0,2,3,1,2,0,0,0,3,2],"jersey_number":[2.0,1.0,33.0,28.0,86.0,82.0,12.0,9.0,10.0,31.0,85.0,19.0,14.0,3.0,7.0,87.0],"status":[0,1,0,0,0,2,0,1,0,0,1,0,0,1,0,1],"player_name":["Robert Woods","Stefon Diggs","Dare Ogunbowale","Joe Mixon","Dalton Schultz","Diontae Johnson","Nico Collins","Brevin Jordan","Davis Mills","Dameon Pierce","Teagan Quitoriano","Xavier Hutchinson","Jared Wayne","Tank Dell","C.J. Stroud","Cade Stover"],"first_name":["Robert","Stefon","Oluwadare","Joe","Dalton","Diontae","Nico","Brevin","Davis","Dameon","Teagan","Xavier","Jared","Nathaniel","Coleridge","Cade"],"last_name":["Woods","Diggs","Ogunbowale","Mixon","Schultz","Johnson","Collins","Jordan","Mills","Pierce","Quitoriano","Hutchinson","Wayne","Dell","Stroud","Stover"],"player_id":["00-0030431","00-0031588","00-0033854","00-0033897","00-0034383","00-0035216","00-0036554","00-0036556","00-0036898","00-0037258","00-0037277","00-0038618","00-0038728","00-0038977","00-0039163","00-0039359"],"height":[72.0,72.0,71.0,73.0,77.0,70.0,76.0,75.0,76.0,70.0,78.0,75.0,75.0,70.0,75.0,76.0],"weight":[193,191,205,220,242,181,222,245,225,215,259,210,210,165,218,251],"years_exp":[11,9,7,7,6,5,3,3,3,2,2,1,1,1,1,0],"age":[32.0,30.0,30.0,28.0,28.0,28.0,25.0,24.0,25.0,24.0,24.0,24.0,23.0,24.0,22.0,24.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ydjg5fylwkf5aaxiul6v","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/to2qwuffjnjlouctglsl","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kzthvzy64jesgizjthwx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gwyhozfhjgedwdmmjjcf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ooatvpu1knzypdmjljo9","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rjtil6ilydmwoy0btlt7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/q7c9aq8rpremfygslmya","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sw6kge0me7ei8opbvfjq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ednftvn7qywdim05j7u5","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kotnmiuvvfmfuupr0f82","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tlfmx2ozvmglaxcrg7ko","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vlxzxhej5ffelkxrqf4g","https://static.www.nfl.com/image/private/f_auto,q_auto/league/udca0jyyym0k7vh2f5yr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tqxgovzlhxj0jnwkcvtq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fbk2eqpo54lawppgetjn","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ehruudekjzjney5dircm"]},"dictionaries":{"team":["HOU"],"position":["WR","RB","TE","QB"],"status":["ACT","RES","CUT"]}};
\ No newline at end of file
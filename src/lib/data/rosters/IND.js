@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,1,3,3,1,2,1,2,0,2],"jersey_number":[15.0,81.0,16.0,28.0,83.0,27.0,31.0,85.0,14.0,86.0,1.0,5.0,10.0],"status":[0,0,0,0,0,0,0,0,0,1,0,1,0],"player_name":["Joe Flacco","Mo Alie-Cox","Ashton Dulin","Jonathan Taylor","Kylen Granson","Trey Sermon","Tyler Goodson","Andrew Ogletree","Alec Pierce","Will Mallory","Josh Downs","Anthony Richardson","Adonai Mitchell"],"first_name":["Joseph","Mo","Ashton","Jonathan","Kylen","Trey","Tyler","Andrew","Alec","Will","Joshua","Anthony","Adonai"],"last_name":["Flacco","Alie-Cox","Dulin","Taylor","Granson","Sermon","Goodson","Ogletree","Pierce","Mallory","Downs","Richardson","Mitchell"],"player_id":["00-0026158","00-0033217","00-0035021","00-0036223","00-0036876","00-0036984","00-0037120","00-0037292","00-0037664","00-0038394","00-0038997","00-0039164","00-0039890"],"height":[78.0,77.0,74.0,70.0,75.0,72.0,69.0,77.0,75.0,76.0,69.0,76.0,74.0],"weight":[245,267,215,221,235,215,199,250,213,245,175,232,196],"years_exp":[16,7,5,4,3,3,2,2,2,1,1,1,0],"age":[39.0,30.0,27.0,25.0,26.0,25.0,23.0,26.0,24.0,25.0,23.0,22.0,21.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yxvyoeojkif7tnfviamc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f4orwwthvtcyd3vfqjvs","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/so1vzml0sxv84xoyyr2n","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ye4runp84oku1vnodsa7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rydvwc7sqwucvx14s8b4","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/freievsvipthuvrwn7uw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/z4ugeazvmccxxhqjoxzv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xrp8dougs6jb0denyorz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hvtcpccoigf9cghzkxcg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rxeygxqtsnqqzgmjl71g","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zue2xxvfrignllqlhagu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/areyvihumylqo7y2ehk2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fztxucnxhoxep6utluyc"]},"dictionaries":{"team":["IND"],"position":["QB","TE","WR","RB"],"status":["ACT","INA"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":14,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,1,2,1,0,1,0,3,3,2,2,1,0],"jersey_number":[17.0,87.0,13.0,2.0,12.0,81.0,15.0,89.0,16.0,10.0,1.0,4.0,11.0,85.0],"status":[0,1,0,1,1,1,1,1,0,1,1,1,1,1],"player_name":["Evan Engram","Josh Reynolds","Christian Kirk","D'Ernest Johnson","Devin Duvernay","Josiah Deguara","Tim Jones","Luke Farrell","Trevor Lawrence","Mac Jones","Travis Etienne","Tank Bigsby","Parker Washington","Brenton Strange"],"first_name":["Evan","Joshua Dedmon-Reynolds","Christian","D'Ernest","Devin","Josiah","Tim","Luke","Trevor","Michael","Travis","Cartavious","Christopher","Brenton"],"last_name":["Engram","Reynolds","Kirk","Johnson","Duvernay","Deguara","Jones","Farrell","Lawrence","Jones","Etienne","Bigsby","Washington","Strange"],"player_id":["00-0033881","00-0033943","00-0034775","00-0035628","00-0036331","00-0036332","00-0036497","00-0036887","00-0036971","00-0036972","00-0036973","00-0038555","00-0038606","00-0038935"],"height":[75.0,75.0,71.0,70.0,71.0,74.0,73.0,77.0,78.0,75.0,70.0,71.0,70.0,76.0],"weight":[240,196,200,208,210,240,202,258,220,214,200,213,212,247],"years_exp":[7,7,6,5,4,4,3,3,3,3,3,1,1,1],"age":[29.0,29.0,27.0,28.0,26.0,27.0,26.0,26.0,24.0,25.0,25.0,22.0,22.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sea0atk2feif4n75dvq8","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ifukozhqlo1728h3gjnp","https://static.www.nfl.com/image/private/f_auto,q_auto/league/ersmmtjmjlpsy9lmjvde","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gbe2eojaxid4n3pmo0rj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wynmyjmvg7cee4y6i21n","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ppvzbuhwwaus50k2xyr2","https://static.www.nfl.com/image/private/f_auto,q_auto/league/aufwsgk6syholp9f7dy6","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f2z7wpmx7ngtxcqqedla","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ftznnho2rk2xzrculbob","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pedpdxybeus7mrovsoko","https://static.www.nfl.com/image/private/f_auto,q_auto/league/ne5lyv8n6elqw77yrz9w","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vwl0kijb59dp20m3hs3u","https://static.www.nfl.com/image/private/f_auto,q_auto/league/pukz1x5ysxkhvsmcttdm","https://static.www.nfl.com/image/private/f_auto,q_auto/league/trfk78mrfsafnbatyx2x"]},"dictionaries":{"team":["JAX"],"position":["TE","WR","RB","QB"],"status":["RES","ACT"]}};
\ No newline at end of file
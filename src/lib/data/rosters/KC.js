@@ -0,0 +1 @@
+export const rosters = {"length":18,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,1,3,2,1,1,1,0,2,0,1,1,1,2,0,1],"jersey_number":[87.0,8.0,34.0,9.0,15.0,29.0,84.0,17.0,5.0,83.0,10.0,88.0,24.0,11.0,4.0,42.0,12.0,1.0],"status":[0,0,0,0,0,0,0,1,0,0,0,0,1,2,1,0,1,0],"player_name":["Travis Kelce","DeAndre Hopkins","Samaje Perine","JuJu Smith-Schuster","Patrick Mahomes","Kareem Hunt","Justin Watson","Mecole Hardman","Marquise Brown","Noah Gray","Isiah Pacheco","Peyton Hendershot","Skyy Moore","Tyquan Thornton","Rashee Rice","Carson Steele","Jared Wiley","Xavier Worthy"],"first_name":["Travis","DeAndre","Samaje","John","Patrick","Kareem","Justin","Mecole","Marquise","Noah","Isiah","Peyton","Skyy","Tyquan","Rashee","Carson","Jared","Xavier"],"last_name":["Kelce","Hopkins","Perine","Smith-Schuster","Mahomes","Hunt","Watson","Hardman","Brown","Gray","Pacheco","Hendershot","Moore","Thornton","Rice","Steele","Wiley","Worthy"],"player_id":["00-0030506","00-0030564","00-0033526","00-0033857","00-0033873","00-0033923","00-0034386","00-0035140","00-0035662","00-0036637","00-0037197","00-0037569","00-0038090","00-0038104","00-0039067","00-0039325","00-0039824","00-0039894"],"height":[77.0,73.0,70.0,73.0,74.0,71.0,74.0,70.0,69.0,75.0,70.0,76.0,70.0,74.0,73.0,72.0,78.0,71.0],"weight":[260,212,240,215,230,216,215,187,170,240,215,245,195,180,203,225,260,172],"years_exp":[11,11,7,7,7,7,6,5,5,3,2,2,2,2,1,0,0,0],"age":[34.0,32.0,28.0,27.0,28.0,29.0,28.0,26.0,27.0,25.0,25.0,25.0,23.0,24.0,24.0,21.0,23.0,21.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ilk4qbxxs6mt3v9zfvtg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/viymeohipdn0voptrkzh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/liorwdmj8gelxh5u7rc4","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/l0hsr6xsbsagzygcqhci","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qrdbvu4iqy7wkqg8jq8d","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mm0t1ghvbpdhy6m5utcq","https://static.www.nfl.com/image/private/f_auto,q_auto/league/vr9tayyujt23takv3hv3","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/cfbjutuygqg7imy0qwpt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ixuddegcphzmvjn4jq6r","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/erihh0eiq4m76k2ejvax","https://static.www.nfl.com/image/private/f_auto,q_auto/league/rzr8nxjunjeiv8bjir59","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/d8plvjsvwdadr1ap93ci","https://static.www.nfl.com/image/private/f_auto,q_auto/league/wpiovviem9uugfacqkxy","https://static.www.nfl.com/image/private/f_auto,q_auto/league/p1kulrgf4v2grethuefi","https://static.www.nfl.com/image/private/f_auto,q_auto/league/zjgi60dvmj5ogvanp201","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lhkvntmjrt4fbsxi3hrt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f9bhzz8fogzta1qkg9ms","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fvzbx5gpiqkogglyoo1w"]},"dictionaries":{"team":["KC"],"position":["TE","WR","RB","QB"],"status":["ACT","RES","DEV"]}};
\ No newline at end of file
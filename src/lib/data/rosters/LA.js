@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,2,1,2,1,1,2,3,3,2,1,3,1],"jersey_number":[9.0,11.0,15.0,89.0,10.0,86.0,18.0,5.0,84.0,20.0,23.0,87.0,17.0,22.0,88.0],"status":[0,0,0,0,0,0,1,0,0,0,0,0,0,2,0],"player_name":["Matthew Stafford","Jimmy Garoppolo","Demarcus Robinson","Tyler Higbee","Cooper Kupp","Colby Parkinson","Tyler Johnson","Tutu Atwell","Hunter Long","Ronnie Rivers","Kyren Williams","Davis Allen","Puka Nacua","Blake Corum","Jordan Whittington"],"first_name":["John","James","Demarcus","Tyler","Cooper","Colby","Tyler","Chatarius","Hunter","Ronnie","Kyren","Davis","Puka","Blake","Jordan"],"last_name":["Stafford","Garoppolo","Robinson","Higbee","Kupp","Parkinson","Johnson","Atwell","Long","Rivers","Williams","Allen","Nacua","Corum","Whittington"],"player_id":["00-0026498","00-0031345","00-0032775","00-0033110","00-0033908","00-0036244","00-0036427","00-0036849","00-0037004","00-0037557","00-0037840","00-0039074","00-0039075","00-0039738","00-0039751"],"height":[75.0,74.0,73.0,78.0,74.0,79.0,73.0,69.0,77.0,69.0,69.0,78.0,74.0,68.0,73.0],"weight":[220,225,203,257,208,251,205,153,253,190,199,250,205,213,204],"years_exp":[15,10,8,8,7,4,4,3,3,2,2,1,1,0,0],"age":[36.0,32.0,29.0,31.0,31.0,25.0,26.0,24.0,26.0,25.0,24.0,23.0,23.0,23.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xdlnnbapdbk8trxqlasu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lbyjizqecoq4onrgectw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lakf0xue1qqb7ed4p6ge","https://static.www.nfl.com/image/private/f_auto,q_auto/league/vk9c6lr4d1pdt9sr86ua","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sq7zwzcgrajuk0hwwph2","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/crjyx8tutyzn8bomqbdc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vktiajeyqc8s9s6mjws7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hpvbp9pn7ifbh62nde0n","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zfovepcmlr4bkmm96wgp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xjumjdizgaw4gicg6gbb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vcvstwywz6iufk7iul3x","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ihbec16pwn2ki5woyr4m","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/i1pmrhua5gpvwgsqphxa","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ehpbxs9iiosm4xs7nhnl","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/x5j7yvx4iheje5vw4tek"]},"dictionaries":{"team":["LA"],"position":["QB","WR","TE","RB"],"status":["ACT","INA","RES"]}};
\ No newline at end of file
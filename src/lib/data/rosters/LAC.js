@@ -0,0 +1 @@
+export const rosters = {"length":19,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,0,1,2,0,1,2,3,2,2,2,0,1,0,2,2,1,2],"jersey_number":[83.0,24.0,81.0,4.0,9.0,88.0,27.0,86.0,10.0,89.0,87.0,5.0,84.0,28.0,42.0,1.0,12.0,30.0,15.0],"status":[0,0,1,1,1,2,1,3,1,4,1,2,1,1,1,1,1,2,1],"player_name":["Eric Tomlinson","Ezekiel Elliott","Will Dissly","Gus Edwards","DJ Chark","Hayden Hurst","J.K. Dobbins","Laviska Shenault Jr.","Justin Herbert","Jalen Reagor","Simi Fehoko","Josh Palmer","Stone Smartt","Hassan Haskins","Tucker Fisk","Quentin Johnston","Derius Davis","Kimani Vidal","Ladd McConkey"],"first_name":["Eric","Ezekiel","Will","Gus","Darrell","Hayden","Jkaylin","Laviska","Justin","Jalen","Simione","Josh","Stone","Hassan","Tucker","Quentin","Derius","Kimani","Andrew"],"last_name":["Tomlinson","Elliott","Dissly","Edwards","Chark","Hurst","Dobbins","Shenault","Herbert","Reagor","Fehoko","Palmer","Smartt","Haskins","Fisk","Johnston","Davis","Vidal","McConkey"],"player_id":["00-0031690","00-0033045","00-0034159","00-0034184","00-0034777","00-0034830","00-0036158","00-0036268","00-0036355","00-0036387","00-0036646","00-0036988","00-0037475","00-0037617","00-0037654","00-0038544","00-0038573","00-0039391","00-0039915"],"height":[78.0,72.0,76.0,73.0,75.0,76.0,70.0,73.0,78.0,71.0,76.0,73.0,76.0,74.0,76.0,76.0,68.0,68.0,72.0],"weight":[263,228,267,238,198,245,214,220,237,195,227,210,232,220,285,201,175,215,185],"years_exp":[9,8,6,6,6,6,4,4,4,4,3,3,2,2,2,1,1,0,0],"age":[32.0,29.0,28.0,29.0,27.0,31.0,25.0,25.0,26.0,25.0,26.0,24.0,25.0,24.0,25.0,22.0,23.0,23.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/i2n4shhc4sprxbsbhfcy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/d4yr6htg4dbs0bgcfqnd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/opdpeoconvviwkufolxr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dyobqe3w5eypevsk3f2b","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/skuieceh50r31ulwpo5s","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qxvkvmi2fphxjqyb21nv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rbuyzj3kv10xrq1rfy2l","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/o3cfpcor86ghjwyn8icp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vvwim9hpgq1zs3bufmr0","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/myazqfr7pzfyofksuyet","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fcso2vvp9tgqjm30qmuq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dexbsmmldvsqtr83or5l","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tazdjztvhpulguzuh78l","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kfqhhr4xcm2iaocbvdyp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jbbh7bfsjpqzsy0jcofy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jbxlvsbokf9qdqtet1qr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ctk98ws4ps6p4gaei6uu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fcxbkvgjtitodz3pjequ","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wcx39ialovvxxnvs2bke"]},"dictionaries":{"team":["LAC"],"position":["TE","RB","WR","QB"],"status":["DEV","ACT","INA","CUT","RES"]}};
\ No newline at end of file
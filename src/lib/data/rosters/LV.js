@@ -0,0 +1 @@
+export const rosters = {"length":14,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,0,1,2,1,1,0,0,3,1,3,2,2],"jersey_number":[8.0,16.0,22.0,81.0,84.0,19.0,80.0,28.0,3.0,10.0,11.0,12.0,87.0,89.0],"status":[0,1,1,2,1,3,1,3,3,1,1,1,1,1],"player_name":["Ameer Abdullah","Jakobi Meyers","Alexander Mattison","Alex Bachman","Harrison Bryant","DJ Turner","Terrace Marshall Jr.","Sincere McCormick","Zamir White","Desmond Ridder","Tre Tucker","Aidan O'Connell","Michael Mayer","Brock Bowers"],"first_name":["Ameer","Jakobi","Alexander","Alex","Harrison","Darryl","Terrace","Sincere","Zamir","Desmond","Tre","Aidan","Michael","Brock"],"last_name":["Abdullah","Meyers","Mattison","Bachman","Bryant","Turner","Marshall","McCormick","White","Ridder","Tucker","O'Connell","Mayer","Bowers"],"player_id":["00-0032104","00-0034960","00-0034972","00-0035602","00-0036232","00-0036527","00-0036955","00-0037509","00-0038040","00-0038122","00-0038563","00-0038579","00-0039066","00-0039338"],"height":[69.0,74.0,71.0,72.0,77.0,69.0,74.0,69.0,72.0,75.0,69.0,75.0,76.0,76.0],"weight":[203,200,220,190,240,205,200,205,215,215,185,210,265,230],"years_exp":[9,5,5,5,4,3,3,2,2,2,1,1,1,0],"age":[31.0,27.0,26.0,28.0,26.0,27.0,24.0,23.0,24.0,25.0,23.0,25.0,23.0,21.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/atwi5p12mlgnsl4y8cgt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/p1abjttm5pu8gev0gwea","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/uftc0gl0wzo5povcu6ih","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/cwpp03jqrvyacbjbzkxb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jjarmcwkadvr7tynkpuj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/os5eurhh1y45sixa8phl","https://static.www.nfl.com/image/private/f_auto,q_auto/league/wyzlucfowqdntj6nkh7m","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/esocauqmcswp4jolgnom","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jpxuggpx567die5348be","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rhpusa7pfgd82d9ui6y7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/soebzcfwhgnjffwqv1ox","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/aphs7sdbtn8v4zo9pz6w","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rmc4igjgu5za2va8rfe1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mjy86xh8munoiur4hejf"]},"dictionaries":{"team":["LV"],"position":["RB","WR","TE","QB"],"status":["INA","ACT","DEV","RES"]}};
\ No newline at end of file
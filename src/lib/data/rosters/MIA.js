@@ -0,0 +1 @@
+export const rosters = {"length":17,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,0,2,0,1,0,2,3,3,0,2,3,2,1,1,0],"jersey_number":[3.0,31.0,10.0,9.0,85.0,23.0,0.0,81.0,18.0,1.0,17.0,80.0,19.0,89.0,28.0,25.0,83.0],"status":[0,1,1,1,1,1,2,1,1,3,1,1,1,1,1,1,1],"player_name":["Odell Beckham Jr.","Raheem Mostert","Tyreek Hill","Jonnu Smith","River Cracraft","Jeff Wilson","Braxton Berrios","Durham Smythe","Tyler Huntley","Tua Tagovailoa","Jaylen Waddle","Jack Stoll","Skylar Thompson","Julian Hill","De'Von Achane","Jaylen Wright","Malik Washington"],"first_name":["Odell","Dominique","Tyreek","Jonnu","Tanner","Jeffery","Braxton","Durham","Tyler","Tua","Jaylen","Jack","Skylar","Julian","Devon","Jaylen","Malik"],"last_name":["Beckham","Mostert","Hill","Smith","Cracraft","Wilson","Berrios","Smythe","Huntley","Tagovailoa","Waddle","Stoll","Thompson","Hill","Achane","Wright","Washington"],"player_id":["00-0031235","00-0031687","00-0033040","00-0033858","00-0034054","00-0034115","00-0034419","00-0034798","00-0035993","00-0036212","00-0036613","00-0036741","00-0037327","00-0038720","00-0039040","00-0039874","00-0039880"],"height":[71.0,70.0,70.0,75.0,72.0,72.0,69.0,78.0,73.0,73.0,70.0,76.0,74.0,76.0,69.0,71.0,68.0],"weight":[198,197,185,248,200,194,190,260,205,218,182,260,221,250,185,210,194],"years_exp":[10,9,8,7,7,6,6,6,4,4,3,3,2,1,1,0,0],"age":[31.0,32.0,30.0,29.0,29.0,28.0,28.0,29.0,26.0,26.0,25.0,26.0,27.0,24.0,22.0,21.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ffmalg3wr7lwnsz59i7v","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ayii5q2am51xeipp1h8v","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gdwjlpbkenmnsibawkht","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/p8uldtljkzb6sile3wgx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/y8t968ntco72t8f8ryba","https://static.www.nfl.com/image/private/f_auto,q_auto/league/zorqrtlrizlltgd6pnob","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yvzkjvb0ieeszxribqc9","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/twxkgrnpjotgyhwawfsv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ex2ygunvni5o5aabnhbq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xzdbwt2ezmxk3pjcsr1n","https://static.www.nfl.com/image/private/f_auto,q_auto/league/qjsz2h6shbdnksctzeka","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yfzlbe9pmziykcmgaoj3","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pfzzkuppkzuy1obzuf0m","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ycrsps9cgsfkyppucwrr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zqfkz3hbyurjcwhw7xoi","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ib9s3nvt4i1i5wh11t4f","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mlnnipvmbl92w7mmr1pa"]},"dictionaries":{"team":["MIA"],"position":["WR","RB","TE","QB"],"status":["CUT","ACT","RES","INA"]}};
\ No newline at end of file
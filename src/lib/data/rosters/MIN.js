@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,2,3,0,0,3,2,1,1,2,2],"jersey_number":[86.0,33.0,11.0,4.0,14.0,87.0,84.0,13.0,18.0,27.0,32.0,83.0,3.0],"status":[0,0,0,0,0,0,0,1,0,0,0,0,0],"player_name":["Johnny Mundt","Aaron Jones","Trent Sherfield","Brandon Powell","Sam Darnold","T.J. Hockenson","Josh Oliver","Daniel Jones","Justin Jefferson","Cam Akers","Ty Chandler","Jalen Nailor","Jordan Addison"],"first_name":["Johnny","Aaron","Trent","Brandon","Sam","Thomas","Josh","Daniel","Justin","Cam","Ty","Jalen","Jordan"],"last_name":["Mundt","Jones","Sherfield","Powell","Darnold","Hockenson","Oliver","Jones","Jefferson","Akers","Chandler","Nailor","Addison"],"player_id":["00-0033246","00-0033293","00-0034487","00-0034646","00-0034869","00-0035229","00-0035249","00-0035710","00-0036322","00-0036414","00-0037276","00-0037291","00-0038994"],"height":[76.0,69.0,73.0,68.0,75.0,77.0,77.0,77.0,73.0,70.0,71.0,72.0,71.0],"weight":[232,208,219,189,225,248,250,220,192,212,210,191,175],"years_exp":[7,7,6,6,6,5,5,5,4,4,2,2,1],"age":[29.0,29.0,28.0,28.0,27.0,27.0,27.0,27.0,25.0,25.0,26.0,25.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ievumbznrtys9b2esphz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bktkfvgfwujkdbzkcfim","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/esdvav44ezzmwbwe1rju","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kpggzzkazhxoq4e77xho","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/agjgfwk9jk9ufoac2vpd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/n9zhffstwzae8i5di6tk","https://static.www.nfl.com/image/private/f_auto,q_auto/league/pwd3muzyjclgjlwwtdah","https://static.www.nfl.com/image/private/f_auto,q_auto/league/zrhniboizqpxtdyz6gez","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vrftbpzwk6qmv0zjcysg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dutj0wamu7giwghnmr4m","https://static.www.nfl.com/image/private/f_auto,q_auto/league/map979dvuonzb8a6g13b","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fe9b3l4fz6n02gbr5zbt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tmyckmignrvy8truccwm"]},"dictionaries":{"team":["MIN"],"position":["TE","RB","WR","QB"],"status":["ACT","INA"]}};
\ No newline at end of file
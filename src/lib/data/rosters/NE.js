@@ -0,0 +1 @@
+export const rosters = {"length":12,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,2,3,3,2,2,0,1,2,2],"jersey_number":[81.0,85.0,7.0,84.0,4.0,38.0,9.0,3.0,88.0,10.0,6.0,1.0],"status":[0,1,0,0,0,0,0,0,0,0,0,2],"player_name":["Austin Hooper","Hunter Henry","Jacoby Brissett","Kendrick Bourne","Antonio Gibson","Rhamondre Stevenson","Kayshon Boutte","Demario Douglas","Jaheim Bell","Drake Maye","Javon Baker","Ja'Lynn Polk"],"first_name":["Austin","Hunter","Jacoby","Kendrick","Antonio","Rhamondre","Kayshon","Demario","Jaheim","Drake","Javon","Ja'Lynn"],"last_name":["Hooper","Henry","Brissett","Bourne","Gibson","Stevenson","Boutte","Douglas","Bell","Maye","Baker","Polk"],"player_id":["00-0032392","00-0033090","00-0033119","00-0033307","00-0036328","00-0036875","00-0038608","00-0038621","00-0039420","00-0039851","00-0039853","00-0039907"],"height":[76.0,77.0,76.0,73.0,72.0,72.0,71.0,68.0,74.0,76.0,73.0,73.0],"weight":[254,250,235,203,221,246,205,170,239,225,208,204],"years_exp":[8,8,8,7,4,3,1,1,0,0,0,0],"age":[29.0,29.0,31.0,29.0,26.0,26.0,22.0,23.0,23.0,22.0,22.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hj0ybtjspne3t1cso961","https://static.www.nfl.com/image/private/f_auto,q_auto/league/sdjob9akppefyo7py5tj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dps7iuuc2zwl68yppqux","https://static.www.nfl.com/image/private/f_auto,q_auto/league/vrovcaqql9p6xsycko83","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hsjhpzgfdilf9cyrpeup","https://static.www.nfl.com/image/private/f_auto,q_auto/league/ro2fqabc4qndtnxykvm7","https://static.www.nfl.com/image/private/f_auto,q_auto/league/nz6t7jhx6erszovbv1bd","https://static.www.nfl.com/image/private/f_auto,q_auto/league/svnh61ottqtfmcqvnbj3","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/psbwq5bse6vv9bpzqssr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/iy96wbyjth5ehizc0xq5","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/k9junpcjhuulnixdqnqn","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jladubt1cwxq46uslmu9"]},"dictionaries":{"team":["NE"],"position":["TE","QB","WR","RB"],"status":["ACT","INA","RES"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":18,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,2,3,3,3,1,1,3,3,2,2,0,0,3,1,3],"jersey_number":[4.0,7.0,41.0,21.0,10.0,11.0,17.0,87.0,83.0,12.0,22.0,25.0,33.0,3.0,18.0,16.0,85.0,84.0],"status":[0,1,0,2,2,2,2,2,2,1,1,0,2,2,2,1,2,0],"player_name":["Derek Carr","Taysom Hill","Alvin Kamara","Jamaal Williams","Marquez Valdes-Scantling","Cedrick Wilson Jr.","Dante Pettis","Foster Moreau","Juwan Johnson","Chris Olave","Rashid Shaheed","Kendre Miller","Jordan Mims","Jake Haener","Spencer Rattler","Bub Means","Dallin Holker","Mason Tipton"],"first_name":["Derek","Taysom","Alvin","Jamaal","Marquez","Cedrick","Dante","Foster","Juwan","Chris","Rashid","Kendre","Jordan","Jake","Spencer","Jerrod","Dallin","Mason"],"last_name":["Carr","Hill","Kamara","Williams","Valdes-Scantling","Wilson","Pettis","Moreau","Johnson","Olave","Shaheed","Miller","Mims","Haener","Rattler","Means","Holker","Tipton"],"player_id":["00-0031280","00-0033357","00-0033906","00-0033948","00-0034272","00-0034418","00-0034860","00-0034981","00-0036040","00-0037239","00-0037545","00-0038551","00-0038678","00-0038998","00-0039376","00-0039386","00-0039613","00-0039623"],"height":[75.0,74.0,70.0,72.0,76.0,74.0,73.0,76.0,76.0,72.0,72.0,72.0,72.0,73.0,72.0,74.0,75.0,71.0],"weight":[210,221,215,213,207,188,195,250,231,185,180,220,205,195,218,215,235,187],"years_exp":[10,7,7,7,6,6,6,5,4,2,2,1,1,1,0,0,0,0],"age":[33.0,34.0,29.0,29.0,29.0,28.0,28.0,27.0,27.0,24.0,26.0,22.0,25.0,25.0,23.0,23.0,24.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qsz1pyrlu6bmvby6maaf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/q8itjlocg5do60qat4l3","https://static.www.nfl.com/image/private/f_auto,q_auto/league/tl9enad6kiwv6cukf4vt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yxrxpgcwq5qwp88vqnp3","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vn2bg6lhyl15xrymtd5g","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vuolr6nwwbrwwc5ldt7f","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bkn6mnwboawe7iucprxe","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hfcik9okcbwsbhgoaljy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pdsl9w3agc9uvjqpq1jy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/riiwbow7zphqmomiazph","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mnaref4vwyau8mbsp0ri","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wyj0lpna5gbhvyfiqnis","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/nvamfcrdqvkwtnpgmzdh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wugesxgiiuzs6fdymp57","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xhllpfkd4hrpbwczbca6","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zo2ojijv5b6bhy2fcjyk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sps8av7spro1015lpwn1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ldzn20eu15intdsolw9i"]},"dictionaries":{"team":["NO"],"position":["QB","TE","RB","WR"],"status":["INA","RES","ACT"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,1,3,0,0,3,2,1,3,3,2,0],"jersey_number":[85.0,12.0,26.0,86.0,2.0,18.0,89.0,82.0,17.0,20.0,15.0,13.0,1.0,29.0,84.0],"status":[0,1,0,0,0,2,0,0,0,0,0,0,0,0,3],"player_name":["Chris Manhertz","Tim Boyle","Devin Singletary","Darius Slayton","Drew Lock","Isaiah Hodgins","Greg Dulcich","Daniel Bellinger","Wan'Dale Robinson","Eric Gray","Tommy DeVito","Jalin Hyatt","Malik Nabers","Tyrone Tracy Jr.","Theo Johnson"],"first_name":["Chris","Timothy","Devin","Darius","Drew","Isaiah","Greg","Daniel","Charles","Eric","Tommy","Jalin","Malik","Tyrone","Theodore"],"last_name":["Manhertz","Boyle","Singletary","Slayton","Lock","Hodgins","Dulcich","Bellinger","Robinson","Gray","DeVito","Hyatt","Nabers","Tracy","Johnson"],"player_id":["00-0031484","00-0034177","00-0035250","00-0035535","00-0035704","00-0036165","00-0037252","00-0038115","00-0038117","00-0038396","00-0038476","00-0038938","00-0039337","00-0039384","00-0039847"],"height":[78.0,76.0,67.0,73.0,76.0,75.0,76.0,78.0,68.0,70.0,74.0,72.0,72.0,71.0,78.0],"weight":[255,233,203,190,228,209,250,255,185,210,210,185,195,210,260],"years_exp":[9,6,5,5,5,4,2,2,2,1,1,1,0,0,0],"age":[32.0,29.0,26.0,27.0,27.0,25.0,24.0,23.0,23.0,24.0,26.0,22.0,21.0,24.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/edzj1uojuh7octginx1e","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zmfyonfo6ohn5bxqwaxg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wz8mp8xb5bdspcxosreh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zhm6evj813ucss03ndlx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tlkgzjnuugarxjeoj9vk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gc1gaxelm41o1luldpek","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tt3eyuomt5onokrqstsl","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/f9xmqszyicfahxrcqevp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/z94hnehk9vgmvtad6sgi","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ijjxwxv1ccyowzhpuw2k","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ntolppjso4da6spe6okt","https://static.www.nfl.com/image/private/f_auto,q_auto/league/ibftqfglvcqaipfdnr4f","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/w3edoyyuomqlovvp9ixc","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hc2uk0xrbc6qizrerwxd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/gljwzcxubvoqjxwnakze"]},"dictionaries":{"team":["NYG"],"position":["TE","QB","RB","WR"],"status":["ACT","INA","DEV","RES"]}};
\ No newline at end of file
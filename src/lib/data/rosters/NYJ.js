@@ -0,0 +1 @@
+export const rosters = {"length":12,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,1,2,1,2,3,1,3,3,1],"jersey_number":[8.0,17.0,83.0,10.0,88.0,5.0,89.0,20.0,82.0,0.0,32.0,14.0],"status":[0,0,0,0,0,0,0,0,0,0,0,0],"player_name":["Aaron Rodgers","Davante Adams","Tyler Conklin","Allen Lazard","Kenny Yeboah","Garrett Wilson","Jeremy Ruckert","Breece Hall","Xavier Gipson","Braelon Allen","Isaiah Davis","Malachi Corley"],"first_name":["Aaron","Davante","Tyler","Allen","Kenny","Garrett","Jeremy","Breece","Xavier","Braelon","Isaiah","Malachi"],"last_name":["Rodgers","Adams","Conklin","Lazard","Yeboah","Wilson","Ruckert","Hall","Gipson","Allen","Davis","Corley"],"player_id":["00-0023459","00-0031381","00-0034270","00-0034521","00-0036510","00-0037740","00-0037805","00-0038120","00-0038496","00-0039794","00-0039798","00-0039920"],"height":[74.0,73.0,75.0,77.0,76.0,72.0,77.0,71.0,69.0,73.0,73.0,71.0],"weight":[225,215,254,227,240,192,250,220,180,235,220,210],"years_exp":[19,10,6,6,3,2,2,2,1,0,0,0],"age":[40.0,31.0,29.0,28.0,25.0,24.0,24.0,23.0,23.0,20.0,22.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jdcb4nomlc4rd6k5l6to","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jweoujpjv9u2a8k7wnos","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/chajhumpfogd8effewe6","https://static.www.nfl.com/image/private/f_auto,q_auto/league/blrzk3bfnpneuyhsqiqg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zjdw9hyw3jc7pmjf5nbv","https://static.www.nfl.com/image/private/f_auto,q_auto/league/llgosx4tokddwnyrgvbx","https://static.www.nfl.com/image/private/f_auto,q_auto/league/w6bf97vbqitoyo5o7xaa","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ekmqygsmfkwwwdmuox4r","https://static.www.nfl.com/image/private/f_auto,q_auto/league/tqo7wkjetkgupevxfvnv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/p0fylkec7poarrjosefz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yx5kxu7fsb1oe4jlqvyh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wukmdigs85jyubxw0iur"]},"dictionaries":{"team":["NYJ"],"position":["QB","WR","TE","RB"],"status":["ACT"]}};
\ No newline at end of file
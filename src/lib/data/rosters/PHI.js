@@ -0,0 +1 @@
+export const rosters = {"length":17,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,1,2,2,3,2,1,0,2,2,3,3,0,2,1,2],"jersey_number":[47.0,88.0,26.0,80.0,11.0,1.0,6.0,14.0,81.0,18.0,83.0,7.0,16.0,84.0,89.0,28.0,82.0],"status":[0,1,1,1,1,1,1,1,1,0,1,1,2,1,1,1,2],"player_name":["C.J. Uzomah","Dallas Goedert","Saquon Barkley","Parris Campbell","A.J. Brown","Jalen Hurts","DeVonta Smith","Kenneth Gainwell","Grant Calcaterra","Britain Covey","Jahan Dotson","Kenny Pickett","Tanner McKee","E.J. Jenkins","Johnny Wilson","Will Shipley","Ainias Smith"],"first_name":["Christopher","Dallas","Saquon","Parris","Arthur","Jalen","DeVonta","Kenneth","Grant","Britain","Jahan","Kenny","Tanner","Emanuel","Johnny","Will","Ainias"],"last_name":["Uzomah","Goedert","Barkley","Campbell","Brown","Hurts","Smith","Gainwell","Calcaterra","Covey","Dotson","Pickett","McKee","Jenkins","Wilson","Shipley","Smith"],"player_id":["00-0032134","00-0034351","00-0034844","00-0035639","00-0035676","00-0036389","00-0036912","00-0036919","00-0037086","00-0037132","00-0037741","00-0038102","00-0038400","00-0038498","00-0039236","00-0039746","00-0039747"],"height":[78.0,77.0,72.0,73.0,73.0,73.0,72.0,69.0,76.0,68.0,71.0,75.0,78.0,78.0,78.0,71.0,69.0],"weight":[260,256,233,205,226,218,165,191,221,170,182,220,230,243,237,210,190],"years_exp":[9,6,6,5,5,4,3,3,2,2,2,2,1,1,0,0,0],"age":[31.0,29.0,27.0,27.0,27.0,26.0,25.0,25.0,25.0,27.0,24.0,26.0,24.0,25.0,23.0,22.0,23.0],"headshot_url":["https://static.www.nfl.com/image/private/f_auto,q_auto/league/hnkflpl5pzbfbdvtcv1c","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wfj54vhw1zxwwb3vdi61","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ugiuanl8bf6uoya5mgid","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zesqmghc8zchkvhsv9jb","https://static.www.nfl.com/image/private/f_auto,q_auto/league/a014sgzctarbvhwb35lw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/k2p5yb4qmqwoo3qcapgt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/bmdflwy52nsk7zpnfhwb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/prer0j0tkzsdva1yrd0i","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vxl0kathuej280k01d2r","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zxyoxfakwak4h9eiv5mu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/myxhp9oqtcv1peactbhv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lbyu04eubfsgezqftovz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/q0uc1cubsh0rwc4ezuul","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/utbs1f78kfxb51b6asit","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/cj13ngp4tjmi9621trrk","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/irh5l9dxqamsfnfjwuc7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/curtawk9bzyg88w5jrg8"]},"dictionaries":{"team":["PHI"],"position":["TE","RB","WR","QB"],"status":["RES","ACT","INA"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,3,3,3,1,2,0,1,3,2,3,2],"jersey_number":[3.0,84.0,81.0,18.0,13.0,11.0,15.0,22.0,88.0,2.0,30.0,14.0,83.0,19.0,80.0],"status":[0,0,0,0,1,0,0,0,0,0,0,0,0,0,0],"player_name":["Russell Wilson","Cordarrelle Patterson","MyCole Pruitt","Mike Williams","Scott Miller","Van Jefferson","Ben Skowronek","Najee Harris","Pat Freiermuth","Justin Fields","Jaylen Warren","George Pickens","Connor Heyward","Calvin Austin III","Darnell Washington"],"first_name":["Russell","Cordarrelle","MyCole","Michael","Scott","Vanchii","Ben","Najee","Pat","Justin","Jaylen","George","Connor","Calvin","Darnell"],"last_name":["Wilson","Patterson","Pruitt","Williams","Miller","Jefferson","Skowronek","Harris","Freiermuth","Fields","Warren","Pickens","Heyward","Austin","Washington"],"player_id":["00-0029263","00-0030578","00-0031585","00-0033536","00-0035298","00-0036415","00-0036862","00-0036893","00-0036894","00-0036945","00-0037228","00-0037247","00-0037304","00-0037837","00-0038558"],"height":[71.0,74.0,74.0,76.0,69.0,73.0,75.0,73.0,77.0,75.0,68.0,75.0,72.0,69.0,79.0],"weight":[215,238,243,218,174,197,220,230,258,223,225,200,230,162,265],"years_exp":[12,11,9,7,5,4,3,3,3,3,2,2,2,2,1],"age":[35.0,33.0,32.0,29.0,27.0,28.0,27.0,26.0,25.0,25.0,25.0,23.0,25.0,25.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/u36rhg0md8ey3b4khbre","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jktdrwmujfuqp94csnav","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/jazo8egu5luwyxxcpjh8","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vwu8nudrnk3l7samz8mf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/v5fxl6tig8qarofg0lo1","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/v2vkt9htky3xawu8yskx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/piiqiz29g3jukdwkihw3","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pdyv1dfyb1w0tmvnkp3v","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sozfjyy3bmntjv8tmqah","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vqcvybvs1vlqhkjvujbg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/aaw4yacm6azisxqy273i","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/klxzcb6p7ekngcognpiy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/b9bnasge2v2dtctdtqnf","https://static.www.nfl.com/image/private/f_auto,q_auto/league/qlt6ztqcbu0uzad6aavt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/i6bxioxqzrc9hepszyjf"]},"dictionaries":{"team":["PIT"],"position":["QB","RB","TE","WR"],"status":["ACT","INA"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":11,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,2,1,3,1,3,1,3,2],"jersey_number":[7.0,16.0,86.0,87.0,82.0,9.0,11.0,25.0,19.0,26.0,88.0],"status":[0,0,0,0,1,2,0,0,0,0,0],"player_name":["Geno Smith","Tyler Lockett","Pharaoh Brown","Noah Fant","Cody White","Kenneth Walker III","Jaxon Smith-Njigba","Kenny McIntosh","Jake Bobo","Zach Charbonnet","AJ Barner"],"first_name":["Eugene","Tyler","Pharaoh","Noah","Cody","Kenneth","Jaxon","Kenny","Jake","Zach","A.J."],"last_name":["Smith","Lockett","Brown","Fant","White","Walker","Smith-Njigba","McIntosh","Bobo","Charbonnet","Barner"],"player_id":["00-0030565","00-0032211","00-0033439","00-0035644","00-0035891","00-0038134","00-0038543","00-0038636","00-0038752","00-0039165","00-0039793"],"height":[75.0,70.0,77.0,76.0,75.0,69.0,72.0,72.0,76.0,73.0,78.0],"weight":[221,182,258,249,210,210,198,210,215,220,251],"years_exp":[11,9,7,5,4,2,1,1,1,1,0],"age":[33.0,31.0,30.0,26.0,25.0,23.0,22.0,24.0,26.0,23.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/izkm5yyxybb5uy5dkcgf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/yz9p4pfwr0iyakhnwj4z","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ab0kbxsmasznlccuezcq","https://static.www.nfl.com/image/private/f_auto,q_auto/league/w1gqasldrg3jumzdqjvy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/japxwwyjwag4j7kxy9pm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ielqdthtspzi0ufvs4tw","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/lfroslgx4bo5p641flvg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tjntwl7kvcais3a8xw7y","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vf5wazbhc3u7x7vjhojq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/eaaj5vbfmk08wvwelyqt","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/msnzbeyjoemcas9dm8vt"]},"dictionaries":{"team":["SEA"],"position":["QB","WR","TE","RB"],"status":["ACT","INA","RES"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":15,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,3,3,1,2,0,0,2,1,0,2,0,0],"jersey_number":[18.0,17.0,23.0,85.0,82.0,5.0,32.0,15.0,11.0,24.0,13.0,10.0,31.0,19.0,14.0],"status":[0,0,1,0,0,0,0,0,1,1,2,3,0,0,0],"player_name":["Chris Conley","Brandon Allen","Christian McCaffrey","George Kittle","Eric Saubert","Joshua Dobbs","Patrick Taylor","Jauan Jennings","Brandon Aiyuk","Jordan Mason","Brock Purdy","Ronnie Bell","Isaac Guerendo","Jacob Cowing","Ricky Pearsall"],"first_name":["Christian","Brandon","Christian","George","Eric","Robert","Patrick","Bennie","Brandon","Jordan","Brock","Ronnie","Isaac","Jacob","Ricky"],"last_name":["Conley","Allen","McCaffrey","Kittle","Saubert","Dobbs","Taylor","Jennings","Aiyuk","Mason","Purdy","Bell","Guerendo","Cowing","Pearsall"],"player_id":["00-0032128","00-0032434","00-0033280","00-0033288","00-0033576","00-0033949","00-0035973","00-0036259","00-0036261","00-0037525","00-0037834","00-0038647","00-0039363","00-0039365","00-0039916"],"height":[75.0,74.0,71.0,76.0,77.0,75.0,73.0,75.0,72.0,71.0,73.0,72.0,72.0,69.0,73.0],"weight":[205,209,205,250,253,216,223,214,206,218,212,190,225,170,190],"years_exp":[9,8,7,7,7,7,4,4,4,2,2,1,0,0,0],"age":[31.0,31.0,28.0,30.0,30.0,29.0,26.0,27.0,26.0,25.0,24.0,24.0,24.0,23.0,23.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mr4h7vx02uwpr7xlfk6y","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xn9eheiy6kty4movmlak","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/umiv5sn2xxrjdjwjtkqm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ivkrikewqqdllzvano8h","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pxcadtlbynaz2qbffpei","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vjl8nqbcodtgzppwyemb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/nd1utxii5exwfoujq5a4","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/fqyzagb57zrtegmw69eb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qnfyhqxbppevv28hd3rx","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ub1ub6sxuov1f1kux1v9","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/myvg8siij2bn9ecx7btm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/agn76jfaaawk5usur8oh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vi0oa4oajc6ecgzr8l08","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/q8luttpmauwatynr9iti","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/akwepvt6qxwbgankljmv"]},"dictionaries":{"team":["SF"],"position":["WR","QB","RB","TE"],"status":["ACT","RES","INA","DEV"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":14,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,0,0,1,2,3,3,0,0,2,3,0,2,0],"jersey_number":[13.0,17.0,14.0,6.0,1.0,41.0,88.0,18.0,81.0,44.0,87.0,10.0,7.0,15.0],"status":[0,0,1,0,0,0,0,0,0,0,0,0,0,0],"player_name":["Mike Evans","Sterling Shepard","Chris Godwin","Baker Mayfield","Rachaad White","Ko Kieft","Cade Otton","Rakim Jarrett","Ryan Miller","Sean Tucker","Payne Durham","Trey Palmer","Bucky Irving","Jalen McMillan"],"first_name":["Mike","Sterling","Rod","Baker","Rachaad","Ko","Cade","Rakim","Ryan","Sean","Payne","Trey","Mar'Keise","Jalen"],"last_name":["Evans","Shepard","Godwin","Mayfield","White","Kieft","Otton","Jarrett","Miller","Tucker","Durham","Palmer","Irving","McMillan"],"player_id":["00-0031408","00-0032385","00-0033921","00-0034855","00-0037256","00-0037311","00-0038129","00-0038821","00-0038824","00-0038951","00-0039050","00-0039052","00-0039361","00-0039855"],"height":[77.0,70.0,73.0,73.0,72.0,77.0,77.0,72.0,74.0,70.0,77.0,73.0,70.0,73.0],"weight":[231,201,209,215,210,265,250,190,209,210,255,190,195,186],"years_exp":[10,8,7,6,2,2,2,1,1,1,1,1,0,0],"age":[31.0,31.0,28.0,29.0,25.0,26.0,25.0,23.0,24.0,22.0,24.0,23.0,22.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vfsaie1uiokfczwv9p4d","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dphqvpkeselgrselrvma","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/al7b3dzqhysgve7l5lke","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xrbgtbyy8a7l0ux13hjy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/przphhlw0zga7b45qlyb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/e4waf9pysxdyyhtpmgwp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mljam77kst1wlqd5y91v","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mnbgtrdhyuofclpct6tl","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/maywscb6waflzzuaesew","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pgc1uq4p5euuc9lkaphf","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vrdqb2si9rpshhy51liq","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zv0wdsdctgf2zw2ctumy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wjaqkrtdhwf16wldi83h","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zdxkyl8gy4dqiq6evfzp"]},"dictionaries":{"team":["TB"],"position":["WR","QB","RB","TE"],"status":["ACT","RES"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":13,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,1,3,1,1,3,1,0,3,2,1],"jersey_number":[84.0,83.0,11.0,0.0,20.0,12.0,15.0,36.0,16.0,81.0,2.0,8.0,80.0],"status":[0,1,0,0,0,0,0,0,2,0,1,0,0],"player_name":["Nick Vannett","Tyler Boyd","Mason Rudolph","Calvin Ridley","Tony Pollard","Mason Kinsey","Nick Westbrook-Ikhine","Julius Chestnut","Treylon Burks","Josh Whyle","Tyjae Spears","Will Levis","Bryce Oliver"],"first_name":["Nicholas","Tyler","Mason","Calvin","Tony","Mason","Nicholas","Julius","Treylon","Josh","Tyjae","Will","Bryce"],"last_name":["Vannett","Boyd","Rudolph","Ridley","Pollard","Kinsey","Westbrook-Ikhine","Chestnut","Burks","Whyle","Spears","Levis","Oliver"],"player_id":["00-0032394","00-0033009","00-0034771","00-0034837","00-0035261","00-0036176","00-0036182","00-0037594","00-0037742","00-0038589","00-0039032","00-0039152","00-0039650"],"height":[78.0,74.0,77.0,73.0,72.0,71.0,74.0,71.0,74.0,79.0,71.0,76.0,73.0],"weight":[261,203,235,190,209,195,215,215,225,250,195,232,215],"years_exp":[8,8,6,6,5,4,4,2,2,1,1,1,0],"age":[31.0,29.0,29.0,29.0,27.0,26.0,27.0,23.0,24.0,24.0,23.0,25.0,24.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/srrlkx2mydsb8gfco6fp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ttifog0hjxprlhkagugu","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/pn938e0z2fobxmzfxmlh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/tmeij0cfgylmurfybs74","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/koxn5qhfnsgvnqfqfmpp","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qeddbi4d2hfqtyhsiogr","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rt9ic9wzwl2pevlxt1nd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/dmy7xkb6lv63qou6qag7","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xinnrxloao8wvyps7e3m","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/ccstvnbjzprcpb2j9xnb","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/qb4us1f96uox7v3poxzj","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/vr01ufscgtoagtuut9o4","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/njv8cbvhuobk2fe6uslj"]},"dictionaries":{"team":["TEN"],"position":["TE","WR","QB","RB"],"status":["ACT","INA","RES"]}};
\ No newline at end of file
@@ -0,0 +1 @@
+export const rosters = {"length":14,"columns":{"season":[2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024,2024],"team":[0,0,0,0,0,0,0,0,0,0,0,0,0,0],"position":[0,1,2,1,3,3,1,1,1,1,0,1,2,0],"jersey_number":[86.0,80.0,18.0,85.0,30.0,26.0,14.0,17.0,13.0,2.0,87.0,12.0,5.0,82.0],"status":[0,0,0,1,0,0,0,0,2,0,0,0,0,0],"player_name":["Zach Ertz","Jamison Crowder","Marcus Mariota","Noah Brown","Austin Ekeler","Jeremy McNichols","Olamide Zaccheaus","Terry McLaurin","K.J. Osborn","Dyami Brown","John Bates","Luke McCaffrey","Jayden Daniels","Ben Sinnott"],"first_name":["Zachary","Jamison","Marcus","Noah","Austin","Jeremy","Olamide","Terry","K.J.","Dyami","John","Luke","Jayden","Ben"],"last_name":["Ertz","Crowder","Mariota","Brown","Ekeler","McNichols","Zaccheaus","McLaurin","Osborn","Brown","Bates","McCaffrey","Daniels","Sinnott"],"player_id":["00-0030061","00-0031941","00-0032268","00-0033591","00-0033699","00-0033955","00-0035208","00-0035659","00-0036345","00-0036626","00-0036628","00-0039355","00-0039910","00-0039912"],"height":[77.0,69.0,76.0,74.0,70.0,69.0,68.0,72.0,72.0,72.0,78.0,74.0,76.0,76.0],"weight":[250,177,222,225,200,205,193,210,200,185,256,195,210,245],"years_exp":[11,9,9,7,7,7,5,5,4,3,3,0,0,0],"age":[33.0,31.0,30.0,28.0,29.0,28.0,27.0,28.0,27.0,24.0,26.0,23.0,23.0,22.0],"headshot_url":["https://static.www.nfl.com/image/upload/f_auto,q_auto/league/xktmmeumuoglbuam75iz","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/rfysbrjrvfdr72cx8who","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/b9ribxqudeehvmjlw0va","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/nv6ix0p8965yiugsuhwh","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sldndpn2zwt4uhkj2zks","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/kegqjj5pv7xidm0xwtpy","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/hcmdnfgnnvcp0qbktpxd","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/wokz1etv1wj1vhbmvxgs","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/sbz79g8kzinzebiwzauv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mibh7ud59ygmzm19ivac","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/edpnkleev10rpzfgjakv","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/iqzscuxu9lxjfhoyxsjg","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/mh9rkwpmq1rgfarg9rpm","https://static.www.nfl.com/image/upload/f_auto,q_auto/league/zwjmu9wyutlpkace9ukf"]},"dictionaries":{"team":["WAS"],"position":["TE","WR","QB","RB"],"status":["ACT","RES","INA"]}};
\ No newline at end of file